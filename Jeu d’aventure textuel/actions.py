@@ -7,7 +7,10 @@ utilisation d'objets, etc.).
 Les actions interagissent avec l'état du joueur, des salles et du jeu.
 """
 
-from ai_quiz import ask_question, get_ai_status
+import copy
+
+from ai_quiz import ask_question, combat_difficulty, get_ai_status
+from forecast import forecast_fight, player_accuracy
 import player
 
 # ======================
@@ -51,33 +54,114 @@ def look(game):
 #     GESTION OBJETS
 # ======================
 
+# Mots désignant « tous les exemplaires » dans prendre / jeter
+ALL_WORDS = ("tout", "tous", "toutes", "all")
+
+
+def _parse_quantity(arg):
+    """
+    Découpe l'argument de prendre / jeter en (quantité, nom).
+
+        "tout"            → (None, None)   tous les objets
+        "tout trousse"    → (None, "trousse")
+        "3 trousse"       → (3, "trousse")
+        "trousse"         → (1, "trousse")
+    """
+    head, _, rest = arg.partition(" ")
+    rest = rest.strip()
+    if head.lower() in ALL_WORDS:
+        return None, rest or None
+    if head.isdigit() and rest:
+        return max(1, int(head)), rest
+    return 1, arg
+
+
+def _too_heavy(game, item):
+    """Message affiché quand un objet dépasse la capacité de transport."""
+    p = game.player
+    return (f"{item.name} est trop lourd ({item.weight} kg) : "
+            f"poids {p.current_weight}/{p.max_weight} kg.")
+
+
+def _counted(name, count):
+    """Nom d'objet suivi de sa quantité si elle dépasse 1."""
+    return f"{name} x{count}" if count > 1 else name
+
+
 def take(game, item_name):
-    """Permet au joueur de ramasser un objet présent dans la salle."""
+    """
+    Permet au joueur de ramasser un ou plusieurs objets présents dans la salle.
+
+    Formes acceptées : "prendre X", "prendre 3 X", "prendre tout X", "prendre tout".
+    La capacité de transport (max_weight) est vérifiée pour chaque exemplaire.
+    """
     if not item_name:
         return "Prendre quoi ?"
 
     room = game.player.current_room
-    item = room.find_item(item_name)
-    if not item:
-        return f"Aucun objet nommé '{item_name}' ici."
-
-    room.remove_item(item)
-    game.player.add_item(item)
-    return f"Vous prenez {item.name}."
+    count, name = _parse_quantity(item_name)
+
+    if name is None:
+        candidates = list(room.items)
+        if not candidates:
+            return "Il n'y a rien à prendre ici."
+    else:
+        candidates = room.find_items(name)
+        if not candidates:
+            return f"Aucun objet nommé '{name}' ici."
+        if count is not None:
+            candidates = candidates[:count]
+
+    taken = {}      # nom → [objet, quantité], dans l'ordre de ramassage
+    refused = {}    # nom → objet trop lourd
+    for item in candidates:
+        if not game.player.can_carry(item):
+            refused.setdefault(item.name, item)
+            continue
+        room.remove_item(item)
+        game.player.add_item(item)
+        taken.setdefault(item.name, [item, 0])[1] += 1
+
+    lines = []
+    if taken:
+        names = ", ".join(_counted(n, c) for n, (_, c) in taken.items())
+        lines.append(f"Vous prenez {names}.")
+    for item in refused.values():
+        lines.append(_too_heavy(game, item))
+    return "\n".join(lines)
 
 
 def drop(game, item_name):
-    """Permet au joueur de déposer un objet dans la salle."""
+    """
+    Permet au joueur de déposer un ou plusieurs objets dans la salle.
+
+    Formes acceptées : "jeter X", "jeter 3 X", "jeter tout X", "jeter tout".
+    """
     if not item_name:
         return "Déposer quoi ?"
 
-    item = game.player.find_item(item_name)
-    if not item:
-        return f"Vous ne possédez pas '{item_name}'."
+    player = game.player
+    count, name = _parse_quantity(item_name)
 
-    game.player.remove_item(item)
-    game.player.current_room.add_item(item)
-    return f"Vous déposez {item.name}."
+    if name is None:
+        stacks = [(s.item, s.count) for s in player.inventory]
+        if not stacks:
+            return "Votre inventaire est vide."
+    else:
+        item = player.find_item(name)
+        if not item:
+            return f"Vous ne possédez pas '{name}'."
+        owned = player.count_item(item.name)
+        stacks = [(item, owned if count is None else min(count, owned))]
+
+    dropped = []
+    for item, n in stacks:
+        n = player.remove_item(item, n)
+        # Chaque exemplaire redevient un objet distinct dans la salle
+        for _ in range(n):
+            player.current_room.add_item(copy.copy(item))
+        dropped.append(_counted(item.name, n))
+    return f"Vous déposez {', '.join(dropped)}."
 
 
 def inventory(game):
@@ -88,8 +172,8 @@ def inventory(game):
     lines.append(f"Poids : {game.player.current_weight}")
     lines.append(f"Poids maximum : {game.player.max_weight}")
     lines.append("Objets :")
-    for it in game.player.inventory:
-        lines.append(f"- {it.name} ({it.weight} kg)")
+    for stack in game.player.inventory:
+        lines.append(f"- {_counted(stack.item.name, stack.count)} ({stack.weight} kg)")
     return "\n".join(lines)
 
 
@@ -99,8 +183,8 @@ def check(game, item_name):
         if not game.player.inventory:
             return "Votre inventaire est vide."
         lines = ["Inventaire :"]
-        for it in game.player.inventory:
-            lines.append(f"- {it.name}")
+        for stack in game.player.inventory:
+            lines.append(f"- {_counted(stack.item.name, stack.count)}")
         return "\n".join(lines)
 
     item = game.player.find_item(item_name)
@@ -109,8 +193,8 @@ def check(game, item_name):
         return f"{item.name} : {item.description}"
 
     lines = [f"'{item_name}' n'est pas dans votre inventaire.", "Inventaire :"]
-    for it in game.player.inventory:
-        lines.append(f"- {it.name}")
+    for stack in game.player.inventory:
+        lines.append(f"- {_counted(stack.item.name, stack.count)}")
     return "\n".join(lines)
 
 
@@ -119,17 +203,43 @@ def analyze(game, name):
     if not name:
         return "Analyser qui ?"
 
-    room = game.player.current_room
-    target = name.lower()
+    # Recherche parmi les PNJ (index par nom normalisé)
+    npc = game.player.current_room.find_character(name)
+    if npc:
+        return f"{npc.name} : {npc.description}"
 
-    # Recherche parmi les PNJ
-    for npc in room.characters:
-        if npc.name.lower() == target:
-            return f"{npc.name} : {npc.description}"
+    return f"Il n'y a personne nommé '{name}' ici."
 
 
-    return f"Il n'y a personne nommé '{name}' ici."
+def predict(game, enemy_name):
+    """
+    Prévoit l'issue d'un combat contre un ennemi de la salle (calcul exact,
+    voir forecast.py), avec la précision au quiz observée chez le joueur.
+    """
+    if not enemy_name:
+        if game.in_combat and game.current_enemy is not None:
+            enemy_name = game.current_enemy.name
+        else:
+            return "Prévoir le combat contre qui ?"
 
+    enemy = game.player.current_room.find_enemy(enemy_name)
+    if not enemy:
+        return f"Aucun ennemi nommé '{enemy_name}'."
+
+    accuracy = player_accuracy(game.player)
+    f = forecast_fight(game.player, enemy, accuracy)
+    if f.expected_turns_to_win is None:
+        turns = "aucune chance de l'abattre"
+    elif f.max_turns is None:
+        turns = f"~{f.expected_turns_to_win:.1f} attaques pour l'abattre"
+    else:
+        turns = (f"~{f.expected_turns_to_win:.1f} attaques en cas de victoire "
+                 f"(vous tombez après {f.max_turns} attaques)")
+    return (
+        f"🔮 Prévision contre {enemy.name} (précision IA {accuracy:.0%}) :\n"
+        f"Victoire {f.win_probability:.1%} | {turns} | "
+        f"PV perdus ~{f.expected_damage:.0f} (PV restants ~{f.expected_hp_left:.0f})"
+    )
 
 
 def use(game, item_name):
@@ -174,12 +284,9 @@ def talk(game, name):
     if not name:
         return "Parler à qui ?"
 
-    room = game.player.current_room
-    target = name.lower()
-
-    for npc in room.characters:
-        if npc.name.lower() == target:
-            return npc.talk(game.player, game)
+    npc = game.player.current_room.find_character(name)
+    if npc:
+        return npc.talk(game.player, game)
 
     return f"Il n'y a personne nommé '{name}' ici."
 
@@ -189,7 +296,12 @@ def talk(game, name):
 # ======================
 
 def attack(game, enemy_name):
-    """Lance un combat contre un ennemi présent dans la salle."""
+    """
+    Lance un combat contre un ennemi présent dans la salle.
+
+    Générateur de dialogue : la question IA attend la réponse du joueur
+    (voir dialogue.py). Retourne le compte rendu du combat.
+    """
     if not enemy_name:
         return "Attaquer qui ?"
 
@@ -200,11 +312,16 @@ def attack(game, enemy_name):
     if not enemy.is_alive():
         return f"{enemy.name} est déjà vaincu."
 
+    enemy = room.own_enemy(enemy)
     game.in_combat = True
     game.current_enemy = enemy
 
-    # Le multiplicateur dépend d'une question IA (système de quiz)
-    multiplier = ask_question(game.player)
+    # Le multiplicateur dépend d'une question IA (système de quiz),
+    # d'autant plus difficile que l'ennemi est redoutable
+    multiplier = yield from ask_question(
+        game.player, game.io, combat_difficulty(enemy), game.quiz_policy,
+        game.rng, game.policy_rng,
+    )
 
     base = max(1, game.player.atk - enemy.defense)
     dmg = max(1, int(round(base * multiplier)))
@@ -269,7 +386,8 @@ def cheat(game, enemy_name):
     if not enemy.is_alive():
         return f"{enemy.name} est déjà vaincu."
 
-    enemy.hp = 0
+    enemy = room.own_enemy(enemy)
+    enemy.kill()
     logs = [f"Vous utilisez le cheat pour tuer instantanément {enemy.name}."]
     logs.append(f"{enemy.name} est vaincu.")
 
@@ -327,9 +445,17 @@ def status(game):
     return game.player.get_status_string()
 
 
-def history(game):
-    """Retourne l'historique des actions importantes effectuées par le joueur."""
-    return game.player.get_history_string()
+def history(game, page=None):
+    """
+    Retourne une page de l'historique des actions importantes du joueur.
+
+    "historique" affiche la page la plus récente, "historique 2" la deuxième.
+    """
+    if page is None:
+        return game.player.get_history_string()
+    if not page.strip().isdigit():
+        return "Indiquez un numéro de page (ex : historique 2)."
+    return game.player.get_history_string(int(page))
 
 
 def ai_status(game):
@@ -1,100 +1,254 @@
-"""
-ai_quiz.py — Système de mini-quiz IA utilisé en combat.
-
-Ce module gère un ensemble de questions de culture générale et propose
-une mécanique de "liaison cognitive" : le joueur doit répondre à une
-question, ce qui modifie les dégâts infligés lors d'une attaque.
-
-- Bonne réponse → dégâts * 1.5
-- Mauvaise réponse → dégâts * 0.5
-
-Le module enregistre également les statistiques globales des réponses
-du joueur, utiles pour afficher son niveau de synchronisation avec l'IA.
-"""
-
-import random
-
-# Statistiques globales pour suivre les performances de l'utilisateur
-STATS = {
-    "correct": 0,
-    "wrong": 0,
-}
-
-# Banque de questions utilisées par le système IA
-QUESTIONS = [
-    ("Quel est le nom du plus grand volcan du système solaire ?",
-     "Olympus Mons"),
-    ("Quel astronaute a été le premier homme à marcher sur la Lune ?",
-     "Neil Armstrong"),
-    ("Qui est l’auteur du roman de science-fiction « Dune » ?",
-     "Frank Herbert"),
-    ("Comment s’appelle notre galaxie ?",
-     "Voie lactée"),
-]
-
-
-def ask_question(player):
-    """
-    Pose une question IA au joueur et retourne un multiplicateur de dégâts.
-
-    Retourne :
-        1.5 → si la réponse est correcte (coup critique)
-        0.5 → si la réponse est incorrecte
-
-    Paramètres :
-        player : objet Player, utilisé pour mettre à jour ses statistiques
-                 de bonnes/mauvaises réponses.
-
-    Effets :
-        - Affiche une question dans le terminal
-        - Attend une réponse utilisateur
-        - Met à jour STATS et les attributs IA du joueur
-    """
-    q, ans = random.choice(QUESTIONS)
-    print()
-    print("🤖 Le système du Vigilant initialise le lien cognitif IA...")
-    print()
-    print(f"❓ [IA Active] Question : {q}")
-
-    user = input("> ").strip().lower()
-
-    # Bonne réponse → bonus de dégâts
-    if user == ans.lower():
-        print("✅ Liaison cognitive parfaite. Coup critique 💥 (+50% dégâts)")
-        STATS["correct"] += 1
-        if player:
-            player.ia_correct += 1
-        return 1.5
-
-    # Mauvaise réponse → malus de dégâts
-    else:
-        print(f"❌ Réponse inexacte. L'IA signale : {ans}. (-50% dégâts)")
-        STATS["wrong"] += 1
-        if player:
-            player.ia_wrong += 1
-        return 0.5
-
-
-def get_ai_status(player):
-    """
-    Retourne un résumé clair des performances IA du joueur.
-
-    Paramètres :
-        player : objet Player (non indispensable ici mais conservé pour cohérence)
-
-    Retour :
-        - Chaîne décrivant le nombre de bonnes/mauvaises réponses
-        - Pourcentage de réussite global
-    """
-    total = STATS["correct"] + STATS["wrong"]
-
-    if total == 0:
-        return "L’IA n’a encore posé aucune question."
-
-    taux = int((STATS["correct"] / total) * 100)
-
-    return (
-        f"IA de combat — bonnes réponses : {STATS['correct']}, "
-        f"mauvaises : {STATS['wrong']}, "
-        f"pourcentage de réussite {taux}%"
-    )
+"""
+ai_quiz.py — Système de mini-quiz IA utilisé en combat.
+
+Ce module pose des questions de culture générale (banque externe, voir
+quizbank.py et questions.tsv) et propose
+une mécanique de "liaison cognitive" : le joueur doit répondre à une
+question, ce qui modifie les dégâts infligés lors d'une attaque.
+
+- Bonne réponse → dégâts * 1.5
+- Mauvaise réponse → dégâts * 0.5
+
+Les statistiques de réponses sont enregistrées sur le joueur (une partie
+= un joueur), utiles pour afficher son niveau de synchronisation avec l'IA.
+Des totaux pour tout le processus (toutes parties confondues) sont tenus
+dans des compteurs sans contention (voir counters.py).
+
+Qui répond ? Une politique de réponse (Game.quiz_policy) fournit la
+réponse à chaque question : le joueur (HumanPolicy, par défaut) ou un
+automate (toujours juste, toujours faux, probabilité p, bande enregistrée).
+Avec une politique automatique, un combat se déroule sans aucune saisie :
+bots, simulations et tests de charge tournent à pleine vitesse.
+"""
+
+import random
+from collections import deque
+
+from counters import ShardedCounter
+from gameio import TerminalIO
+from dialogue import ask
+from quizbank import AdaptiveDeck, get_bank
+
+# Multiplicateurs de dégâts selon la réponse (repris par combat_sim.py)
+RIGHT_MULTIPLIER = 1.5
+WRONG_MULTIPLIER = 0.5
+
+# Totaux du processus, toutes parties confondues (voir global_stats())
+GLOBAL_STATS = {
+    "correct": ShardedCounter(),
+    "wrong": ShardedCounter(),
+}
+
+
+# ============================================================
+# Politiques de réponse
+# ============================================================
+#
+# Une politique expose answer(bank, index, rng) qui retourne la réponse
+# « tapée » à la question, ou None pour la demander au joueur. rng est
+# le flux des politiques de la partie (Game.policy_rng) : une politique
+# aléatoire y puise ses tirages, la partie reste ainsi reproductible. Ce
+# flux est distinct de Game.rng : rejouer les réponses enregistrées
+# (TapePolicy) ne décale donc pas les autres tirages de la partie.
+# La réponse est ensuite vérifiée normalement par la banque.
+
+class HumanPolicy:
+    """Le joueur répond lui-même (saisie attendue sans bloquer)."""
+
+    def answer(self, bank, index, rng):
+        """Laisse le joueur répondre."""
+        return None
+
+
+class AlwaysRight:
+    """Répond toujours juste (coup critique à chaque attaque)."""
+
+    def answer(self, bank, index, rng):
+        """Retourne la réponse de référence."""
+        return bank.answer(index)
+
+
+class AlwaysWrong:
+    """Répond toujours faux (dégâts réduits à chaque attaque)."""
+
+    def answer(self, bank, index, rng):
+        """Retourne une réponse vide, jamais acceptée."""
+        return ""
+
+
+class ProbabilityPolicy:
+    """
+    Répond juste avec la probabilité p.
+
+    Attributs :
+        p (float) : probabilité de bonne réponse (0 à 1).
+        rng : source d'aléa propre à la politique, ou None pour tirer
+              dans le flux des politiques de la partie (par défaut).
+    """
+
+    def __init__(self, p, rng=None):
+        """Initialise la politique."""
+        if not 0.0 <= p <= 1.0:
+            raise ValueError(f"Probabilité invalide : {p!r}")
+        self.p = p
+        self.rng = rng
+
+    def answer(self, bank, index, rng):
+        """Réponse de référence avec la probabilité p, réponse vide sinon."""
+        draw = (self.rng or rng).random()
+        return bank.answer(index) if draw < self.p else ""
+
+
+class TapePolicy:
+    """
+    Rejoue des réponses enregistrées, dans l'ordre.
+
+    Chaque élément de la bande est soit un texte (la réponse tapée),
+    soit un booléen (True = bonne réponse, False = mauvaise). Une fois
+    la bande épuisée, la politique `then` prend le relais (le joueur
+    par défaut).
+    """
+
+    def __init__(self, answers, then=None):
+        """Initialise la bande."""
+        self.tape = deque(answers)
+        self.then = then if then is not None else HUMAN
+
+    def answer(self, bank, index, rng):
+        """Réponse suivante de la bande."""
+        if not self.tape:
+            return self.then.answer(bank, index, rng)
+        recorded = self.tape.popleft()
+        if recorded is True:
+            return bank.answer(index)
+        if recorded is False:
+            return ""
+        return recorded
+
+
+# Politique par défaut : le joueur répond
+HUMAN = HumanPolicy()
+
+
+# ============================================================
+# Questions
+# ============================================================
+
+def combat_difficulty(enemy) -> int:
+    """
+    Niveau de question adapté à l'ennemi combattu (voir quizbank.LEVELS).
+
+    3 pour un boss, 2 pour un ennemi offensif (ATK ≥ 12), 1 sinon.
+    """
+    if enemy.is_boss:
+        return 3
+    return 2 if enemy.atk >= 12 else 1
+
+
+def ask_question(player, io=None, difficulty=None, policy=None, rng=None, policy_rng=None):
+    """
+    Pose une question IA au joueur et retourne un multiplicateur de dégâts.
+
+    C'est un générateur de dialogue (voir dialogue.py) : il cède un Prompt
+    en attendant la réponse, à utiliser avec `yield from`.
+
+    Retourne :
+        1.5 → si la réponse est correcte (coup critique)
+        0.5 → si la réponse est incorrecte
+
+    Paramètres :
+        player : objet Player, utilisé pour mettre à jour ses statistiques
+                 de bonnes/mauvaises réponses.
+        io : backend d'E/S de la partie (terminal si absent).
+        difficulty : niveau de question visé (1 à 3, voir combat_difficulty()),
+                     ou None pour laisser le paquet choisir.
+        policy : politique de réponse (HUMAN si absente).
+        rng : flux aléatoire de la partie (Game.rng) ; module random si absent.
+        policy_rng : flux transmis à la politique (Game.policy_rng) ; rng si absent.
+
+    Effets :
+        - Affiche une question via le backend d'E/S
+        - Attend la réponse du joueur (sans bloquer la partie), ou
+          l'obtient de la politique de réponse sans rien attendre
+        - Met à jour les statistiques IA du joueur et les totaux du processus
+    """
+    io = io or TerminalIO()
+    rng = rng or random
+    bank = get_bank()
+    deck = _deck_for(player, bank, rng)
+    index = deck.draw(difficulty)
+    q, ans = bank.question(index), bank.answer(index)
+    io.write()
+    io.write("🤖 Le système du Vigilant initialise le lien cognitif IA...")
+    io.write()
+    io.write(f"❓ [IA Active] Question : {q}")
+
+    user = (policy or HUMAN).answer(bank, index, policy_rng or rng)
+    if user is None:
+        user = yield from ask()
+
+    correct = bank.check(index, user)
+    deck.record(index, correct)
+    if player:
+        player.ia_questions_answered += 1
+
+    # Bonne réponse → bonus de dégâts
+    if correct:
+        io.write("✅ Liaison cognitive parfaite. Coup critique 💥 (+50% dégâts)")
+        GLOBAL_STATS["correct"].add()
+        if player:
+            player.ia_correct += 1
+        return RIGHT_MULTIPLIER
+
+    # Mauvaise réponse → malus de dégâts
+    else:
+        io.write(f"❌ Réponse inexacte. L'IA signale : {ans}. (-50% dégâts)")
+        GLOBAL_STATS["wrong"].add()
+        if player:
+            player.ia_wrong += 1
+        return WRONG_MULTIPLIER
+
+
+def _deck_for(player, bank, rng):
+    """Paquet de questions de la partie (créé au premier tirage, tiré dans rng)."""
+    if player is None:
+        return AdaptiveDeck(bank, rng)
+    if player.quiz_deck is None:
+        player.quiz_deck = AdaptiveDeck(bank, rng)
+    return player.quiz_deck
+
+
+def get_ai_status(player):
+    """
+    Retourne un résumé clair des performances IA du joueur.
+
+    Paramètres :
+        player : objet Player dont les réponses sont résumées
+                 (les autres parties du processus ne sont pas comptées).
+
+    Retour :
+        - Chaîne décrivant le nombre de bonnes/mauvaises réponses
+        - Pourcentage de réussite de la partie
+    """
+    correct, wrong = player.ia_correct, player.ia_wrong
+    total = correct + wrong
+
+    if total == 0:
+        return "L’IA n’a encore posé aucune question."
+
+    taux = int((correct / total) * 100)
+
+    return (
+        f"IA de combat — bonnes réponses : {correct}, "
+        f"mauvaises : {wrong}, "
+        f"pourcentage de réussite {taux}%"
+    )
+
+
+def global_stats():
+    """
+    Retourne les totaux du processus : {"correct": int, "wrong": int}.
+
+    Lecture peu coûteuse, sans bloquer les parties en cours.
+    """
+    return {key: counter.value() for key, counter in GLOBAL_STATS.items()}
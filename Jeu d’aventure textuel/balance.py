@@ -0,0 +1,346 @@
+"""
+balance.py — Réglage automatique des ennemis (outil d'équilibrage).
+
+Pour chaque ennemi de config.enemies_config et chaque embuscade de
+config.waves_config, l'outil cherche des valeurs de PV, d'ATK et de DEF
+qui donnent le taux de victoire visé, en moyenne sur plusieurs profils
+de joueur (builds) et plusieurs précisions au quiz.
+
+- Les candidats sont évalués par le modèle de combat vectorisé de
+  combat_sim.py : un seul appel simule d'un coup tous les candidats,
+  builds, précisions et tirages (tableaux numpy).
+- Les candidats sont répartis sur un pool de processus.
+- La recherche se fait par tours : PV et ATK sont multipliés par des
+  facteurs (GRID) et la DEF décalée (DEF_STEPS) autour des valeurs
+  courantes, puis la grille est resserrée autour du meilleur candidat.
+- Parmi les candidats assez proches de la cible (TOLERANCE), celui qui
+  modifie le moins l'ennemi est retenu.
+- Une embuscade est réglée d'un bloc : le même facteur s'applique à tous
+  ses ennemis, les PV du joueur étant conservés d'un ennemi à l'autre.
+
+Le résultat est écrit dans un fichier de configuration proposé (les
+entrées complètes enemies_config et waves_config), à relire avant de
+reporter les valeurs dans config.py.
+
+Lancement :
+    python balance.py --build 100,16,3 --build 100,15,6 --p 0.5 0.8 --workers 4
+"""
+
+import argparse
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from combat_sim import Fighter, fight_waves
+from config import enemies_config, waves_config
+
+
+# Facteurs appliqués aux PV et à l'ATK, décalages de DEF (premier tour)
+GRID = (0.6, 0.7, 0.8, 0.9, 1.0, 1.1, 1.25, 1.4, 1.6)
+DEF_STEPS = (-2, -1, 0, 1, 2)
+
+# Taux de victoire visés par défaut
+BOSS_TARGET = 0.6
+ENEMY_TARGET = 0.85
+AMBUSH_TARGET = 0.8
+
+# Écart toléré à la cible avant de départager par l'ampleur du changement
+TOLERANCE = 0.02
+
+# Combats simulés par candidat, build et précision
+DEFAULT_SAMPLES = 2000
+
+# Candidats évalués par tâche du pool
+CHUNK = 64
+
+# Fichier de configuration proposé
+DEFAULT_OUTPUT = "balanced_config.py"
+
+
+class _Stats:
+    """Statistiques d'ennemis sous forme de tableaux (lues par combat_sim.fight)."""
+
+    __slots__ = ("hp", "atk", "defense")
+
+    def __init__(self, hp, atk, defense):
+        """Un élément par combat simulé."""
+        self.hp = hp
+        self.atk = atk
+        self.defense = defense
+
+
+# ============================================================
+# Évaluation (exécutée dans le pool)
+# ============================================================
+
+def _win_rates(task):
+    """
+    Taux de victoire moyen de chaque candidat.
+
+    task : (candidats, builds, précisions, tirages, graine)
+        candidats : tableau (K, E, 3) — PV, ATK, DEF de chacun des E ennemis
+                    combattus à la suite, pour chacun des K candidats.
+        builds : tableau (B, 3) — PV, ATK, DEF du joueur.
+    """
+    candidates, builds, accuracies, samples, seed = task
+    k, b, a = len(candidates), len(builds), len(accuracies)
+    shape = (k, b, a, samples)
+    fights = k * b * a * samples
+
+    def spread(values, axis):
+        """Étend un tableau indexé sur un axe à un élément par combat."""
+        view = [1, 1, 1, 1]
+        view[axis] = -1
+        return np.broadcast_to(np.reshape(values, view), shape).ravel()
+
+    player = Fighter(*(spread(builds[:, i], 1) for i in range(3)))
+    enemies = [
+        _Stats(*(spread(candidates[:, e, i], 0) for i in range(3)))
+        for e in range(candidates.shape[1])
+    ]
+    p = spread(np.asarray(accuracies, np.float64), 2)
+
+    won, _, _ = fight_waves(player, enemies, fights, p, np.random.default_rng(seed))
+    return won.reshape(k, -1).mean(axis=1)
+
+
+# ============================================================
+# Recherche
+# ============================================================
+
+class Tuning:
+    """
+    Réglage d'un ennemi ou d'une embuscade.
+
+    Attributs :
+        name (str) : nom dans la config.
+        specs (list[dict]) : entrées de config d'origine (un ennemi, ou ceux de l'embuscade).
+        target (float) : taux de victoire visé.
+        factor (float) / offset (int) : facteur PV-ATK et décalage de DEF retenus.
+        before / after (float) : taux de victoire avant et après réglage.
+    """
+
+    def __init__(self, name, specs, target):
+        """Prépare le réglage (lancé par Tuner.run())."""
+        self.name = name
+        self.specs = specs
+        self.target = target
+        self.factor = 1.0
+        self.offset = 0
+        self.before = None
+        self.after = None
+
+    def stats(self, factor, offset):
+        """PV, ATK, DEF de chaque ennemi pour un candidat."""
+        return [
+            (max(1, round(spec["hp"] * factor)),
+             max(0, round(spec["atk"] * factor)),
+             max(0, spec["defense"] + offset))
+            for spec in self.specs
+        ]
+
+    def proposed(self):
+        """Entrées de config modifiées (copies)."""
+        result = []
+        for spec, (hp, atk, defense) in zip(self.specs, self.stats(self.factor, self.offset)):
+            spec = dict(spec, hp=hp, atk=atk, defense=defense)
+            result.append(spec)
+        return result
+
+
+def _change(factor, offset):
+    """Ampleur d'une modification (pour départager les candidats proches de la cible)."""
+    return abs(math.log(factor)) + 0.1 * abs(offset)
+
+
+class Tuner:
+    """
+    Recherche des stats d'ennemis pour des taux de victoire visés.
+
+    Attributs :
+        builds (ndarray) : profils du joueur (PV, ATK, DEF), un par ligne.
+        accuracies (tuple[float]) : précisions au quiz.
+        samples (int) : combats simulés par candidat, build et précision.
+        rounds (int) : tours de recherche (grille resserrée à chaque tour).
+        workers (int) : processus du pool (1 = sans pool).
+        tunings (list[Tuning]) : un réglage par ennemi et par embuscade.
+    """
+
+    def __init__(self, builds, accuracies=(0.5, 0.8), targets=None, samples=DEFAULT_SAMPLES,
+                 rounds=2, workers=None, seed=0):
+        """Prépare les réglages de tous les ennemis configurés."""
+        self.builds = np.asarray(builds, np.int64).reshape(-1, 3)
+        self.accuracies = tuple(accuracies)
+        self.samples = samples
+        self.rounds = rounds
+        self.workers = workers
+        self._seeds = np.random.SeedSequence(seed)
+        targets = targets or {}
+
+        self.tunings = []
+        for name, spec in enemies_config.items():
+            default = BOSS_TARGET if spec.get("is_boss") else ENEMY_TARGET
+            self.tunings.append(Tuning(name, [spec], targets.get(name, default)))
+        for name, waves in waves_config.items():
+            specs = [spec for wave in waves for spec in wave]
+            self.tunings.append(Tuning(name, specs, targets.get(name, AMBUSH_TARGET)))
+
+    def _evaluate(self, pool, tuning, grid):
+        """Taux de victoire de chaque candidat (facteur, décalage) de la grille."""
+        candidates = np.array([tuning.stats(f, o) for f, o in grid], np.int64)
+        chunks = range(0, len(candidates), CHUNK)
+        seeds = self._seeds.spawn(len(chunks))
+        tasks = [
+            (candidates[i:i + CHUNK], self.builds, self.accuracies, self.samples, seed)
+            for i, seed in zip(chunks, seeds)
+        ]
+        results = pool.map(_win_rates, tasks) if pool else map(_win_rates, tasks)
+        return np.concatenate(list(results))
+
+    def _tune(self, pool, tuning):
+        """Recherche par tours autour des valeurs courantes."""
+        tuning.before = float(self._evaluate(pool, tuning, [(1.0, 0)])[0])
+        best_factor, best_offset, spread = 1.0, 0, 1.0
+        for _ in range(self.rounds):
+            grid = sorted({
+                (round(best_factor * (1 + (g - 1) * spread), 4), best_offset + d)
+                for g in GRID for d in DEF_STEPS
+            })
+            rates = self._evaluate(pool, tuning, grid)
+            errors = np.abs(rates - tuning.target)
+            close = [i for i in range(len(grid)) if errors[i] <= TOLERANCE]
+            if close:
+                i = min(close, key=lambda i: _change(*grid[i]))
+            else:
+                i = int(np.argmin(errors))
+            (best_factor, best_offset), tuning.after = grid[i], float(rates[i])
+            spread /= 3
+
+        tuning.factor, tuning.offset = best_factor, best_offset
+
+    def run(self):
+        """Règle tous les ennemis et retourne les réglages."""
+        pool = ProcessPoolExecutor(self.workers) if (self.workers or 0) != 1 else None
+        try:
+            for tuning in self.tunings:
+                self._tune(pool, tuning)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return self.tunings
+
+    # ============================================================
+    # Résultats
+    # ============================================================
+
+    def report(self) -> str:
+        """Tableau : stats avant → après et taux de victoire avant → après (cible)."""
+        lines = []
+        for t in self.tunings:
+            lines.append(
+                f"{t.name:<40} victoire {t.before:6.1%} → {t.after:6.1%} (cible {t.target:.0%})"
+                f" | PV/ATK ×{t.factor:.2f} | DEF {t.offset:+d}"
+            )
+            for spec, new in zip(t.specs, t.proposed()):
+                label = spec.get("name", t.name)
+                lines.append(
+                    f"    {label:<36} PV {spec['hp']:>4} → {new['hp']:<4} "
+                    f"ATK {spec['atk']:>3} → {new['atk']:<3} DEF {spec['defense']:>3} → {new['defense']}"
+                )
+        return "\n".join(lines)
+
+    def proposed_config(self):
+        """Nouvelles entrées enemies_config et waves_config (copies complètes)."""
+        enemies = dict(enemies_config)
+        waves = {}
+        by_name = {t.name: t for t in self.tunings}
+        for name in enemies_config:
+            enemies[name] = by_name[name].proposed()[0]
+        for name, wave_list in waves_config.items():
+            specs = iter(by_name[name].proposed())
+            waves[name] = [[next(specs) for _ in wave] for wave in wave_list]
+        return enemies, waves
+
+    def write(self, path=DEFAULT_OUTPUT):
+        """Écrit le fichier de configuration proposé."""
+        enemies, waves = self.proposed_config()
+        builds = ", ".join(f"PV {hp} / ATK {atk} / DEF {d}" for hp, atk, d in self.builds.tolist())
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(
+                '"""\n'
+                "Configuration proposée par balance.py — à relire avant de reporter\n"
+                "les valeurs dans config.py.\n\n"
+                f"Builds du joueur : {builds}\n"
+                f"Précisions au quiz : {', '.join(str(p) for p in self.accuracies)}\n"
+                '"""\n\n'
+            )
+            f.write(f"enemies_config = {_format(enemies)}\n\n")
+            f.write(f"waves_config = {_format(waves)}\n")
+        return path
+
+
+def _format(value, level=0):
+    """Écrit une valeur de config en Python lisible (même présentation que config.py)."""
+    pad = "    " * (level + 1)
+    end = "    " * level
+    if isinstance(value, dict):
+        items = [f'{pad}{_format(k)}: {_format(v, level + 1)}' for k, v in value.items()]
+        return "{\n" + ",\n".join(items) + f"\n{end}}}"
+    if isinstance(value, list):
+        if value and all(isinstance(v, dict) for v in value):
+            # Ennemis d'une vague : une ligne par ennemi
+            return "[\n" + ",\n".join(f"{pad}{_inline(v)}" for v in value) + f",\n{end}]"
+        return "[\n" + ",\n".join(f"{pad}{_format(v, level + 1)}" for v in value) + f",\n{end}]"
+    if isinstance(value, str):
+        return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return repr(value)
+
+
+def _inline(spec):
+    """Dictionnaire sur une seule ligne."""
+    return "{" + ", ".join(f"{_format(k)}: {_format(v)}" for k, v in spec.items()) + "}"
+
+
+# ============================================================
+# Ligne de commande
+# ============================================================
+
+def _build(text):
+    """Lit un build "PV,ATK,DEF"."""
+    hp, atk, defense = (int(v) for v in text.split(","))
+    return hp, atk, defense
+
+
+def _target(text):
+    """Lit une cible "Nom=0.7"."""
+    name, _, rate = text.rpartition("=")
+    return name, float(rate)
+
+
+def main():
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Réglage automatique des ennemis du Vigilant.")
+    parser.add_argument("--build", type=_build, action="append",
+                        help="profil du joueur PV,ATK,DEF (répétable) ; défaut : les deux choix du crash")
+    parser.add_argument("--p", type=float, nargs="+", default=[0.5, 0.8], help="précisions au quiz")
+    parser.add_argument("--target", type=_target, action="append", default=[],
+                        help="cible d'un ennemi ou d'une embuscade, ex. \"Capitaine Vorn=0.7\"")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--workers", type=int, help="processus du pool (1 = sans pool)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    builds = args.build or [
+        (f.hp, f.atk, f.defense) for f in (Fighter.after_crash("1"), Fighter.after_crash("2"))
+    ]
+    tuner = Tuner(builds, args.p, dict(args.target), args.samples, args.rounds, args.workers, args.seed)
+    tuner.run()
+    print(tuner.report())
+    print(f"\nConfiguration proposée écrite dans {tuner.write(args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,8 @@ class Character:
         _msg_index (int) : index interne pour alterner les messages.
         on_talk (callable) : fonction optionnelle appelée lorsqu'on parle au PNJ.
                              Signature attendue : on_talk(player, game, self)
+                             Elle peut être un générateur qui cède des Prompt
+                             pour attendre les choix du joueur.
     """
 
     def __init__(self, name: str, description: str, messages=None):
@@ -50,7 +52,8 @@ class Character:
             game : l'objet Game (optionnel), si le PNJ doit interagir avec l’état du jeu.
 
         Retour :
-            str — le message prononcé par le PNJ.
+            str — le message prononcé par le PNJ, ou un générateur de
+            dialogue (voir dialogue.py) si le callback attend un choix.
         """
         # Callback personnalisé
         if callable(self.on_talk):
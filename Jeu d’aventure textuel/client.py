@@ -0,0 +1,61 @@
+"""
+client.py — Client de test pour le serveur multi-sessions.
+
+Relaie le clavier vers le serveur et affiche tout ce que le serveur renvoie.
+Par défaut, il se connecte au serveur local (127.0.0.1).
+
+Lancement :
+    python client.py --host 127.0.0.1 --port 7777
+"""
+
+import argparse
+import asyncio
+import sys
+
+from server import DEFAULT_HOST, DEFAULT_PORT
+
+
+async def _print_server(reader):
+    """Affiche au fil de l'eau le texte envoyé par le serveur."""
+    while True:
+        data = await reader.read(4096)
+        if not data:
+            break
+        sys.stdout.write(data.decode("utf-8", errors="replace"))
+        sys.stdout.flush()
+
+
+async def run_client(host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Ouvre une connexion et relaie l'entrée standard jusqu'à la déconnexion."""
+    reader, writer = await asyncio.open_connection(host, port)
+    printer = asyncio.create_task(_print_server(reader))
+
+    loop = asyncio.get_running_loop()
+    while not printer.done():
+        line = await loop.run_in_executor(None, sys.stdin.readline)
+        if not line:
+            break
+        writer.write(line.encode("utf-8"))
+        await writer.drain()
+
+    if writer.can_write_eof():
+        writer.write_eof()
+    await printer
+    writer.close()
+
+
+def main():
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Client de test du serveur du Vigilant.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(run_client(args.host, args.port))
+    except (ConnectionError, KeyboardInterrupt):
+        pass
+
+
+if __name__ == "__main__":
+    main()
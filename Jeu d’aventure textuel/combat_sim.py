@@ -0,0 +1,293 @@
+"""
+combat_sim.py — Simulateur Monte-Carlo des combats (outil d'équilibrage).
+
+Rejouer des combats avec Game.headless() et une politique de quiz
+automatique coûte plusieurs dizaines de microsecondes par attaque : trop
+lent pour estimer finement un taux de victoire ou comparer des réglages.
+Ce module reproduit exactement les règles de combat du jeu sur des
+tableaux numpy, un élément par combat :
+
+    base   = max(1, ATK joueur - DEF ennemi)
+    dégâts = max(1, round(base * multiplicateur))        (actions.attack)
+    réel   = max(1, dégâts - DEF ennemi)                 (Enemy.take_damage)
+    riposte (si l'ennemi survit) = max(1, ATK ennemi - DEF joueur)
+                                                         (Player.take_damage)
+
+Le multiplicateur vaut 1.5 ou 0.5 selon la réponse au quiz, bonne avec
+la probabilité p (comme ProbabilityPolicy). Un pas de la boucle joue un
+tour de tous les combats encore en cours : le coût par tour est
+vectorisé, seul le nombre de tours (quelques dizaines) reste en Python.
+
+Les ennemis simulés sont ceux de config.enemies_config et les vagues des
+embuscades de config.waves_config (les PV du joueur sont conservés d'un
+ennemi à l'autre, comme dans la partie).
+
+numpy n'est nécessaire que pour cet outil : le jeu ne l'importe pas.
+
+Lancement :
+    python combat_sim.py --fights 1000000 --p 0.5 --crash 1
+"""
+
+import argparse
+
+import numpy as np
+
+from ai_quiz import RIGHT_MULTIPLIER, WRONG_MULTIPLIER
+from config import enemies_config, waves_config
+from enemy import Enemy
+
+
+# Garde-fou : un combat dure au plus max(PV ennemi) tours (1 dégât minimum)
+MAX_ROUNDS = 1000
+
+# Nombre de combats simulés par défaut
+DEFAULT_FIGHTS = 100_000
+
+
+class Fighter:
+    """
+    Statistiques de combat du joueur simulé.
+
+    Chaque attribut est un entier ou un tableau (un élément par combat),
+    ce qui permet de simuler d'un coup plusieurs réglages du joueur.
+
+    Attributs :
+        hp (int | ndarray) : points de vie au début du combat.
+        atk (int | ndarray) : attaque.
+        defense (int | ndarray) : défense.
+    """
+
+    __slots__ = ("hp", "atk", "defense")
+
+    def __init__(self, hp=100, atk=15, defense=3):
+        """Initialise les statistiques (valeurs par défaut de Player)."""
+        self.hp = hp
+        self.atk = atk
+        self.defense = defense
+
+    @classmethod
+    def from_player(cls, player):
+        """Reprend les statistiques actuelles d'un Player."""
+        return cls(player.hp, player.atk, player.defense)
+
+    @classmethod
+    def after_crash(cls, crash_choice="1"):
+        """Statistiques du joueur juste après le choix du crash (voir Game._start)."""
+        from game import Game
+        game = Game.headless("Simulation", crash_choice)
+        try:
+            return cls.from_player(game.player)
+        finally:
+            game.close()
+
+    def __repr__(self):
+        """Représentation lisible (utile pour debug)."""
+        return f"Fighter(hp={self.hp}, atk={self.atk}, defense={self.defense})"
+
+
+class CombatStats:
+    """
+    Résultat d'une simulation.
+
+    Attributs :
+        name (str) : ennemi ou embuscade simulé.
+        won (ndarray[bool]) : True si le joueur a survécu.
+        turns (ndarray[int]) : nombre d'attaques du joueur.
+        hp_left (ndarray[int]) : PV restants du joueur (0 s'il est mort).
+    """
+
+    def __init__(self, name, won, turns, hp_left):
+        """Regroupe les tableaux produits par fight() ou fight_waves()."""
+        self.name = name
+        self.won = won
+        self.turns = turns
+        self.hp_left = hp_left
+
+    def __len__(self):
+        """Nombre de combats simulés."""
+        return len(self.won)
+
+    @property
+    def win_rate(self) -> float:
+        """Proportion de combats gagnés."""
+        return float(self.won.mean()) if len(self) else 0.0
+
+    def turns_distribution(self):
+        """Histogramme des tours nécessaires pour gagner (indice = nombre de tours)."""
+        return np.bincount(self.turns[self.won])
+
+    def hp_left_distribution(self):
+        """Histogramme des PV restants après une victoire (indice = PV)."""
+        return np.bincount(self.hp_left[self.won])
+
+    def percentiles(self, values, q=(5, 50, 95)):
+        """Percentiles d'un tableau restreint aux victoires (None si aucune)."""
+        values = values[self.won]
+        if not values.size:
+            return None
+        return tuple(int(v) for v in np.percentile(values, q))
+
+    def summary(self) -> str:
+        """Ligne de résumé : taux de victoire, tours et PV restants (p5/p50/p95)."""
+        turns = self.percentiles(self.turns)
+        hp = self.percentiles(self.hp_left)
+        fmt = lambda p: "-" if p is None else "/".join(str(v) for v in p)
+        return (
+            f"{self.name:<40} victoire {self.win_rate:7.2%} | "
+            f"tours {fmt(turns):>9} | PV restants {fmt(hp):>11}"
+        )
+
+
+# ============================================================
+# Simulation
+# ============================================================
+
+def _per_fight(value, fights, dtype=np.int64):
+    """Étend un scalaire (ou vérifie un tableau) à un élément par combat."""
+    return np.broadcast_to(np.asarray(value, dtype=dtype), (fights,))
+
+
+def _hit(base, multiplier, defense):
+    """Dégâts réellement infligés pour un multiplicateur donné (règles du jeu)."""
+    # np.rint arrondit au pair le plus proche, comme round() en Python
+    dmg = np.maximum(1, np.rint(base * multiplier).astype(np.int64))
+    return np.maximum(1, dmg - defense)
+
+
+def fight(player, enemy, fights=DEFAULT_FIGHTS, p=0.5, rng=None, hp=None):
+    """
+    Simule `fights` combats du joueur contre un ennemi.
+
+    Paramètres :
+        player (Fighter | Player) : statistiques du joueur.
+        enemy (Enemy) : ennemi affronté (seuls hp, atk, defense sont lus ;
+                        comme pour le joueur, ce peuvent être des tableaux).
+        p (float | ndarray) : probabilité de bien répondre au quiz.
+        rng (numpy.random.Generator) : source d'aléa (une nouvelle par défaut).
+        hp (ndarray) : PV du joueur au début de chaque combat (enchaînement
+                       de combats) ; un joueur à 0 PV ne combat pas.
+
+    Retour :
+        (won, turns, hp_left) : tableaux d'un élément par combat.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    php = np.array(_per_fight(player.hp if hp is None else hp, fights))
+    pdef = _per_fight(player.defense, fights)
+    chance = _per_fight(p, fights, np.float64)
+
+    edef = _per_fight(enemy.defense, fights)
+    eatk = _per_fight(enemy.atk, fights)
+
+    base = np.maximum(1, _per_fight(player.atk, fights) - edef)
+    right = _hit(base, RIGHT_MULTIPLIER, edef)
+    wrong = _hit(base, WRONG_MULTIPLIER, edef)
+    riposte = np.where(eatk > 0, np.maximum(1, eatk - pdef), 0)
+
+    ehp = np.array(_per_fight(enemy.hp, fights))
+    won = np.zeros(fights, bool)
+    turns = np.zeros(fights, np.int32)
+
+    # Indices des combats encore en cours (le tableau rétrécit à chaque tour)
+    active = np.flatnonzero(php > 0)
+    for _ in range(MAX_ROUNDS):
+        if not active.size:
+            break
+        correct = rng.random(active.size) < chance[active]
+        ehp[active] -= np.where(correct, right[active], wrong[active])
+        turns[active] += 1
+
+        killed = ehp[active] <= 0
+        won[active[killed]] = True
+        active = active[~killed]
+
+        # Riposte des ennemis encore debout
+        php[active] -= riposte[active]
+        active = active[php[active] > 0]
+
+    return won, turns, np.maximum(php, 0)
+
+
+def fight_waves(player, enemies, fights=DEFAULT_FIGHTS, p=0.5, rng=None):
+    """
+    Simule des combats enchaînés : les PV du joueur sont conservés d'un
+    ennemi à l'autre, les tours s'additionnent.
+
+    Retour :
+        (won, turns, hp_left) : comme fight(), pour toute la séquence.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    hp = np.array(_per_fight(player.hp, fights))
+    turns = np.zeros(fights, np.int32)
+    won = hp > 0
+    for enemy in enemies:
+        won, t, hp = fight(player, enemy, fights, p, rng, hp=hp)
+        turns += t
+    return won, turns, hp
+
+
+def simulate_enemy(name, player, fights=DEFAULT_FIGHTS, p=0.5, rng=None):
+    """Simule un ennemi de config.enemies_config."""
+    return CombatStats(name, *fight(player, Enemy.from_config(name), fights, p, rng))
+
+
+def simulate_ambush(name, player, fights=DEFAULT_FIGHTS, p=0.5, rng=None, reveal=False):
+    """
+    Simule une embuscade de config.waves_config (toutes ses vagues).
+
+    reveal (bool) : applique le bonus d'attaque « vérité révélée ».
+    """
+    enemies = [
+        Enemy.from_spec(spec["name"], spec, spec.get("reveal_atk", 0) if reveal else 0)
+        for wave in waves_config[name]
+        for spec in wave
+    ]
+    label = name + (" (vérité révélée)" if reveal else "")
+    return CombatStats(label, *fight_waves(player, enemies, fights, p, rng))
+
+
+def simulate_all(player, fights=DEFAULT_FIGHTS, p=0.5, seed=None):
+    """
+    Simule tous les ennemis et toutes les embuscades configurés.
+
+    Retour :
+        list[CombatStats] : un résultat par ennemi, puis par embuscade
+                            (avec et sans bonus de révélation s'il existe).
+    """
+    rng = np.random.default_rng(seed)
+    results = [simulate_enemy(name, player, fights, p, rng) for name in enemies_config]
+    for name, waves in waves_config.items():
+        results.append(simulate_ambush(name, player, fights, p, rng))
+        if any(spec.get("reveal_atk") for wave in waves for spec in wave):
+            results.append(simulate_ambush(name, player, fights, p, rng, reveal=True))
+    return results
+
+
+# ============================================================
+# Ligne de commande
+# ============================================================
+
+def main():
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Simulateur Monte-Carlo des combats du Vigilant.")
+    parser.add_argument("--fights", type=int, default=DEFAULT_FIGHTS, help="combats par ennemi")
+    parser.add_argument("--p", type=float, default=0.5, help="probabilité de bien répondre au quiz")
+    parser.add_argument("--crash", choices=("1", "2"), default="1", help="choix du crash (statistiques de départ)")
+    parser.add_argument("--hp", type=int, help="PV du joueur (remplace la valeur de départ)")
+    parser.add_argument("--atk", type=int, help="ATK du joueur")
+    parser.add_argument("--defense", type=int, help="DEF du joueur")
+    parser.add_argument("--seed", type=int, help="graine (résultats reproductibles)")
+    args = parser.parse_args()
+
+    player = Fighter.after_crash(args.crash)
+    for attr in Fighter.__slots__:
+        value = getattr(args, attr)
+        if value is not None:
+            setattr(player, attr, value)
+
+    print(f"{player} | p = {args.p} | {args.fights} combats par ennemi")
+    for stats in simulate_all(player, args.fights, args.p, args.seed):
+        print(stats.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,11 @@ Ce module contient la classe Command, responsable :
 La classe agit comme un routeur central des interactions,
 permettant de séparer la logique de gameplay (actions.py)
 de la gestion du texte entré par l’utilisateur.
+
+Le routage passe par une table alias → action construite à l'import
+(VERBS) : trouver l'action d'un verbe est un simple accès dictionnaire.
+De nouveaux verbes peuvent être ajoutés avec register(), sans modifier
+Command.execute().
 """
 
 from actions import (
@@ -25,12 +30,76 @@ from actions import (
     history,
     ai_status,
     quit_game,
-    check, 
+    check,
     cheat,
-    analyze
+    analyze,
+    predict,
 )
 
 
+# -----------------------------
+#  Table des verbes
+# -----------------------------
+
+# alias → (action, prend un argument ?)
+VERBS = {}
+
+# Alias autorisés pendant un combat (hors combat, tous les verbes le sont)
+COMBAT_VERBS = set()
+
+
+def register(action, *aliases, takes_arg=True, in_combat=False):
+    """
+    Enregistre une action sous un ou plusieurs alias.
+
+    Paramètres :
+        action (callable) : fonction action(game, arg) ou action(game).
+        aliases (str) : verbes qui déclenchent l'action (en minuscules).
+        takes_arg (bool) : True si l'action reçoit l'argument de la commande.
+        in_combat (bool) : True si l'action reste disponible pendant un combat.
+    """
+    for alias in aliases:
+        VERBS[alias] = (action, takes_arg)
+        if in_combat:
+            COMBAT_VERBS.add(alias)
+        else:
+            COMBAT_VERBS.discard(alias)
+
+
+# Déplacements
+register(go, "aller", "go", "g")
+register(back, "retour", "back", takes_arg=False)
+
+# Observation
+register(look, "observer", "look", "o", takes_arg=False)
+
+# Gestion des objets
+register(take, "prendre", "take", "p")
+register(drop, "jeter", "drop", "j")
+register(inventory, "inventaire", "inventory", "i", takes_arg=False, in_combat=True)
+register(check, "examiner", "check", "e", in_combat=True)
+
+# PNJ
+register(talk, "parler", "talk", "t")
+
+# Combat
+register(attack, "attaquer", "attack", "a", in_combat=True)
+register(cheat, "tricher", "cheat", "b", in_combat=True)
+
+# Utilisation d'objet
+register(use, "utiliser", "use", "u", in_combat=True)
+
+# Informations / Statistiques
+register(status, "statut", "status", "s", takes_arg=False, in_combat=True)
+register(history, "historique", "history", "h")
+register(ai_status, "ia", "ai", takes_arg=False, in_combat=True)
+register(analyze, "analyser", "analyze", "x", in_combat=True)
+register(predict, "prevoir", "prévoir", "forecast", "f", in_combat=True)
+
+# Quitter le jeu
+register(quit_game, "quitter", "quit", "exit", "q", takes_arg=False)
+
+
 class Command:
     """
     Représente une commande textuelle entrée par le joueur.
@@ -70,98 +139,31 @@ class Command:
 
         Étapes :
             1) parse() pour extraire verbe + argument
-            2) appli applique les règles de combat (limitation des actions)
-            3) routage vers la bonne fonction dans actions.py
+            2) applique les règles de combat (limitation des actions)
+            3) routage vers la bonne fonction dans actions.py (table VERBS)
 
         Retour :
-            str — le texte à afficher au joueur.
+            str — le texte à afficher au joueur, ou un générateur de dialogue
+            (voir dialogue.py) si l'action attend une réponse du joueur.
         """
         self.parse()
         v = self.verb
-        a = self.arg
 
         if not v:
             return ""
 
-        # -----------------------------
-        #  Blocage des actions en combat
-        # -----------------------------
-        if game.in_combat:
-            allowed = {
-                "attaquer", "attack", "a",
-                "utiliser", "use", "u",
-                "statut", "status", "s",
-                "ia", "inventory", "inventaire",
-                "check", "examiner" "analyze", "b",
-            }
-            if v not in allowed:
-                return (
-                    "❌ Vous êtes en combat : utilisez 'attaquer', 'utiliser', "
-                    "'statut', 'ia', 'inventaire' ou 'examiner'."
-                )
-
-        # -----------------------------
-        #  Déplacements
-        # -----------------------------
-        if v in ("aller", "go", "g"):
-            return go(game, a)
-        if v in ("retour", "back"):
-            return back(game)
-
-        # -----------------------------
-        #  Observation
-        # -----------------------------
-        if v in ("observer", "look", "o"):
-            return look(game)
-
-        # -----------------------------
-        #  Gestion des objets
-        # -----------------------------
-        if v in ("prendre", "take", "p"):
-            return take(game, a)
-        if v in ("jeter", "drop", "j"):
-            return drop(game, a)
-        if v in ("inventaire", "inventory", "i"):
-            return inventory(game)
-        if v in ("examiner", "check", "e"):
-            return check(game, a)
-
-        # -----------------------------
-        #  PNJ
-        # -----------------------------
-        if v in ("parler", "talk", "t"):
-            return talk(game, a)
-
-        # -----------------------------
-        #  Combat
-        # -----------------------------
-        if v in ("attaquer", "attack", "a"):
-            return attack(game, a)
-        if v in ("tricher", "cheat", "b"):
-            return cheat(game, a)
-
-        # -----------------------------
-        #  Utilisation d'objet
-        # -----------------------------
-        if v in ("utiliser", "use", "u"):
-            return use(game, a)
-
-        # -----------------------------
-        #  Informations / Statistiques
-        # -----------------------------
-        if v in ("statut", "status", "s"):
-            return status(game)
-        if v in ("historique", "history", "h"):
-            return history(game)
-        if v in ("ia", "ai"):
-            return ai_status(game)
-        if v in ("analyser", "analyze", "x"):
-            return analyze(game, a)
-
-        # -----------------------------
-        #  Quitter le jeu
-        # -----------------------------
-        if v in ("quitter", "quit", "exit", "q"):
-            return quit_game(game)
-
-        return f"Commande inconnue : {v}"
+        # Blocage des actions en combat
+        if game.in_combat and v not in COMBAT_VERBS:
+            return (
+                "❌ Vous êtes en combat : utilisez 'attaquer', 'utiliser', "
+                "'statut', 'ia', 'inventaire', 'examiner' ou 'prévoir'."
+            )
+
+        entry = VERBS.get(v)
+        if entry is None:
+            return f"Commande inconnue : {v}"
+
+        action, takes_arg = entry
+        if takes_arg:
+            return action(game, self.arg)
+        return action(game)
@@ -31,7 +31,11 @@ START_ROOM = "Eridani Prime"
 # Chaque objet possède :
 # - une description,
 # - un type d'effet,
-# - une valeur utilisée dans les calculs de stats.
+# - une valeur utilisée dans les calculs de stats,
+# - usable / weight (facultatifs : False et 1 kg par défaut).
+#
+# Chaque entrée devient un prototype partagé (voir item.py) :
+# Item.from_config("Trousse Médicale") crée un exemplaire léger.
 # -----------------------------------------------------------
 
 items_config = {
@@ -46,9 +50,11 @@ items_config = {
         "value": 5
     },
     "Trousse Médicale": {
-        "description": "Kit de premiers secours utilisé par les équipes d’exploration.",
-        "effect_type": "hp",
-        "value": 25
+        "description": "Une trousse de soin rudimentaire (+25 PV).",
+        "effect_type": "heal",
+        "value": 25,
+        "usable": True,
+        "weight": 3
     },
     "Noyau d'Énergie": {
         "description": "Module d’énergie utilisé pour ravitailler le réacteur du Vigilant.",
@@ -59,6 +65,33 @@ items_config = {
         "description": "Artefact mystique ouvrant des portails vers d'autres mondes.",
         "effect_type": "reputation",
         "value": 10
+    },
+    "Puce neuronale traductrice": {
+        "description": "Implant qui traduit en temps réel les langues d’Eridani.",
+        "effect_type": "quest",
+        "value": 0,
+        "weight": 1
+    },
+    "Module d'énergie stabilisé": {
+        "description": "Un module récupéré intact dans les soutes. "
+                       "Il améliore la stabilité du réacteur portable (+2 DEF lorsqu'utilisé).",
+        "effect_type": "def",
+        "value": 2,
+        "usable": True,
+        "weight": 2
+    },
+    "Cristal de propulsion": {
+        "description": "Cristal énergétique indispensable à la réparation du Vigilant.",
+        "effect_type": "quest",
+        "value": 0,
+        "weight": 2
+    },
+    "Dose de Nanomédecine": {
+        "description": "Un cylindre métallique rempli de nanorobots médicaux capables de réparer les tissus "
+                       "en quelques secondes. Une seule dose. Une seule chance.",
+        "effect_type": "quest",
+        "value": 0,
+        "weight": 1
     }
 }
 
@@ -138,6 +171,34 @@ enemies_config = {
     }
 }
 
+# -----------------------------------------------------------
+# Vagues d'ennemis des embuscades scénarisées (voir game.py)
+# Chaque embuscade est une liste de vagues, chaque vague une liste
+# d'ennemis combattus l'un après l'autre. Champs :
+# - hp, atk, defense : comme enemies_config
+# - reveal_atk : bonus d'attaque si le joueur a choisi de révéler la
+#   vérité à Aurelion Prime (facultatif)
+# -----------------------------------------------------------
+
+waves_config = {
+    "Embuscade du Quartier civil": [
+        [
+            {"name": "Drone éclaireur", "hp": 35, "atk": 7, "defense": 2},
+            {"name": "Drone éclaireur", "hp": 35, "atk": 7, "defense": 2},
+            {"name": "Drone de patrouille", "hp": 55, "atk": 10, "defense": 3},
+        ],
+    ],
+    "Embuscade du Quartier des Hologrammes": [
+        [
+            {"name": "Spectre Holographique", "hp": 45, "atk": 12, "defense": 3, "reveal_atk": 2},
+            {"name": "Spectre Holographique", "hp": 45, "atk": 12, "defense": 3, "reveal_atk": 2},
+        ],
+        [
+            {"name": "Garde Éclaté", "hp": 60, "atk": 16, "defense": 4, "reveal_atk": 3},
+        ],
+    ],
+}
+
 # -----------------------------------------------------------
 # Planètes (rooms) : description, connexions, PNJ, ennemis, items
 # Chaque room est un lieu explorable par le joueur.
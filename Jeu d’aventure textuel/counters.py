@@ -0,0 +1,55 @@
+"""
+counters.py — Compteurs globaux sans contention.
+
+Plusieurs parties (et éventuellement plusieurs threads) incrémentent les
+mêmes statistiques de processus. Un compteur partagé protégé par un verrou
+deviendrait un point de contention ; ShardedCounter donne à chaque thread
+sa propre case (shard) :
+
+- add() n'écrit que dans la case du thread appelant, sans verrou,
+- value() additionne toutes les cases (lecture ponctuelle, peu fréquente).
+
+Le verrou n'est pris qu'une fois par thread, à la création de sa case.
+"""
+
+import threading
+
+
+class ShardedCounter:
+    """
+    Compteur entier réparti en une case par thread.
+
+    Attributs :
+        _local (threading.local) : case du thread courant.
+        _shards (list[list[int]]) : toutes les cases créées.
+    """
+
+    __slots__ = ("_local", "_shards", "_lock")
+
+    def __init__(self):
+        """Initialise un compteur à zéro."""
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()
+
+    def _shard(self):
+        """Retourne la case du thread courant (créée au premier appel)."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = [0]
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    def add(self, amount=1):
+        """Ajoute `amount` au compteur (case du thread courant uniquement)."""
+        self._shard()[0] += amount
+
+    def value(self) -> int:
+        """Retourne la somme de toutes les cases."""
+        return sum(shard[0] for shard in tuple(self._shards))
+
+    def __repr__(self):
+        """Représentation lisible (utile pour debug)."""
+        return f"ShardedCounter({self.value()})"
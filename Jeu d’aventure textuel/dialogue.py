@@ -0,0 +1,70 @@
+"""
+dialogue.py — Choix et dialogues reprenables.
+
+Un dialogue qui attend une réponse du joueur ne bloque plus sur input() :
+il est écrit comme un générateur qui cède (yield) un Prompt, puis reprend
+lorsque la ligne suivante du joueur arrive.
+
+Exemple :
+    def talk_marchand(player, game, self_char):
+        game.io.write("1️⃣ Accepter / 2️⃣ Refuser")
+        choix = yield from ask(("1", "2"))
+        ...
+        return "Texte final affiché au joueur."
+
+Les générateurs s'imbriquent avec `yield from`. Le Game conserve le
+générateur suspendu (game.pending) et le relance avec la ligne suivante :
+une partie en attente d'un choix ne mobilise donc aucun thread.
+"""
+
+from types import GeneratorType
+
+
+class Prompt:
+    """
+    Demande de saisie en attente.
+
+    Attributs :
+        choices (tuple[str] | None) : réponses acceptées, ou None si
+                                      n'importe quelle ligne convient.
+    """
+
+    __slots__ = ("choices",)
+
+    def __init__(self, choices=None):
+        """Initialise la demande avec ses éventuelles réponses acceptées."""
+        self.choices = tuple(choices) if choices else None
+
+    def accepts(self, answer: str) -> bool:
+        """Retourne True si la réponse est valide pour cette demande."""
+        return self.choices is None or answer in self.choices
+
+    def __repr__(self):
+        """Représentation lisible (utile pour debug)."""
+        return f"Prompt({self.choices!r})"
+
+
+def ask(choices=None):
+    """
+    Attend une ligne du joueur et la retourne sans espaces superflus.
+
+    Si `choices` est fourni, la question est reposée tant que la réponse
+    ne fait pas partie des choix (comme les anciennes boucles input()).
+    """
+    prompt = Prompt(choices)
+    answer = (yield prompt).strip()
+    while not prompt.accepts(answer):
+        answer = (yield prompt).strip()
+    return answer
+
+
+def resolve(result):
+    """
+    Ramène un résultat d'action à son texte final.
+
+    Les actions et callbacks renvoient soit directement un texte, soit un
+    générateur de dialogue ; dans ce cas ses Prompt sont relayés à l'appelant.
+    """
+    if isinstance(result, GeneratorType):
+        return (yield from result)
+    return result
@@ -26,6 +26,10 @@ class Enemy:
         loot (Item | list[Item]) : objets laissés à la mort.
         boss : compatibilité ancienne (boss=True ⇒ is_boss True).
 
+    Attributs :
+        roster (NamedList|None) : ennemis de la salle qui le contient ;
+                                  sa mort en change la version (voir room.py).
+
     L’ennemi gère lui-même la prise de dégâts via take_damage().
     """
 
@@ -53,6 +57,30 @@ class Enemy:
         # Si None → liste vide
         self.loot = loot or []  # list[Item]
 
+        self.roster = None
+
+    @classmethod
+    def from_spec(cls, name: str, spec: dict, atk_bonus: int = 0):
+        """
+        Crée un ennemi à partir d'une entrée de config (enemies_config ou
+        waves_config) ; le loot éventuel est créé depuis items_config.
+        """
+        loot = spec.get("loot")
+        return cls(
+            name,
+            hp=spec["hp"],
+            atk=spec["atk"] + atk_bonus,
+            defense=spec["defense"],
+            is_boss=spec.get("is_boss", False),
+            loot=[Item.from_config(loot)] if loot else None,
+        )
+
+    @classmethod
+    def from_config(cls, name: str):
+        """Crée un ennemi décrit dans config.enemies_config."""
+        from config import enemies_config
+        return cls.from_spec(name, enemies_config[name])
+
     def is_alive(self) -> bool:
         """Retourne True si l’ennemi est encore en vie (HP > 0)."""
         return self.hp > 0
@@ -76,10 +104,24 @@ class Enemy:
             dmg = max(1, amount - self.defense)
 
         # Mise à jour des points de vie
+        was_alive = self.hp > 0
         self.hp = max(0, self.hp - dmg)
+        if was_alive and self.hp == 0:
+            self._died()
 
         return dmg
 
+    def kill(self):
+        """Tue l’ennemi sur le coup (cheat)."""
+        if self.hp > 0:
+            self.hp = 0
+            self._died()
+
+    def _died(self):
+        """L’ennemi n’est plus affiché dans sa salle : le rendu mémorisé de celle-ci est invalidé."""
+        if self.roster is not None:
+            self.roster.touch()
+
     def __str__(self):
         """Représentation textuelle de l’ennemi (utile pour debug)."""
         return f"{self.name} (HP {self.hp}, ATK {self.atk}, DEF {self.defense})"
@@ -0,0 +1,153 @@
+"""
+eventlog.py — Journal des événements du joueur, borné en mémoire.
+
+Chaque déplacement ajoute une ligne au journal : sur une longue partie
+(serveur, bots), garder toutes les lignes en mémoire ferait croître la
+session indéfiniment. L'EventLog conserve donc :
+
+- les entrées récentes dans un tampon en mémoire (deque),
+- les entrées plus anciennes dans un fichier temporaire en ajout seul,
+  créé seulement lorsque le tampon déborde pour la première fois.
+
+Le fichier n'est ouvert que le temps d'y déverser un lot de
+INDEX_STRIDE entrées ou d'en relire une page : une session ne garde
+aucun descripteur ouvert, quel que soit le nombre de sessions du
+serveur. Les fichiers sont créés dans un dossier temporaire commun,
+supprimé à la fin du processus.
+
+Un index clairsemé (position en octets du début de chaque lot) permet
+de relire n'importe quelle page du fichier sans le parcourir depuis le
+début : la commande "historique <page>" ne lit que la page demandée.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+from collections import deque
+
+
+# Nombre d'entrées gardées en mémoire
+RECENT_CAPACITY = 64
+
+# Entrées déversées sur disque à la fois (une position en octets mémorisée par lot)
+INDEX_STRIDE = 32
+
+# Nombre d'entrées par page d'historique
+PAGE_SIZE = 10
+
+# Dossier commun des fichiers de débordement (créé au premier besoin)
+_SPILL_DIR = None
+
+
+def _spill_path() -> str:
+    """Crée un fichier de débordement vide et retourne son chemin."""
+    global _SPILL_DIR
+    if _SPILL_DIR is None:
+        _SPILL_DIR = tempfile.mkdtemp(prefix="vigilant-journal-")
+        atexit.register(shutil.rmtree, _SPILL_DIR, True)
+    fd, path = tempfile.mkstemp(suffix=".log", dir=_SPILL_DIR)
+    os.close(fd)
+    return path
+
+
+class EventLog:
+    """
+    Journal en ajout seul : tampon récent en mémoire + débordement sur disque.
+
+    Les entrées sont numérotées de 0 (la plus ancienne) à len(log) - 1.
+    """
+
+    __slots__ = ("_recent", "_capacity", "_path", "_offsets", "_spilled")
+
+    def __init__(self, capacity=RECENT_CAPACITY):
+        """Initialise un journal vide (capacity : entrées gardées en mémoire, au plus)."""
+        self._recent = deque()
+        self._capacity = max(capacity, INDEX_STRIDE)
+        self._path = None       # fichier de débordement, créé au premier débordement
+        self._offsets = []      # offsets[k] = position de la ligne k * INDEX_STRIDE
+        self._spilled = 0       # nombre d'entrées déversées sur disque
+
+    # ============================================================
+    # Écriture
+    # ============================================================
+
+    def append(self, message: str):
+        """Ajoute une entrée ; si le tampon est plein, ses INDEX_STRIDE plus anciennes partent sur disque."""
+        recent = self._recent
+        if len(recent) >= self._capacity:
+            self._write_spill([recent.popleft() for _ in range(INDEX_STRIDE)])
+        recent.append(message)
+
+    def _write_spill(self, messages):
+        """Ajoute un lot d'entrées à la fin du fichier de débordement (ouvert puis refermé)."""
+        if self._path is None:
+            self._path = _spill_path()
+        data = "".join(message.replace("\n", " ") + "\n" for message in messages).encode("utf-8")
+        with open(self._path, "ab") as spill:
+            self._offsets.append(spill.tell())
+            spill.write(data)
+        self._spilled += len(messages)
+
+    def close(self):
+        """
+        Supprime le fichier de débordement (son contenu est perdu).
+
+        Le journal ne contient ensuite plus que les entrées récentes en
+        mémoire, renumérotées à partir de 0 : entries() et page() restent
+        utilisables (historique ou instantané demandés après Game.close()).
+        """
+        if self._path is not None:
+            try:
+                os.remove(self._path)
+            except FileNotFoundError:
+                pass
+            self._path = None
+        self._offsets = []
+        self._spilled = 0
+
+    # ============================================================
+    # Lecture
+    # ============================================================
+
+    def __len__(self):
+        """Nombre total d'entrées (mémoire + disque)."""
+        return self._spilled + len(self._recent)
+
+    def entries(self, start=0, stop=None):
+        """
+        Parcourt paresseusement les entrées numérotées de start à stop (exclu).
+
+        Seules les lignes demandées sont lues sur disque, à partir du point
+        d'index le plus proche.
+        """
+        total = len(self)
+        stop = total if stop is None else min(stop, total)
+        start = max(0, start)
+
+        # Partie déversée sur disque
+        if start < self._spilled:
+            block = start // INDEX_STRIDE
+            index = block * INDEX_STRIDE
+            end = min(stop, self._spilled)
+            with open(self._path, "rb") as spill:
+                spill.seek(self._offsets[block])
+                while index < end:
+                    line = spill.readline().decode("utf-8").rstrip("\n")
+                    if index >= start:
+                        yield line
+                    index += 1
+            start = self._spilled
+
+        # Partie récente en mémoire
+        for i in range(start - self._spilled, stop - self._spilled):
+            yield self._recent[i]
+
+    def page_count(self, size=PAGE_SIZE) -> int:
+        """Nombre de pages de `size` entrées."""
+        return max(1, -(-len(self) // size))
+
+    def page(self, number, size=PAGE_SIZE):
+        """Retourne les entrées de la page `number` (1 = la plus ancienne)."""
+        start = (number - 1) * size
+        return list(self.entries(start, start + size))
@@ -0,0 +1,492 @@
+"""
+explorer.py — Exploration exhaustive des embranchements du récit.
+
+Le récit bifurque au crash, chez le marchand, sur les deux choix de Yara,
+sur la dose de nanomédecine, sur l'infiltration ou la révélation et sur
+l'alliance avec Seren Taal ; certains choix dépendent en plus d'un jet
+aléatoire (Game.chance()) et chaque attaque d'une réponse au quiz.
+L'explorateur parcourt tous ces embranchements le long du parcours
+principal (ROUTE) en pilotant des parties sans terminal (NullIO).
+
+Une partie ne se copie pas (les dialogues suspendus sont des
+générateurs) : un état est atteint en rejouant depuis le début la suite
+des décisions qui y mène. Pour éviter un nombre exponentiel de rejeux,
+chaque point de décision est résumé par une empreinte de l'état
+(joueur, salles, dialogue suspendu, position dans le parcours) : deux
+chemins qui mènent au même état ne sont développés qu'une fois. Les
+rejeux d'un même niveau sont répartis sur un pool de processus.
+
+Les décisions explorées :
+    - choix du joueur (menus 1️⃣ / 2️⃣) : équiprobables ; un menu qui
+      accepte toute réponse est exploré avec "1" et "2" (toute autre réponse),
+    - jet du scénario : réussi avec la probabilité demandée par le jeu,
+    - réponse au quiz : juste avec la probabilité p. Par défaut p = 1
+      (joueur qui répond toujours juste) : les combats sont déterministes.
+      Avec 0 < p < 1, chaque attaque devient un embranchement ; les PV
+      restants après une embuscade se propagent à toute la suite et le
+      nombre d'états grandit très vite (réservé aux explorations ciblées).
+
+Le rapport donne, pour chaque fin atteignable, sa probabilité totale et
+le chemin le plus probable qui y mène.
+
+Lancement :
+    python explorer.py --combat cheat --workers 4
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from ai_quiz import AlwaysRight, AlwaysWrong, ask_question
+from enemy import Enemy
+from game import Game
+from gameio import NullIO
+from quizbank import get_bank
+
+
+# Parcours principal, chapitre par chapitre. Une étape "a <ennemi>" est
+# un combat mené jusqu'à la mort de l'ennemi (ou du joueur) ; les choix
+# posés en cours de route (menus, quiz, jets) sont les embranchements.
+ROUTE = (
+    # Chapitre I — Eridani Prime (la transition a lieu à la mort de Vorn)
+    "g E", "g E", "t Marchand", "g E", "a Capitaine Vorn",
+    # Chapitre II — Velyra IX (les choix de Yara sont posés à l'arrivée)
+    "g E", "g E", "g E", "a Drone Sentinel", "p Dose de Nanomédecine",
+    "g E", "a Gouverneur Karn", "",
+    # Chapitre III — Aurelion Prime
+    "g E", "g E", "g E", "a Gardien Blanc", "g E", "a Seren Taal",
+)
+
+# Modes de combat : "cheat" abat les ennemis du parcours d'un coup (seules
+# les embuscades scénarisées sont combattues), "fight" les combat tous.
+COMBAT_MODES = ("cheat", "fight")
+
+# Garde-fou : nombre maximal d'états distincts
+MAX_STATES = 500_000
+
+# Nombre de rejeux envoyés d'un bloc à un processus du pool
+CHUNK_SIZE = 64
+
+# Réponses explorées aux menus qui acceptent toute réponse (le marchand :
+# tout sauf "1" refuse) ; "2" y représente toutes les autres réponses
+OPEN_MENU_ANSWERS = ("1", "2")
+
+# Décisions (jeton, libellé) des quiz et des jets aléatoires
+RIGHT, WRONG = "juste", "faux"
+SUCCESS, FAILURE = "succès", "échec"
+
+
+# ============================================================
+# Empreinte d'un état
+# ============================================================
+
+def _freeze(value):
+    """Résumé hachable d'une valeur (PV des ennemis, compteurs, listes…)."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enemy):
+        return ("ennemi", value.name, value.hp)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    # Game, Player, salles… : déjà couverts par l'empreinte globale
+    return type(value).__name__
+
+
+def _freeze_locals(frame):
+    """
+    Variables locales d'un dialogue suspendu.
+
+    Les textes déjà produits (sorties d'attaque, messages) n'influencent
+    pas la suite : les chaînes de premier niveau sont ignorées, sinon deux
+    combats arrivés aux mêmes PV par des coups différents ne fusionneraient
+    jamais.
+    """
+    return tuple(sorted(
+        (name, _freeze(value))
+        for name, value in frame.f_locals.items()
+        if not isinstance(value, str)
+    ))
+
+
+# Dialogues dont les variables locales ne comptent pas : la question
+# tirée par le quiz ne change pas la suite, seule la réponse compte.
+_OPAQUE = {ask_question.__code__}
+
+
+def _suspension(gen):
+    """Pile des dialogues suspendus (générateurs imbriqués par yield from)."""
+    stack = []
+    while gen is not None and getattr(gen, "gi_frame", None) is not None:
+        frame = gen.gi_frame
+        local = () if gen.gi_code in _OPAQUE else _freeze_locals(frame)
+        stack.append((gen.gi_code.co_qualname, frame.f_lineno, local))
+        gen = gen.gi_yieldfrom
+    return tuple(stack)
+
+
+def state_key(game, step, where=()):
+    """
+    Empreinte d'un point de décision, identique dans tous les processus.
+
+    Sont pris en compte : statistiques, drapeaux et inventaire du joueur,
+    salle courante, contenu des salles visitées du chapitre, dialogue
+    suspendu et position dans le parcours. Le journal, la pile "retour"
+    et le paquet de questions n'influencent pas la suite du parcours et
+    sont ignorés.
+    """
+    player = game.player
+    rooms = tuple(
+        (name, tuple(sorted(item.key for item in state.items)),
+         tuple((e.name, e.hp) for e in state.enemies))
+        for name, state in sorted(game.rooms.items())
+    )
+    key = (
+        step,
+        game.chapter.number,
+        game.running,
+        player.hp, player.max_hp, player.atk, player.defense,
+        player.moral, player.resources, player.reputation,
+        player.flags,
+        tuple(sorted((s.item.key, s.count) for s in player.inventory)),
+        player.current_room.name,
+        rooms,
+        where or _suspension(game.pending),
+    )
+    return hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).digest()
+
+
+# ============================================================
+# Rejeu d'un chemin
+# ============================================================
+
+class _ChanceNode(Exception):
+    """Jet aléatoire atteint au-delà du chemin rejoué."""
+
+    def __init__(self, p, where):
+        """Mémorise la probabilité de succès et le lieu du jet."""
+        super().__init__(p)
+        self.p = p
+        self.where = where
+
+
+class _QuizTape:
+    """
+    Politique de quiz de l'explorateur : laisse chaque question en
+    attente (comme un joueur humain) pour que le pilote y réponde
+    selon le chemin rejoué.
+    """
+
+    def __init__(self):
+        """Aucune question en attente."""
+        self.index = None
+
+    def answer(self, bank, index, rng):
+        """Note la question posée et attend la réponse du pilote."""
+        self.index = index
+        return None
+
+
+class ExplorerGame(Game):
+    """
+    Partie pilotée par l'explorateur.
+
+    Attributs :
+        tape (deque[str]) : décisions restant à rejouer (choix, quiz et jets,
+                            dans l'ordre où la partie les rencontre).
+    """
+
+    def chance(self, p) -> bool:
+        """Rejoue l'issue enregistrée, ou signale un nouvel embranchement."""
+        if p >= 1 or p <= 0:
+            return p >= 1
+        if self.tape:
+            return self.tape.popleft() == SUCCESS
+
+        # Lieu du jet : pile d'appel depuis run_turn()
+        where, frame = [], sys._getframe(1)
+        while frame is not None and frame.f_code is not Game.run_turn.__code__:
+            where.append((frame.f_code.co_qualname, frame.f_lineno, _freeze_locals(frame)))
+            frame = frame.f_back
+        raise _ChanceNode(p, tuple(where))
+
+
+def _menu_name(gen):
+    """Nom du dialogue qui pose le menu en attente (l'appelant de ask())."""
+    names = [name for name, _, _ in _suspension(gen) if not name.endswith("ask")]
+    return names[-1].rsplit(".", 1)[-1]
+
+
+def _ending(game):
+    """Libellé de la fin atteinte par une partie terminée."""
+    player = game.player
+    if not player.is_alive():
+        return f"Mort — {player.current_room.name}"
+    if player.ap_taal_alliance:
+        return "Fin sombre — alliance avec Seren Taal"
+    if not game.running:
+        return "Fin heureuse — la liberté renaît"
+    return f"Parcours achevé sans fin — {player.current_room.name}"
+
+
+def _replay(task):
+    """
+    Rejoue un chemin jusqu'au point de décision suivant (exécuté dans le pool).
+
+    task : (path, p, combat) ; path est la suite des décisions, la première
+    étant le choix du crash.
+
+    Retour :
+        (empreinte, nœud) avec nœud :
+            ("fin", libellé)
+            ("choix", lieu, [(jeton, probabilité), ...])
+    """
+    path, p, combat = task
+    if not path:
+        return b"racine", ("choix", "crash", [("1", 0.5), ("2", 0.5)])
+
+    quiz = _QuizTape() if 0 < p < 1 else (AlwaysRight() if p >= 1 else AlwaysWrong())
+    # Graine fixe : un chemin se rejoue à l'identique dans n'importe quel processus
+    game = ExplorerGame.headless("Explorateur", path[0], io=NullIO(), quiz_policy=quiz, seed=0)
+    game.tape = deque(path[1:])
+    bank = get_bank()
+    step = 0
+
+    try:
+        while True:
+            if not game.running or not game.player.is_alive():
+                return state_key(game, step), ("fin", _ending(game))
+
+            # Une question attend une réponse : quiz ou menu
+            if game.pending is not None:
+                if quiz is not None and getattr(quiz, "index", None) is not None:
+                    if not game.tape:
+                        return state_key(game, step), ("choix", "quiz", [(RIGHT, p), (WRONG, 1 - p)])
+                    correct = game.tape.popleft() == RIGHT
+                    line = bank.answer(quiz.index) if correct else ""
+                    quiz.index = None
+                else:
+                    choices = game.prompt.choices or OPEN_MENU_ANSWERS
+                    if not game.tape:
+                        where = _menu_name(game.pending)
+                        return state_key(game, step), ("choix", where, [(c, 1 / len(choices)) for c in choices])
+                    line = game.tape.popleft()
+                try:
+                    game.run_turn(line)
+                except _ChanceNode as node:
+                    return state_key(game, step, node.where), ("choix", "jet", [(SUCCESS, node.p), (FAILURE, 1 - node.p)])
+                continue
+
+            if step >= len(ROUTE):
+                return state_key(game, step), ("fin", _ending(game))
+
+            # Étape suivante du parcours
+            command = ROUTE[step]
+            if command.startswith("a "):
+                enemy = game.player.current_room.find_enemy(command[2:])
+                if enemy is None:
+                    step += 1
+                    continue
+                if combat == "cheat":
+                    command = "b " + command[2:]
+            else:
+                step += 1
+            try:
+                game.run_turn(command)
+            except _ChanceNode as node:
+                return state_key(game, step, node.where), ("choix", "jet", [(SUCCESS, node.p), (FAILURE, 1 - node.p)])
+    finally:
+        game.close()
+
+
+# ============================================================
+# Exploration
+# ============================================================
+
+class Ending:
+    """
+    Fin atteignable du récit.
+
+    Attributs :
+        label (str) : nature de la fin.
+        probability (float) : probabilité totale de l'atteindre.
+        path (tuple[str]) : décisions du chemin le plus probable.
+        path_probability (float) : probabilité de ce chemin.
+        states (int) : nombre d'états finaux distincts de cette fin.
+    """
+
+    def __init__(self, label):
+        """Initialise une fin encore jamais atteinte."""
+        self.label = label
+        self.probability = 0.0
+        self.path = ()
+        self.path_probability = 0.0
+        self.states = 0
+
+    def describe_path(self) -> str:
+        """Chemin lisible : choix et jets détaillés, réponses au quiz comptées."""
+        steps, right, wrong = [], 0, 0
+        for where, token in self.path:
+            if where == "quiz":
+                right += token == RIGHT
+                wrong += token == WRONG
+            else:
+                steps.append(f"{where}={token}")
+        if right or wrong:
+            steps.append(f"quiz {right} juste(s) / {wrong} faux")
+        return ", ".join(steps)
+
+    def __repr__(self):
+        """Représentation lisible (utile pour debug)."""
+        return f"Ending({self.label!r}, {self.probability:.4f})"
+
+
+class Exploration:
+    """
+    Graphe des points de décision atteignables, fusionnés par empreinte.
+
+    Attributs :
+        nodes (dict[bytes, tuple]) : nœud de chaque empreinte (voir _replay()).
+        edges (dict[bytes, list]) : (empreinte fille, jeton, lieu, probabilité).
+        replays (int) : nombre de parties rejouées.
+        endings (list[Ending]) : fins atteignables, les plus probables d'abord.
+    """
+
+    def __init__(self, p=1.0, combat="cheat", workers=None):
+        """Prépare une exploration (lancée par run())."""
+        if combat not in COMBAT_MODES:
+            raise ValueError(f"Mode de combat inconnu : {combat!r}")
+        self.p = p
+        self.combat = combat
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.nodes = {}
+        self.edges = {}
+        self.replays = 0
+        self.endings = []
+
+    def run(self):
+        """Explore niveau par niveau puis calcule les probabilités."""
+        root, node = _replay(((), self.p, self.combat))
+        self.nodes[root] = node
+        frontier = [(root, ())]
+        pool = ProcessPoolExecutor(self.workers) if self.workers > 1 else None
+        try:
+            while frontier:
+                tasks, parents = [], []
+                for key, path in frontier:
+                    kind, where, *rest = self.nodes[key]
+                    for token, prob in rest[0]:
+                        tasks.append((path + (token,), self.p, self.combat))
+                        parents.append((key, token, where, prob))
+                results = pool.map(_replay, tasks, chunksize=CHUNK_SIZE) if pool else map(_replay, tasks)
+
+                frontier = []
+                for (parent, token, where, prob), task, (key, node) in zip(parents, tasks, results):
+                    self.replays += 1
+                    self.edges.setdefault(parent, []).append((key, token, where, prob))
+                    if key not in self.nodes:
+                        self.nodes[key] = node
+                        if node[0] == "choix":
+                            frontier.append((key, task[0]))
+                if len(self.nodes) > MAX_STATES:
+                    raise RuntimeError(f"Plus de {MAX_STATES} états : exploration interrompue.")
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        self._propagate(root)
+        return self
+
+    def _propagate(self, root):
+        """
+        Probabilités dans le graphe (acyclique) des décisions, par ordre
+        topologique : probabilité totale de chaque état et meilleur chemin.
+        """
+        incoming = dict.fromkeys(self.nodes, 0)
+        for children in self.edges.values():
+            for child, *_ in children:
+                incoming[child] += 1
+
+        mass = dict.fromkeys(self.nodes, 0.0)
+        best = {root: (1.0, None)}          # empreinte → (probabilité, (parent, lieu, jeton))
+        mass[root] = 1.0
+        ready = deque([root])
+        done = 0
+        while ready:
+            key = ready.popleft()
+            done += 1
+            for child, token, where, prob in self.edges.get(key, ()):
+                mass[child] += mass[key] * prob
+                candidate = best[key][0] * prob
+                if child not in best or candidate > best[child][0]:
+                    best[child] = (candidate, (key, where, token))
+                incoming[child] -= 1
+                if not incoming[child]:
+                    ready.append(child)
+        if done != len(self.nodes):
+            raise RuntimeError("Cycle dans le graphe des décisions : empreinte incomplète.")
+
+        endings = {}
+        for key, node in self.nodes.items():
+            if node[0] != "fin":
+                continue
+            ending = endings.get(node[1])
+            if ending is None:
+                ending = endings[node[1]] = Ending(node[1])
+            ending.probability += mass[key]
+            ending.states += 1
+            if best[key][0] > ending.path_probability:
+                ending.path_probability = best[key][0]
+                ending.path = self._best_path(best, key)
+        self.endings = sorted(endings.values(), key=lambda e: -e.probability)
+
+    @staticmethod
+    def _best_path(best, key):
+        """Remonte le chemin le plus probable jusqu'à la racine."""
+        path = []
+        while best[key][1] is not None:
+            key, where, token = best[key][1]
+            path.append((where, token))
+        return tuple(reversed(path))
+
+    def report(self) -> str:
+        """Rapport texte : une entrée par fin atteignable."""
+        lines = [
+            f"États distincts : {len(self.nodes)} | rejeux : {self.replays} | "
+            f"quiz juste avec p = {self.p} | combats : {self.combat}",
+        ]
+        for ending in self.endings:
+            lines.append(f"\n{ending.label} — probabilité {ending.probability:.2%} ({ending.states} état(s) final(aux))")
+            lines.append(f"   chemin le plus probable ({ending.path_probability:.2%}) : {ending.describe_path()}")
+        return "\n".join(lines)
+
+
+def explore(p=1.0, combat="cheat", workers=None):
+    """Explore tous les embranchements et retourne l'Exploration terminée."""
+    return Exploration(p, combat, workers).run()
+
+
+# ============================================================
+# Ligne de commande
+# ============================================================
+
+def main():
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Explorateur des embranchements du récit du Vigilant.")
+    parser.add_argument("--p", type=float, default=1.0, help="probabilité de bien répondre au quiz")
+    parser.add_argument("--combat", choices=COMBAT_MODES, default="cheat",
+                        help="cheat : ennemis du parcours abattus d'un coup ; fight : tous combattus")
+    parser.add_argument("--workers", type=int, help="processus du pool (1 = sans pool)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    exploration = explore(args.p, args.combat, args.workers)
+    print(exploration.report())
+    print(f"\nDurée : {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+fenwick.py — Arbre de Fenwick (arbre binaire indexé) pour tirages pondérés.
+
+Un tirage pondéré naïf parcourt tous les poids : O(n) par tirage et par
+mise à jour de la somme. L'arbre de Fenwick maintient des sommes
+partielles qui permettent, en O(log n) :
+
+- de modifier le poids d'un élément (set),
+- de tirer un élément proportionnellement à son poids (sample).
+
+Les poids sont des entiers : les sommes restent exactes, un élément de
+poids nul n'est jamais tiré.
+"""
+
+import random
+from array import array
+
+
+class FenwickTree:
+    """
+    Poids entiers positifs ou nuls indexés de 0 à size - 1.
+
+    Attributs :
+        size (int) : nombre d'éléments.
+        _tree (array) : sommes partielles (indices 1 à size).
+        _values (array) : poids courant de chaque élément.
+    """
+
+    __slots__ = ("size", "_tree", "_values", "_top")
+
+    def __init__(self, weights):
+        """Construit l'arbre en O(n) à partir des poids initiaux."""
+        values = array("q", weights)
+        size = len(values)
+        tree = array("q", [0]) * (size + 1)
+        for i in range(1, size + 1):
+            tree[i] += values[i - 1]
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self.size = size
+        self._tree = tree
+        self._values = values
+        self._top = 1 << (size.bit_length() - 1) if size else 0
+
+    def __getitem__(self, index):
+        """Poids courant d'un élément."""
+        return self._values[index]
+
+    def set(self, index, weight):
+        """Remplace le poids d'un élément (O(log n))."""
+        delta = weight - self._values[index]
+        if not delta:
+            return
+        self._values[index] = weight
+        tree, size = self._tree, self.size
+        i = index + 1
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def total(self) -> int:
+        """Somme de tous les poids (O(log n))."""
+        tree = self._tree
+        i, s = self.size, 0
+        while i > 0:
+            s += tree[i]
+            i -= i & -i
+        return s
+
+    def find(self, target) -> int:
+        """
+        Retourne l'élément dont l'intervalle cumulé contient `target`.
+
+        0 <= target < total() ; descente dans l'arbre en O(log n).
+        """
+        tree, size = self._tree, self.size
+        pos, mask = 0, self._top
+        while mask:
+            nxt = pos + mask
+            if nxt <= size and tree[nxt] <= target:
+                target -= tree[nxt]
+                pos = nxt
+            mask >>= 1
+        return pos
+
+    def sample(self, rng=random) -> int:
+        """Tire un élément proportionnellement à son poids (total() doit être > 0)."""
+        return self.find(rng.randrange(self.total()))
@@ -0,0 +1,285 @@
+"""
+forecast.py — Prévision exacte d'un combat, sans simulation.
+
+Dans actions.attack, seul le multiplicateur du quiz est aléatoire : une
+attaque inflige R dégâts (bonne réponse, probabilité p) ou W dégâts
+(mauvaise réponse), et l'ennemi riposte toujours de c dégâts :
+
+    base = max(1, ATK joueur - DEF ennemi)
+    R    = max(1, max(1, round(base * 1.5)) - DEF ennemi)
+    W    = max(1, max(1, round(base * 0.5)) - DEF ennemi)
+    c    = max(1, ATK ennemi - DEF joueur)
+
+Après n attaques dont j bonnes réponses, l'ennemi a perdu j*R + (n-j)*W
+PV : il est mort si j atteint un seuil j_min(n). La probabilité de
+l'avoir abattu en n attaques est donc une queue de loi binomiale, et le
+joueur, qui encaisse une riposte après chaque attaque non fatale, dispose
+de N = ceil(PV / c) attaques. On en déduit en forme close :
+
+- la probabilité de victoire P(T <= N),
+- le nombre moyen d'attaques d'une victoire E[T | T <= N],
+- l'espérance E[T] sans tenir compte de la mort du joueur (elle peut
+  dépasser N : ce n'est pas une durée de combat),
+- l'espérance des PV perdus par le joueur.
+
+Seules les attaques que le joueur peut porter avant de mourir sont
+calculées ; E[T] est sommé à part, jusqu'à ce que la queue devienne
+négligeable. Les résultats sont mémorisés (lru_cache) : après le premier
+calcul (quelques millisecondes au plus), une prévision coûte une recherche dans
+le cache. La précision du quiz est arrondie à PRECISION décimales pour
+que les clés du cache restent en nombre fini.
+
+Accès :
+    - en jeu : commande "prevoir <ennemi>" (voir actions.predict),
+    - en Python : forecast(...) ou forecast_fight(player, enemy),
+    - en ligne de commande : python forecast.py --atk 16 --defense 3
+"""
+
+import argparse
+from functools import lru_cache
+from itertools import islice
+from math import exp, lgamma, log, log1p
+
+from ai_quiz import RIGHT_MULTIPLIER, WRONG_MULTIPLIER
+
+
+# Décimales conservées pour la précision du quiz (clé du cache)
+PRECISION = 2
+
+# Précision supposée tant que le joueur n'a répondu à aucune question
+DEFAULT_ACCURACY = 0.5
+
+# Nombre de prévisions gardées en cache
+CACHE_SIZE = 4096
+
+# P(T > n) en deçà de laquelle la somme de E[T] est arrêtée
+TAIL_EPSILON = 1e-12
+
+
+class Forecast:
+    """
+    Issue attendue d'un combat.
+
+    Attributs :
+        win_probability (float) : probabilité d'abattre l'ennemi avant de mourir.
+        expected_turns_to_win (float|None) : nombre moyen d'attaques des combats
+                                             gagnés, E[T | T <= max_turns]
+                                             (None si la victoire est impossible).
+        unbounded_expected_turns (float) : E[T], nombre moyen d'attaques pour
+                                           abattre l'ennemi si le joueur ne
+                                           pouvait pas mourir.
+        expected_damage (float) : PV perdus en moyenne par le joueur (mort comprise).
+        max_turns (int|None) : attaques possibles avant la mort (None : aucune riposte).
+        hp (int) : PV du joueur au début du combat.
+    """
+
+    __slots__ = ("win_probability", "expected_turns_to_win", "unbounded_expected_turns",
+                 "expected_damage", "max_turns", "hp")
+
+    def __init__(self, win_probability, expected_turns_to_win, unbounded_expected_turns,
+                 expected_damage, max_turns, hp):
+        """Enregistre les résultats d'un calcul de forecast()."""
+        self.win_probability = win_probability
+        self.expected_turns_to_win = expected_turns_to_win
+        self.unbounded_expected_turns = unbounded_expected_turns
+        self.expected_damage = expected_damage
+        self.max_turns = max_turns
+        self.hp = hp
+
+    @property
+    def expected_hp_left(self) -> float:
+        """PV restants en moyenne à la fin du combat (0 en cas de mort)."""
+        return self.hp - self.expected_damage
+
+    def __repr__(self):
+        """Représentation lisible (utile pour debug)."""
+        return (
+            f"Forecast(victoire={self.win_probability:.4f}, tours_victoire={_turns(self.expected_turns_to_win)}, "
+            f"tours_sans_mort={self.unbounded_expected_turns:.2f}, dégâts={self.expected_damage:.2f})"
+        )
+
+
+def _turns(value):
+    """Nombre moyen d'attaques formaté ("-" si la victoire est impossible)."""
+    return "-" if value is None else f"{value:.2f}"
+
+
+# ============================================================
+# Calcul
+# ============================================================
+
+def hits(atk, enemy_def):
+    """Dégâts réellement infligés par une bonne et une mauvaise réponse (R, W)."""
+    base = max(1, atk - enemy_def)
+    right = max(1, int(round(base * RIGHT_MULTIPLIER)))
+    wrong = max(1, int(round(base * WRONG_MULTIPLIER)))
+    return max(1, right - enemy_def), max(1, wrong - enemy_def)
+
+
+def _binomial(n, j, log_p, log_q):
+    """P(X_n = j) pour une loi binomiale B(n, p), avec log_p = log(p) et log_q = log(1 - p)."""
+    if j < 0 or j > n:
+        return 0.0
+    return exp(lgamma(n + 1) - lgamma(j + 1) - lgamma(n - j + 1) + j * log_p + (n - j) * log_q)
+
+
+def _kill_probabilities(right, wrong, enemy_hp, p):
+    """
+    Génère P(T <= n) pour n = 1 … T_max (T_max : toutes les réponses fausses).
+
+    Avec X_n le nombre de bonnes réponses en n attaques, P(T <= n) est la
+    queue P(X_n >= j_min(n)). Elle est mise à jour d'une attaque à la
+    suivante (la n+1-ième réponse est bonne avec probabilité p), puis
+    étendue aux seuils que l'attaque supplémentaire rend suffisants :
+    O(1) en moyenne par attaque, probabilités binomiales en logarithmes
+    (aucun entier géant, aucun dépassement).
+    """
+    t_max = -(-enemy_hp // wrong)
+    if right == wrong or p in (0.0, 1.0):
+        hit = right if p == 1.0 else wrong
+        for n in range(1, t_max + 1):
+            yield 1.0 if n * hit >= enemy_hp else 0.0
+        return
+
+    log_p, log_q = log(p), log1p(-p)
+
+    # Bonnes réponses nécessaires après n attaques : j*R + (n-j)*W >= PV ennemi
+    def j_min(n):
+        return max(0, -(-(enemy_hp - n * wrong) // (right - wrong)))
+
+    k = j_min(0)
+    tail = 0.0  # P(X_n >= k)
+    for n in range(t_max):
+        tail += p * _binomial(n, k - 1, log_p, log_q)
+        threshold = j_min(n + 1)
+        if threshold > n + 1:
+            tail = 0.0
+        else:
+            tail += sum(_binomial(n + 1, j, log_p, log_q) for j in range(threshold, min(k, n + 2)))
+        k = threshold
+        yield min(1.0, tail)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _kill_cdf(right, wrong, enemy_hp, p, horizon):
+    """
+    cdf[n] = probabilité d'avoir abattu l'ennemi en n attaques au plus,
+    pour n = 0 … min(horizon, T_max) : seules les attaques que le joueur
+    peut encore porter sont calculées.
+    """
+    if enemy_hp <= 0:
+        return (1.0,)
+    return (0.0,) + tuple(islice(_kill_probabilities(right, wrong, enemy_hp, p), horizon))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _unbounded_turns(right, wrong, enemy_hp, p):
+    """
+    E[T] = somme des P(T > n), comme si le joueur ne pouvait pas mourir.
+
+    La somme s'arrête dès que P(T > n) passe sous TAIL_EPSILON : le reste
+    est inférieur à TAIL_EPSILON * T_max.
+    """
+    if enemy_hp <= 0:
+        return 0.0
+    expected = 1.0  # P(T > 0)
+    for cdf in _kill_probabilities(right, wrong, enemy_hp, p):
+        if 1 - cdf < TAIL_EPSILON:
+            break
+        expected += 1 - cdf
+    return expected
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _forecast(atk, defense, hp, enemy_atk, enemy_def, enemy_hp, p):
+    """Calcul en forme close (clé du cache déjà normalisée)."""
+    right, wrong = hits(atk, enemy_def)
+    unbounded = _unbounded_turns(right, wrong, enemy_hp, p)
+
+    riposte = max(1, enemy_atk - defense) if enemy_atk > 0 else 0
+    if hp <= 0:
+        max_turns = 0
+    elif riposte:
+        max_turns = -(-hp // riposte)
+    else:
+        return Forecast(1.0, unbounded, unbounded, 0.0, None, hp)
+
+    # Victoire à l'attaque n : n - 1 ripostes encaissées ; sinon mort (PV perdus = hp)
+    cdf = _kill_cdf(right, wrong, enemy_hp, p, max_turns)
+    reach = len(cdf) - 1
+    win = cdf[reach]
+    kills = [(n, cdf[n] - cdf[n - 1]) for n in range(1, reach + 1)]
+    to_win = sum(n * q for n, q in kills) / win if win > 0 else None
+    damage = sum(q * riposte * (n - 1) for n, q in kills)
+    damage += (1 - win) * max(0, hp)
+    return Forecast(win, to_win, unbounded, damage, max_turns, hp)
+
+
+def forecast(atk, defense, hp, enemy_atk, enemy_def, enemy_hp, p=DEFAULT_ACCURACY) -> Forecast:
+    """
+    Prévision d'un combat à partir des statistiques brutes.
+
+    p (float) : probabilité de bien répondre au quiz (arrondie à PRECISION décimales).
+    """
+    p = min(1.0, max(0.0, round(p, PRECISION)))
+    return _forecast(atk, defense, hp, enemy_atk, enemy_def, enemy_hp, p)
+
+
+def player_accuracy(player) -> float:
+    """Précision observée du joueur au quiz (DEFAULT_ACCURACY sans réponse)."""
+    if not player.ia_questions_answered:
+        return DEFAULT_ACCURACY
+    return player.ia_correct / player.ia_questions_answered
+
+
+def forecast_fight(player, enemy, p=None) -> Forecast:
+    """
+    Prévision d'un combat entre un joueur et un ennemi (PV actuels).
+
+    p (float|None) : précision du quiz ; par défaut celle observée chez le joueur.
+    """
+    if p is None:
+        p = player_accuracy(player)
+    return forecast(player.atk, player.defense, player.hp, enemy.atk, enemy.defense, enemy.hp, p)
+
+
+def cache_info():
+    """Statistiques des caches (prévisions, distributions de durée, puis E[T])."""
+    return _forecast.cache_info(), _kill_cdf.cache_info(), _unbounded_turns.cache_info()
+
+
+# ============================================================
+# Ligne de commande
+# ============================================================
+
+def main():
+    """Point d'entrée en ligne de commande : table des ennemis configurés."""
+    from config import enemies_config, waves_config
+
+    parser = argparse.ArgumentParser(description="Prévision exacte des combats du Vigilant.")
+    parser.add_argument("--hp", type=int, default=100)
+    parser.add_argument("--atk", type=int, default=15)
+    parser.add_argument("--defense", type=int, default=3)
+    parser.add_argument("--p", type=float, nargs="+", default=[0.0, 0.25, 0.5, 0.75, 1.0],
+                        help="précisions du quiz à tabuler")
+    args = parser.parse_args()
+
+    enemies = dict(enemies_config)
+    for waves in waves_config.values():
+        for wave in waves:
+            for spec in wave:
+                enemies.setdefault(spec["name"], spec)
+
+    print(f"Joueur : PV {args.hp} | ATK {args.atk} | DEF {args.defense}")
+    print(f"{'Ennemi':<24}" + "".join(f"{'p = ' + str(p):>22}" for p in args.p))
+    for name, spec in enemies.items():
+        cells = []
+        for p in args.p:
+            f = forecast(args.atk, args.defense, args.hp, spec["atk"], spec["defense"], spec["hp"], p)
+            turns = "-" if f.expected_turns_to_win is None else f"{f.expected_turns_to_win:.1f}"
+            cells.append(f"{f.win_probability:7.1%} {turns:>5}t {f.expected_damage:5.1f}pv")
+        print(f"{name:<24}" + "".join(f"{c:>22}" for c in cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+gameio.py — Backends d'entrées/sorties du jeu.
+
+Le moteur ne dialogue plus directement avec le terminal : il passe par
+un backend d'E/S fourni à la construction du Game. Cela permet de créer
+des parties sans terminal (serveur, simulateur, tests automatisés).
+
+- TerminalIO : affichage sur stdout (tamponné) et saisie avec input(),
+- MemoryIO   : sortie capturée en mémoire, réponses fournies à l'avance,
+- SocketIO   : sortie d'une connexion du serveur multi-sessions,
+- NullIO     : aucune sortie (simulations, bots) ; les cinématiques ne
+               sont même pas construites (voir Game.narrate()).
+
+Un backend expose :
+    write(text)    — ajoute une ligne à la sortie du tour en cours,
+    flush(prompt)  — envoie d'un bloc la sortie en attente (et un prompt),
+    read(prompt)   — renvoie la prochaine ligne saisie (EOFError si aucune),
+    narrates       — False si le texte narratif peut être ignoré.
+
+Les lignes d'un tour sont accumulées puis envoyées en une seule écriture
+par flush(), appelé une fois par tour par la boucle de jeu (ou le serveur).
+"""
+
+import sys
+from collections import deque
+
+
+class TerminalIO:
+    """
+    Backend interactif classique : stdout pour l'affichage, stdin pour la saisie.
+
+    Les lignes sont accumulées et écrites d'un bloc à chaque flush()
+    (donc au plus tard avant chaque saisie).
+    """
+
+    narrates = True
+
+    def __init__(self, stream=None):
+        """Initialise le backend (stdout par défaut)."""
+        self.stream = stream if stream is not None else sys.stdout
+        self._out = []
+
+    def write(self, text: str = ""):
+        """Ajoute une ligne à la sortie en attente."""
+        self._out.append(text + "\n")
+
+    def flush(self, prompt: str = ""):
+        """Écrit toute la sortie en attente (suivie d'un éventuel prompt)."""
+        if prompt:
+            self._out.append(prompt)
+        if self._out:
+            self.stream.write("".join(self._out))
+            self.stream.flush()
+            self._out.clear()
+
+    def read(self, prompt: str = "> ") -> str:
+        """Affiche la sortie en attente puis attend une ligne saisie par le joueur."""
+        self.flush()
+        return input(prompt)
+
+
+class MemoryIO:
+    """
+    Backend sans terminal.
+
+    Attributs :
+        lines (list[str]) : toutes les lignes écrites par le jeu.
+        _answers (deque[str]) : réponses qui seront renvoyées par read().
+
+    Quand plus aucune réponse n'est disponible, read() lève EOFError,
+    exactement comme input() en fin de flux.
+    """
+
+    narrates = True
+
+    def __init__(self, answers=None):
+        """Initialise le backend avec une éventuelle liste de réponses."""
+        self.lines = []
+        self._answers = deque(answers or [])
+
+    def write(self, text: str = ""):
+        """Mémorise une ligne affichée par le jeu."""
+        self.lines.append(text)
+
+    def flush(self, prompt: str = ""):
+        """La sortie est déjà en mémoire : rien à envoyer."""
+
+    def read(self, prompt: str = "> ") -> str:
+        """Renvoie la prochaine réponse préparée."""
+        if not self._answers:
+            raise EOFError
+        return self._answers.popleft()
+
+    def feed(self, *answers):
+        """Ajoute des réponses à la file de lecture."""
+        self._answers.extend(answers)
+
+    def getvalue(self) -> str:
+        """Retourne toute la sortie capturée sous forme d'un seul texte."""
+        return "\n".join(self.lines)
+
+    def clear(self):
+        """Vide la sortie capturée."""
+        self.lines.clear()
+
+
+class SocketIO:
+    """
+    Backend d'une connexion TCP (voir server.py).
+
+    - write() accumule les lignes du tour en cours,
+    - flush() les envoie au client en un seul bloc.
+
+    La lecture est asynchrone et gérée par le serveur : read() n'est pas
+    disponible.
+    """
+
+    narrates = True
+
+    def __init__(self, writer):
+        """Associe le backend au flux de sortie (asyncio.StreamWriter) de la connexion."""
+        self.writer = writer
+        self._out = []
+
+    def write(self, text: str = ""):
+        """Mémorise une ligne à envoyer au client."""
+        self._out.append(text + "\n")
+
+    def flush(self, prompt: str = ""):
+        """Envoie au client tout le texte en attente (suivi d'un éventuel prompt)."""
+        if prompt:
+            self._out.append(prompt)
+        if self._out and not self.writer.is_closing():
+            self.writer.write("".join(self._out).encode("utf-8"))
+        self._out.clear()
+
+    def read(self, prompt: str = "> ") -> str:
+        """Les réponses arrivent par la boucle asyncio du serveur."""
+        raise EOFError
+
+
+class NullIO:
+    """
+    Backend muet pour les simulations : toute sortie est ignorée.
+
+    narrates vaut False : Game.narrate() ne construit même pas le texte
+    des cinématiques, descriptions de transition et rappels d'aide.
+    """
+
+    narrates = False
+
+    def write(self, text: str = ""):
+        """Ignore la ligne."""
+
+    def flush(self, prompt: str = ""):
+        """Rien à envoyer."""
+
+    def read(self, prompt: str = "> ") -> str:
+        """Aucune saisie possible."""
+        raise EOFError
@@ -0,0 +1,135 @@
+"""
+inventory.py — Inventaire empilable du joueur.
+
+Les objets identiques (même prototype, voir item.py) sont regroupés en
+piles (objet + quantité) au lieu d'être stockés un par un. Deux objets
+homonymes aux fiches différentes forment deux piles distinctes : aucun
+ne perd ses caractéristiques. Un index par nom normalisé sert à la
+recherche. Le poids total est tenu à jour à chaque opération, ce qui
+rend en O(1) :
+
+- l'ajout et le retrait (d'un ou de plusieurs exemplaires),
+- la recherche par nom (insensible à la casse et aux accents),
+- la vérification de la capacité de transport (can_carry).
+"""
+
+from names import normalize
+
+
+class Stack:
+    """
+    Pile d'objets identiques.
+
+    Attributs :
+        item (Item) : exemplaire représentatif de la pile.
+        count (int) : nombre d'exemplaires.
+    """
+
+    __slots__ = ("item", "count")
+
+    def __init__(self, item, count):
+        """Initialise une pile."""
+        self.item = item
+        self.count = count
+
+    @property
+    def weight(self):
+        """Poids total de la pile."""
+        return self.item.weight * self.count
+
+
+class Inventory:
+    """
+    Inventaire du joueur : piles indexées par prototype, et par nom normalisé pour la recherche.
+
+    Attributs :
+        max_weight (int) : capacité de transport.
+        current_weight (int) : poids transporté, mis à jour à chaque opération.
+
+    L'itération parcourt les piles (Stack) dans l'ordre d'acquisition.
+    """
+
+    __slots__ = ("_stacks", "_names", "max_weight", "current_weight")
+
+    def __init__(self, max_weight=20):
+        """Initialise un inventaire vide."""
+        self._stacks = {}   # prototype (ItemPrototype) → Stack
+        self._names = {}    # nom normalisé → [Stack] (homonymes, dans l'ordre d'acquisition)
+        self.max_weight = max_weight
+        self.current_weight = 0
+
+    # ============================================================
+    # Capacité
+    # ============================================================
+
+    def can_carry(self, item, count=1) -> bool:
+        """Retourne True si `count` exemplaires de l'objet tiennent dans l'inventaire."""
+        return self.current_weight + item.weight * count <= self.max_weight
+
+    # ============================================================
+    # Ajout / retrait
+    # ============================================================
+
+    def add(self, item, count=1):
+        """Ajoute `count` exemplaires de l'objet (sans contrôle de capacité)."""
+        stack = self._stacks.get(item.proto)
+        if stack is None:
+            stack = self._stacks[item.proto] = Stack(item, count)
+            self._names.setdefault(item.key, []).append(stack)
+        else:
+            stack.count += count
+        self.current_weight += item.weight * count
+
+    def remove(self, item, count=1) -> int:
+        """
+        Retire jusqu'à `count` exemplaires de l'objet (même prototype).
+
+        Retourne le nombre d'exemplaires réellement retirés.
+        """
+        stack = self._stacks.get(item.proto)
+        if stack is None:
+            return 0
+        removed = min(count, stack.count)
+        stack.count -= removed
+        if stack.count == 0:
+            del self._stacks[item.proto]
+            homonyms = self._names[item.key]
+            homonyms.remove(stack)
+            if not homonyms:
+                del self._names[item.key]
+        self.current_weight = max(0, self.current_weight - stack.item.weight * removed)
+        return removed
+
+    def clear(self):
+        """Vide l'inventaire et retourne les piles retirées."""
+        stacks = list(self._stacks.values())
+        self._stacks.clear()
+        self._names.clear()
+        self.current_weight = 0
+        return stacks
+
+    # ============================================================
+    # Recherche
+    # ============================================================
+
+    def find(self, name):
+        """Retourne l'exemplaire représentatif d'un objet (la première pile acquise de ce nom), ou None."""
+        stacks = self._names.get(normalize(name))
+        return stacks[0].item if stacks else None
+
+    def count(self, name) -> int:
+        """Nombre d'exemplaires possédés d'un objet (toutes piles de ce nom)."""
+        return sum(stack.count for stack in self._names.get(normalize(name), ()))
+
+    def __iter__(self):
+        """Parcourt les piles dans l'ordre d'acquisition."""
+        return iter(list(self._stacks.values()))
+
+    def __len__(self):
+        """Nombre de piles différentes."""
+        return len(self._stacks)
+
+    def __repr__(self):
+        """Représentation lisible (utile pour debug)."""
+        content = ", ".join(f"{s.item.name} x{s.count}" for s in self._stacks.values())
+        return f"Inventory([{content}], {self.current_weight}/{self.max_weight} kg)"
@@ -8,14 +8,95 @@ Un Item représente un objet manipulable dans le jeu :
 
 Ce module est volontairement minimaliste : il agit comme un conteneur de données
 que les actions (dans actions.py) interprètent.
+
+Poids mouche (flyweight) :
+    les données d'un objet (nom, description, effet, poids…) sont portées
+    par un ItemPrototype partagé et interné : toutes les "Trousse Médicale"
+    de toutes les parties pointent vers la même fiche. Une instance d'Item
+    ne contient qu'une référence vers son prototype, son identité suffisant
+    à distinguer deux exemplaires posés dans une salle.
+
+    Les prototypes des objets du jeu sont décrits dans config.items_config
+    et s'obtiennent avec Item.from_config(nom).
 """
 
+from names import normalize
+
+
+class ItemPrototype:
+    """
+    Fiche partagée (immuable) décrivant un type d'objet.
+
+    Attributs :
+        name, description, effect_type, value, usable, weight : voir Item.
+        key (str) : nom normalisé (clé des index par nom).
+    """
+
+    __slots__ = ("name", "description", "effect_type", "value", "usable", "weight", "key")
+
+    def __init__(self, name, description, effect_type, value, usable, weight):
+        """Initialise la fiche (à créer via intern_prototype())."""
+        for attr, val in (("name", name), ("description", description),
+                          ("effect_type", effect_type), ("value", value),
+                          ("usable", usable), ("weight", weight),
+                          ("key", normalize(name))):
+            object.__setattr__(self, attr, val)
+
+    def __setattr__(self, attr, value):
+        """Les prototypes sont partagés entre toutes les parties : lecture seule."""
+        raise AttributeError("ItemPrototype est immuable.")
+
+    def fields(self):
+        """Tuple des données de la fiche (clé d'internement)."""
+        return (self.name, self.description, self.effect_type,
+                self.value, self.usable, self.weight)
+
+    def __repr__(self):
+        """Représentation lisible (utile pour debug)."""
+        return f"ItemPrototype({self.name!r})"
+
+
+# Prototypes internés : données complètes → fiche unique
+_INTERNED = {}
+
+# Prototypes issus de config.items_config, indexés par nom normalisé
+_CONFIG = {}
+
+
+def intern_prototype(name, description, effect_type="misc", value=0, usable=False, weight=1):
+    """Retourne la fiche unique correspondant à ces données (créée au besoin)."""
+    fields = (name, description, effect_type, value, usable, weight)
+    proto = _INTERNED.get(fields)
+    if proto is None:
+        proto = _INTERNED[fields] = ItemPrototype(*fields)
+    return proto
+
+
+def get_prototype(name):
+    """
+    Retourne la fiche d'un objet décrit dans config.items_config.
+
+    Lève KeyError si l'objet n'y figure pas.
+    """
+    if not _CONFIG:
+        from config import items_config
+        for item_name, data in items_config.items():
+            _CONFIG[normalize(item_name)] = intern_prototype(
+                item_name,
+                data["description"],
+                data.get("effect_type", "misc"),
+                data.get("value", 0),
+                data.get("usable", False),
+                data.get("weight", 1),
+            )
+    return _CONFIG[normalize(name)]
+
 
 class Item:
     """
     Représente un objet du jeu.
 
-    Attributs :
+    Attributs (lus sur le prototype partagé) :
         name (str) :
             Nom de l'objet tel qu'il apparaît dans l'inventaire et dans les rooms.
 
@@ -40,10 +121,15 @@ class Item:
         weight (int) :
             Poids en kilogrammes, pour gérer la capacité de transport du joueur.
 
+        proto (ItemPrototype) :
+            Fiche partagée portant toutes les données ci-dessus.
+
     Aucun comportement n'est codé ici : l'objet est une simple "fiche"
     que d'autres modules manipulent.
     """
 
+    __slots__ = ("proto",)
+
     def __init__(
         self,
         name: str,
@@ -53,13 +139,24 @@ class Item:
         usable: bool = False,
         weight: int = 1,
     ):
-        """Initialise un objet avec ses propriétés principales."""
-        self.name = name
-        self.description = description
-        self.effect_type = effect_type  # ex. "heal", "def", "quest"
-        self.value = value
-        self.usable = usable
-        self.weight = weight
+        """Initialise un objet en le rattachant au prototype interné correspondant."""
+        self.proto = intern_prototype(name, description, effect_type, value, usable, weight)
+
+    @classmethod
+    def from_config(cls, name: str):
+        """Crée un exemplaire d'un objet décrit dans config.items_config."""
+        item = cls.__new__(cls)
+        item.proto = get_prototype(name)
+        return item
+
+    # Accès en lecture aux données du prototype
+    name = property(lambda self: self.proto.name)
+    description = property(lambda self: self.proto.description)
+    effect_type = property(lambda self: self.proto.effect_type)
+    value = property(lambda self: self.proto.value)
+    usable = property(lambda self: self.proto.usable)
+    weight = property(lambda self: self.proto.weight)
+    key = property(lambda self: self.proto.key)
 
     def __str__(self):
         """Affichage lisible de l'objet (inventaire, sol, débug…)."""
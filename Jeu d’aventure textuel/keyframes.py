@@ -0,0 +1,235 @@
+"""
+keyframes.py — Instantanés périodiques des parties enregistrées.
+
+Rejouer une bande (tape.py) jusqu'au tour N coûte N tours. Pendant
+l'enregistrement, un instantané compact de l'état de la partie est donc
+ajouté à la bande tous les KEYFRAME_INTERVAL tours :
+
+    - statistiques, drapeaux, inventaire et statistiques IA du joueur,
+    - chapitre, salle courante et pile "retour",
+    - contenu propre à la session des salles visitées (objets, ennemis et
+      leurs PV), ennemi combattu,
+    - état du générateur aléatoire et du paquet de questions,
+    - position dans les réponses enregistrées du quiz.
+
+Pour atteindre le tour N, replay.seek() restaure l'instantané le plus
+proche (Game.from_keyframe) puis ne rejoue que les tours restants.
+
+Un instantané n'est pris qu'entre deux tours, lorsqu'aucun dialogue
+n'attend de réponse (game.pending vide) : un dialogue suspendu est un
+générateur, impossible à sérialiser. Pour rester compacts, les
+instantanés ne répètent pas ce qui n'a pas changé depuis le précédent :
+le journal n'y figure que par ses nouvelles entrées, le générateur
+aléatoire et le paquet de questions seulement s'ils ont changé (la
+restauration remonte alors aux instantanés précédents).
+"""
+
+import base64
+import struct
+
+from ai_quiz import TapePolicy
+from enemy import Enemy
+from item import Item, get_prototype, intern_prototype
+from player import Player
+from quizbank import AdaptiveDeck, get_bank
+
+
+# Tours entre deux instantanés (par défaut)
+KEYFRAME_INTERVAL = 50
+
+# Statistiques du joueur copiées telles quelles
+PLAYER_STATS = (
+    "hp", "max_hp", "atk", "defense", "moral", "resources", "reputation",
+    "max_weight", "flags", "flags_seen",
+    "ia_correct", "ia_wrong", "ia_questions_answered",
+)
+
+
+# ============================================================
+# Objets, ennemis, générateur aléatoire
+# ============================================================
+
+def _item_state(item):
+    """Nom d'un objet de config.items_config, sinon toutes les données de sa fiche."""
+    try:
+        if get_prototype(item.name) is item.proto:
+            return item.name
+    except KeyError:
+        pass
+    return list(item.proto.fields())
+
+
+def _make_item(state):
+    """Recrée un objet noté par _item_state()."""
+    if isinstance(state, str):
+        return Item.from_config(state)
+    item = Item.__new__(Item)
+    item.proto = intern_prototype(*state)
+    return item
+
+
+def _enemy_state(enemy):
+    """Données d'un ennemi : nom, PV, ATK, DEF, boss, loot."""
+    return [enemy.name, enemy.hp, enemy.atk, enemy.defense, enemy.is_boss,
+            [_item_state(item) for item in enemy.loot]]
+
+
+def _make_enemy(state):
+    """Recrée un ennemi noté par _enemy_state()."""
+    name, hp, atk, defense, is_boss, loot = state
+    return Enemy(name, hp, atk, defense, is_boss, [_make_item(i) for i in loot])
+
+
+def _rng_state(rng):
+    """État du random.Random de la partie (mots de 32 bits du Mersenne Twister, en base64)."""
+    version, internal, gauss = rng.getstate()
+    packed = struct.pack(f">{len(internal)}I", *internal)
+    return [version, base64.b64encode(packed).decode("ascii"), gauss]
+
+
+def _set_rng_state(rng, state):
+    """Restaure un état noté par _rng_state()."""
+    version, internal, gauss = state
+    packed = base64.b64decode(internal)
+    rng.setstate((version, struct.unpack(f">{len(packed) // 4}I", packed), gauss))
+
+
+# ============================================================
+# Prise des instantanés
+# ============================================================
+
+class KeyframeWriter:
+    """
+    Ajoute des instantanés à la bande d'une partie en cours d'enregistrement.
+
+    Attributs :
+        tape (Tape) : bande de la partie.
+        interval (int) : tours entre deux instantanés.
+        _since (int) : tours joués depuis le dernier instantané.
+        _log_size (int) : entrées du journal déjà notées.
+        _rng / _deck : derniers états notés du générateur et du paquet.
+    """
+
+    __slots__ = ("tape", "interval", "_since", "_log_size", "_rng", "_deck")
+
+    def __init__(self, tape, interval=KEYFRAME_INTERVAL):
+        """Prépare l'écriture (aucun instantané avant `interval` tours)."""
+        if interval < 1:
+            raise ValueError(f"Intervalle d'instantanés invalide : {interval!r}")
+        self.tape = tape
+        self.interval = interval
+        self._since = 0
+        self._log_size = 0
+        self._rng = None
+        self._deck = None
+
+    def after_turn(self, game):
+        """Appelée par Game.run_turn() : prend un instantané quand il est dû."""
+        self._since += 1
+        if self._since >= self.interval and game.pending is None:
+            self.tape.keyframes.append([len(self.tape.lines), self.capture(game)])
+            self._since = 0
+
+    def capture(self, game) -> dict:
+        """Instantané de la partie (différences avec le précédent pour le journal, l'aléa et le quiz)."""
+        player = game.player
+        enemy = game.current_enemy
+        room = player.current_room
+        state = {
+            "quiz": len(self.tape.quiz),
+            "chapter": game.chapter.number,
+            "running": game.running,
+            "in_combat": game.in_combat,
+            "room": room.name,
+            "history": [r.name for r in player.room_history],
+            "rooms": {name: _room_content(rs) for name, rs in game.rooms.items()},
+            "player": {stat: getattr(player, stat) for stat in PLAYER_STATS},
+            "inventory": [[_item_state(s.item), s.count] for s in player.inventory],
+        }
+
+        # Ennemi combattu : rang dans la salle courante, ou ennemi complet
+        if enemy is None:
+            state["enemy"] = None
+        elif enemy in room.enemies:
+            state["enemy"] = list(room.enemies).index(enemy)
+        else:
+            state["enemy"] = _enemy_state(enemy)
+
+        log = player.event_log
+        state["log"] = list(log.entries(self._log_size))
+        self._log_size = len(log)
+
+        rng = _rng_state(game.rng)
+        if rng != self._rng:
+            state["rng"] = self._rng = rng
+        deck = player.quiz_deck.getstate() if player.quiz_deck is not None else None
+        if deck != self._deck:
+            state["deck"] = self._deck = deck
+        return state
+
+
+def _room_content(room_state):
+    """Contenu propre à la session d'une salle ([objets, ennemis], None : celui du modèle)."""
+    items, enemies = room_state.session_content()
+    return [
+        None if items is None else [_item_state(i) for i in items],
+        None if enemies is None else [_enemy_state(e) for e in enemies],
+    ]
+
+
+# ============================================================
+# Restauration
+# ============================================================
+
+def _latest(keyframes, index, key):
+    """Dernière valeur notée pour `key` dans les instantanés 0 … index (None si jamais notée)."""
+    for _, state in reversed(keyframes[:index + 1]):
+        if key in state:
+            return state[key]
+    return None
+
+
+def restore(game, tape, index):
+    """
+    Remet une partie fraîchement préparée (Game._setup) dans l'état de
+    l'instantané `index` de la bande (voir Game.from_keyframe()).
+    """
+    keyframes = tape.keyframes
+    state = keyframes[index][1]
+    game.quiz_policy = TapePolicy(tape.quiz[state["quiz"]:])
+
+    game._enter_chapter(state["chapter"])
+    rooms = game.chapter.rooms
+    for name, (items, enemies) in state["rooms"].items():
+        game.room_state(rooms[name]).restore_content(
+            None if items is None else [_make_item(i) for i in items],
+            None if enemies is None else [_make_enemy(e) for e in enemies],
+        )
+
+    room = game.room_state(rooms[state["room"]])
+    player = game.player = Player(tape.captain_name, room)
+    for stat, value in state["player"].items():
+        setattr(player, stat, value)
+    for item, count in state["inventory"]:
+        player.add_item(_make_item(item), count)
+    player.room_history = [game.room_state(rooms[name]) for name in state["history"]]
+    for _, previous in keyframes[:index + 1]:
+        for entry in previous["log"]:
+            player.log(entry)
+
+    rng = _latest(keyframes, index, "rng")
+    if rng is not None:
+        _set_rng_state(game.rng, rng)
+    deck = _latest(keyframes, index, "deck")
+    if deck is not None:
+        player.quiz_deck = AdaptiveDeck(get_bank(), game.rng)
+        player.quiz_deck.setstate(deck)
+
+    enemy = state["enemy"]
+    if isinstance(enemy, int):
+        enemy = list(room.enemies)[enemy]
+    elif enemy is not None:
+        enemy = _make_enemy(enemy)
+    game.current_enemy = enemy
+    game.in_combat = state["in_combat"]
+    game.running = state["running"]
@@ -0,0 +1,153 @@
+"""
+names.py — Normalisation des noms et collections indexées par nom.
+
+Le joueur tape les noms comme il veut : "cle astrale", "CLÉ  Astrale",
+"module d’énergie stabilisé"… Ce module fournit :
+
+- normalize() : forme canonique d'un nom (casse repliée, accents retirés,
+  apostrophes typographiques unifiées, espaces compactés),
+- NamedList : collection d'entités nommées (objets, PNJ, ennemis) qui
+  maintient un index nom normalisé → entités, mis à jour à chaque ajout
+  ou retrait. Une recherche par nom ne parcourt donc plus toute la liste.
+  Son numéro de version change à chaque modification (cache de rendu
+  des salles, voir room.py).
+"""
+
+import unicodedata
+from itertools import count
+
+
+# Apostrophes et guillemets simples ramenés à l'apostrophe droite
+_APOSTROPHES = str.maketrans({"’": "'", "‘": "'", "ʼ": "'", "`": "'"})
+
+# Signes diacritiques combinants (accents) supprimés après décomposition NFKD
+_COMBINING = {
+    cp: None
+    for start, end in ((0x0300, 0x0370), (0x1AB0, 0x1B00), (0x1DC0, 0x1E00),
+                       (0x20D0, 0x2100), (0xFE20, 0xFE30))
+    for cp in range(start, end)
+    if unicodedata.combining(chr(cp))
+}
+
+# Numéros de version, uniques pour tout le processus
+_VERSIONS = count()
+
+
+def normalize(name: str) -> str:
+    """
+    Retourne la forme canonique d'un nom, utilisée comme clé de recherche.
+
+    Exemple :
+        normalize("  Clé   Astrale ") == normalize("cle astrale") == "cle astrale"
+    """
+    name = name.translate(_APOSTROPHES)
+    if name.isascii():   # cas le plus fréquent : ni accent ni ligature
+        return " ".join(name.lower().split())
+    name = unicodedata.normalize("NFKD", name).translate(_COMBINING)
+    return " ".join(name.casefold().split())
+
+
+class NamedList:
+    """
+    Collection ordonnée d'entités possédant un attribut `name`.
+
+    - add() / remove() en O(1),
+    - find() en O(1) (plus le nombre d'homonymes),
+    - itération dans l'ordre d'ajout, comme une liste.
+
+    Plusieurs entités peuvent porter le même nom (ex : deux "Drone éclaireur") :
+    find() retourne la première, éventuellement filtrée par un prédicat.
+
+    Une collection figée (frozen=True) refuse toute modification : elle
+    sert au contenu des salles modèles partagées (voir room.py).
+
+    `version` change à chaque modification (ou touch()) et n'est jamais
+    réutilisé, même par une autre collection : (id(collection), version)
+    identifie un contenu sans le parcourir.
+    """
+
+    __slots__ = ("_entities", "_index", "_frozen", "version")
+
+    def __init__(self, entities=(), frozen=False):
+        """Initialise la collection avec d'éventuelles entités."""
+        self._entities = {}   # id(entité) → entité, ordre d'ajout conservé
+        self._index = {}      # nom normalisé → [entités]
+        self._frozen = False
+        for entity in entities:
+            self.add(entity)
+        self._frozen = frozen
+        self.version = next(_VERSIONS)
+
+    @property
+    def frozen(self) -> bool:
+        """True si la collection est figée (contenu d'une salle modèle)."""
+        return self._frozen
+
+    def add(self, entity):
+        """Ajoute une entité à la collection."""
+        if self._frozen:
+            raise TypeError("Collection figée : contenu partagé non modifiable.")
+        self._entities[id(entity)] = entity
+        self._index.setdefault(normalize(entity.name), []).append(entity)
+        self.version = next(_VERSIONS)
+
+    def remove(self, entity) -> bool:
+        """Retire une entité (comparée par identité). Retourne True si elle était présente."""
+        if self._frozen:
+            raise TypeError("Collection figée : contenu partagé non modifiable.")
+        if self._entities.pop(id(entity), None) is None:
+            return False
+        key = normalize(entity.name)
+        bucket = self._index[key]
+        for i, other in enumerate(bucket):
+            if other is entity:
+                del bucket[i]
+                break
+        if not bucket:
+            del self._index[key]
+        self.version = next(_VERSIONS)
+        return True
+
+    def touch(self):
+        """Change la version sans modifier le contenu (ex : un ennemi de la collection est mort)."""
+        self.version = next(_VERSIONS)
+
+    def find(self, name, predicate=None):
+        """
+        Recherche une entité par nom (insensible à la casse et aux accents).
+
+        predicate : filtre optionnel, ex. lambda e: e.is_alive().
+        Retourne None si aucune entité ne correspond.
+        """
+        for entity in self._index.get(normalize(name), ()):
+            if predicate is None or predicate(entity):
+                return entity
+        return None
+
+    def find_all(self, name, predicate=None):
+        """Retourne toutes les entités portant ce nom (liste éventuellement vide)."""
+        return [e for e in self._index.get(normalize(name), ())
+                if predicate is None or predicate(e)]
+
+    def copy(self):
+        """Retourne une copie modifiable (les entités elles-mêmes ne sont pas copiées)."""
+        clone = NamedList()
+        clone._entities = dict(self._entities)
+        clone._index = {key: list(bucket) for key, bucket in self._index.items()}
+        return clone
+
+    def __iter__(self):
+        """Parcourt les entités dans l'ordre d'ajout."""
+        return iter(self._entities.values())
+
+    def __len__(self):
+        """Nombre d'entités."""
+        return len(self._entities)
+
+    def __contains__(self, entity):
+        """True si cette entité (par identité) est présente."""
+        return id(entity) in self._entities
+
+    def __repr__(self):
+        """Représentation lisible (utile pour debug)."""
+        return f"NamedList({[e.name for e in self]!r})"
@@ -12,10 +12,89 @@ Le Player agit comme le conteneur central de l’état du jeu.
 Toutes les actions (combat, déplacements, utilisation d’objets) s’appuient sur lui.
 """
 
+from eventlog import EventLog
+from inventory import Inventory
+
+
+# ============================================================
+# Registre des drapeaux de scénario
+# ============================================================
+#
+# Chaque drapeau occupe un bit d'un unique entier (Player._flags).
+# Un accesseur booléen est généré pour chacun : player.met_yara se lit
+# et s'affecte comme un attribut ordinaire. Copier, comparer ou hacher
+# l'ensemble des drapeaux revient à manipuler un seul entier (Player.flags).
+#
+# Pour ajouter un drapeau : une ligne (nom, valeur initiale) ci-dessous.
+
+FLAGS = (
+    # --- Monde 1 : Eridani Prime ---
+    ("has_translator", False),
+    ("has_crystal", False),
+    ("merchant_deal_done", False),
+    ("merchant_sacrifice", False),
+    ("merchant_refused", False),
+    ("met_yara", False),
+    ("met_ralen", False),
+    ("vorn_defeated", False),
+
+    # --- Monde 2 : Velyra IX ---
+    # Étapes de la campagne
+    ("world2_started", False),
+    ("velyra_intro_done", False),
+    ("velyra_surprise_done", False),
+    # Choix stratégiques
+    ("velyra_study_first", False),          # Étudier la planète d’abord
+    ("velyra_attack_first", False),         # Attaquer immédiatement
+    # Choix moraux / missions
+    ("velyra_robbed_civilians", False),     # a pillé les civils
+    ("velyra_corrupted_general", False),    # a tenté/ réussi à corrompre un général
+    ("velyra_missiles_obtained", False),    # a obtenu le contrôle des missiles
+    ("velyra_prison_liberated", False),     # prison centrale libérée
+    ("velyra_karn_defeated", False),        # boss Karn vaincu
+    # Destin de Yara / Narek
+    ("yara_alive", True),
+    ("narek_alive", False),                 # devient True après libération
+
+    # --- Monde 3 : Aurelion Prime ---
+    ("aurelion_ready", False),              # transition vers le monde 3 demandée
+    ("world3_started", False),
+    ("aurelion_surprise_done", False),
+    ("ap_choice_infiltrate", False),
+    ("ap_choice_reveal", False),
+    ("ap_guardians_cleared", False),
+    ("ap_break_illusions", False),
+    ("ap_keep_illusions", False),
+    ("ap_cleared_node", False),
+    ("ap_taal_confronted", False),
+    ("ap_taal_dead", False),
+    ("ap_taal_alliance", False),
+)
+
+# Nom du drapeau → masque de son bit
+FLAG_BITS = {name: 1 << i for i, (name, _) in enumerate(FLAGS)}
+
+# Valeur initiale de l'entier des drapeaux
+DEFAULT_FLAGS = sum(FLAG_BITS[name] for name, default in FLAGS if default)
+
+
+def flag_names(mask: int):
+    """Retourne les noms des drapeaux dont le bit est présent dans `mask`."""
+    return [name for name, bit in FLAG_BITS.items() if mask & bit]
+
 
 class Player:
     """Représente le joueur et toutes ses données de progression."""
 
+    __slots__ = (
+        "name",
+        "hp", "max_hp", "atk", "defense", "moral", "resources", "reputation",
+        "inventory",
+        "current_room", "_room_history", "_event_log",
+        "ia_correct", "ia_wrong", "ia_questions_answered", "quiz_deck",
+        "_flags", "_flags_seen",
+    )
+
     def __init__(self, name: str, start_room):
         """
         Initialise un nouveau joueur.
@@ -36,72 +115,62 @@ class Player:
         self.reputation = 0
 
         # --- Inventaire ---
-        self.inventory = []
-        self.max_weight = 20
-        self.current_weight = 0
+        self.inventory = Inventory(max_weight=20)   # piles indexées par prototype (recherche par nom)
 
         # --- Position & historique ---
         self.current_room = start_room
         self._room_history = []   # pile des salles traversées ("retour")
-        self._event_log = []      # journal textuel des actions importantes
-
-        # --- Monde 1 : Eridani Prime ---
-        self.has_translator = False
-        self.has_crystal = False
-
-        self.merchant_deal_done = False
-        self.merchant_sacrifice = False
-        self.merchant_refused = False
-
-        self.met_yara = False
-        self.met_ralen = False
-        self.vorn_defeated = False
-        
-        
-        self.world2_started = False
-        self.velyra_intro_done = False
-        
-        # --- Monde 2 : Velyra IX ---
-        # Étapes de la campagne
-        self.velyra_intro_done = False
-        self.velyra_surprise_done = False
-
-
-        # Choix stratégiques
-        self.velyra_study_first = False      # Étudier la planète d’abord
-        self.velyra_attack_first = False     # Attaquer immédiatement
-
-        # Choix moraux / missions
-        self.velyra_robbed_civilians = False     # a pillé les civils
-        self.velyra_corrupted_general = False    # a tenté/ réussi à corrompre un général
-        self.velyra_missiles_obtained = False    # a obtenu le contrôle des missiles
-        self.velyra_prison_liberated = False     # prison centrale libérée
-        self.velyra_karn_defeated = False        # boss Karn vaincu
-
-        # Destin de Yara / Narek
-        self.yara_alive = True
-        self.narek_alive = False  # devient True après libération
-        
-        # --- Monde 3 : Aurelion Prime ---
-        self.world3_started = False
-
-        self.ap_choice_infiltrate = False
-        self.ap_choice_reveal = False
-
-        self.ap_break_illusions = False
-        self.ap_keep_illusions = False
-
-        self.ap_cleared_node = False
-
-        self.ap_taal_confronted = False
-        self.ap_taal_dead = False
-        self.ap_taal_alliance = False
-
-        
+        self._event_log = EventLog()   # journal textuel des actions importantes (borné en mémoire)
+
+        # --- Drapeaux de scénario (voir FLAGS) ---
+        self._flags = DEFAULT_FLAGS
+        # Drapeaux à la dernière évaluation des déclencheurs :
+        # l’état initial ne compte pas comme un changement
+        self._flags_seen = DEFAULT_FLAGS
+
         # --- Statistiques IA ---
         self.ia_correct = 0
         self.ia_wrong = 0
         self.ia_questions_answered = 0
+        self.quiz_deck = None   # paquet de questions adaptatif (voir quizbank.py)
+
+    # ============================================================
+    # Drapeaux de scénario
+    # ============================================================
+
+    @property
+    def flags(self) -> int:
+        """Tous les drapeaux sous forme d'un entier (instantané, sauvegarde, hachage)."""
+        return self._flags
+
+    @flags.setter
+    def flags(self, value: int):
+        self._flags = value
+
+    @property
+    def flags_seen(self) -> int:
+        """Drapeaux à la dernière évaluation des déclencheurs (instantanés, voir keyframes.py)."""
+        return self._flags_seen
+
+    @flags_seen.setter
+    def flags_seen(self, value: int):
+        self._flags_seen = value
+
+    def pop_changed_flags(self):
+        """
+        Retourne les drapeaux modifiés depuis le dernier appel.
+
+        La différence est un simple XOR entre l'instantané précédent et
+        l'état courant.
+        """
+        changed = self._flags ^ self._flags_seen
+        self._flags_seen = self._flags
+        return flag_names(changed) if changed else []
+
+    def mark_flags_changed(self, flags):
+        """Remet des drapeaux dans le journal (déclencheurs non évalués ce tour-ci)."""
+        for name in flags:
+            self._flags_seen ^= FLAG_BITS[name]
 
     # ============================================================
     # Déplacements
@@ -133,28 +202,60 @@ class Player:
         self.log(f"Vous êtes retourné en arrière à {self.current_room.name}.")
         return True
 
+    @property
+    def room_history(self):
+        """Salles traversées, de la plus ancienne à la plus récente (pile "retour")."""
+        return tuple(self._room_history)
+
+    @room_history.setter
+    def room_history(self, rooms):
+        self._room_history = list(rooms)
+
+    def clear_room_history(self):
+        """Oublie les salles traversées (changement de chapitre)."""
+        self._room_history.clear()
+
     # ============================================================
     # Inventaire
     # ============================================================
 
-    def add_item(self, item):
-        """Ajoute un objet à l’inventaire et met à jour le poids total."""
-        self.current_weight += item.weight
-        self.inventory.append(item)
+    @property
+    def max_weight(self):
+        """Capacité de transport (portée par l'inventaire)."""
+        return self.inventory.max_weight
+
+    @max_weight.setter
+    def max_weight(self, value):
+        self.inventory.max_weight = value
+
+    @property
+    def current_weight(self):
+        """Poids transporté, tenu à jour par l'inventaire."""
+        return self.inventory.current_weight
 
-    def remove_item(self, item):
-        """Retire un objet de l’inventaire si le joueur le possède."""
-        if item in self.inventory:
-            self.current_weight = max(0, self.current_weight - item.weight)
-            self.inventory.remove(item)
+    def can_carry(self, item, count=1) -> bool:
+        """Retourne True si le joueur peut porter `count` exemplaires de l'objet."""
+        return self.inventory.can_carry(item, count)
+
+    def add_item(self, item, count=1):
+        """Ajoute un ou plusieurs exemplaires d'un objet à l’inventaire."""
+        self.inventory.add(item, count)
+
+    def remove_item(self, item, count=1) -> int:
+        """
+        Retire un ou plusieurs exemplaires d'un objet si le joueur le possède.
+
+        Retour : nombre d'exemplaires réellement retirés.
+        """
+        return self.inventory.remove(item, count)
 
     def find_item(self, name: str):
-        """Recherche un objet par son nom (insensible à la casse)."""
-        name = name.lower()
-        for it in self.inventory:
-            if it.name.lower() == name:
-                return it
-        return None
+        """Recherche un objet par son nom (insensible à la casse et aux accents)."""
+        return self.inventory.find(name)
+
+    def count_item(self, name: str) -> int:
+        """Retourne le nombre d'exemplaires possédés d'un objet."""
+        return self.inventory.count(name)
 
     def has_item(self, name: str) -> bool:
         """Retourne True si l'objet est présent dans l'inventaire."""
@@ -188,17 +289,39 @@ class Player:
     # Historique / Statut
     # ============================================================
 
+    @property
+    def event_log(self):
+        """Journal des événements (EventLog, voir eventlog.py)."""
+        return self._event_log
+
     def log(self, message: str):
         """Ajoute un message au journal des événements."""
         self._event_log.append(message)
 
-    def get_history_string(self) -> str:
-        """Retourne une version lisible de l’historique du joueur."""
-        if not self._event_log:
+    def close(self):
+        """Libère le fichier de débordement du journal."""
+        self._event_log.close()
+
+    def get_history_string(self, page=None) -> str:
+        """
+        Retourne une page lisible de l’historique du joueur.
+
+        page (int | None) : numéro de page (1 = la plus ancienne) ;
+                            par défaut la page la plus récente.
+        """
+        log = self._event_log
+        if not len(log):
             return "l'historique est vide."
-        lines = ["Historique:"]
-        for e in self._event_log:
+        pages = log.page_count()
+        page = pages if page is None else min(max(1, page), pages)
+        if pages == 1:
+            lines = ["Historique:"]
+        else:
+            lines = [f"Historique (page {page}/{pages}) :"]
+        for e in log.page(page):
             lines.append(f"- {e}")
+        if page > 1:
+            lines.append(f"(historique {page - 1} pour la page précédente)")
         return "\n".join(lines)
 
     def get_status_string(self) -> str:
@@ -208,3 +331,23 @@ class Player:
             f"ATK {self.atk} | DEF {self.defense} | "
             f"Moral {self.moral} | Ressources {self.resources}"
         )
+
+
+def _flag_property(name, bit):
+    """Construit l'accesseur booléen d'un drapeau stocké dans Player._flags."""
+
+    def get(self):
+        return bool(self._flags & bit)
+
+    def set(self, value):
+        if value:
+            self._flags |= bit
+        else:
+            self._flags &= ~bit
+
+    return property(get, set, doc=f"Drapeau de scénario '{name}'.")
+
+
+for _name, _bit in FLAG_BITS.items():
+    setattr(Player, _name, _flag_property(_name, _bit))
+del _name, _bit
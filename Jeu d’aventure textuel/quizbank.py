@@ -0,0 +1,309 @@
+"""
+quizbank.py — Banque de questions du lien cognitif IA.
+
+Les questions sont stockées dans un fichier texte (questions.tsv), une par
+ligne : question<TAB>réponse<TAB>difficulté, les réponses acceptées étant
+séparées par "|" et la difficulté valant 1, 2 ou 3.
+
+- Le fichier est projeté en mémoire (mmap) et indexé au chargement :
+  seule la position de chaque ligne est conservée, le texte d'une
+  question n'est décodé que lorsqu'elle est posée.
+- Les réponses sont normalisées une fois pour toutes au chargement
+  (voir names.normalize) : "voie lactee" et "Voie  Lactée" sont acceptées,
+  et vérifier une réponse ne coûte qu'une normalisation de la saisie.
+- La banque est chargée une seule fois par processus (get_bank()) et
+  partagée, en lecture seule, par toutes les parties.
+- Chaque partie tire ses questions dans un AdaptiveDeck : un tirage
+  pondéré (arbre de Fenwick, voir fenwick.py) par niveau de difficulté.
+  Une question tirée sort du paquet ; une question manquée y revient avec
+  un poids accru, une question réussie voit son poids baisser pour le
+  tour de paquet suivant. Tirage et mise à jour coûtent O(log n) ; un
+  paquet ne conserve que les poids qui s'écartent du poids de base.
+"""
+
+import mmap
+import os
+import random
+from array import array
+
+from fenwick import FenwickTree
+from names import normalize
+
+
+# Fichier de questions livré avec le jeu
+QUESTIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "questions.tsv")
+
+# Niveaux de difficulté et niveau par défaut d'une question
+LEVELS = (1, 2, 3)
+DEFAULT_LEVEL = 2
+
+# Poids des questions dans le paquet d'un joueur (entiers, voir fenwick.py)
+BASE_WEIGHT = 64
+MIN_WEIGHT = 8
+MAX_WEIGHT = 1024
+
+
+class QuestionBank:
+    """
+    Banque de questions indexée, en lecture seule.
+
+    Attributs :
+        path (str) : fichier source.
+        _offsets (array) : position (octets) du début de chaque question.
+        _answers (list[tuple[str]]) : réponses acceptées, normalisées.
+        _display (list[str]) : réponse affichée au joueur (la première).
+        levels (dict[int, array]) : questions de chaque niveau de difficulté.
+        _level / _rank (array) : niveau d'une question et sa position dans ce niveau.
+    """
+
+    def __init__(self, path=QUESTIONS_FILE):
+        """Projette le fichier en mémoire et construit l'index."""
+        self.path = path
+        self._offsets = array("Q")
+        self._answers = []
+        self._display = []
+        self.levels = {level: array("I") for level in LEVELS}
+        self._level = array("B")
+        self._rank = array("I")
+        self._file = open(path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:   # fichier vide : mmap refuse une taille nulle
+            self._data = b""
+        self._index()
+
+    def _index(self):
+        """Parcourt le fichier une fois : positions des lignes et réponses normalisées."""
+        data = self._data
+        size = len(data)
+        pos = 0
+        while pos < size:
+            end = data.find(b"\n", pos)
+            if end < 0:
+                end = size
+            line = data[pos:end]
+            if line.strip() and not line.startswith(b"#"):
+                fields = line.split(b"\t")
+                if len(fields) >= 2 and fields[0]:
+                    answers = fields[1].decode("utf-8").strip().split("|")
+                    level = int(fields[2]) if len(fields) > 2 and fields[2].strip() else DEFAULT_LEVEL
+                    if level not in self.levels:
+                        level = DEFAULT_LEVEL
+                    index = len(self._offsets)
+                    self._offsets.append(pos)
+                    self._display.append(answers[0].strip())
+                    self._answers.append(tuple({normalize(a) for a in answers}))
+                    self._level.append(level)
+                    self._rank.append(len(self.levels[level]))
+                    self.levels[level].append(index)
+            pos = end + 1
+
+    def __len__(self):
+        """Nombre de questions."""
+        return len(self._offsets)
+
+    def question(self, index) -> str:
+        """Texte de la question `index` (décodé à la demande)."""
+        start = self._offsets[index]
+        tab = self._data.find(b"\t", start)
+        return self._data[start:tab].decode("utf-8")
+
+    def answer(self, index) -> str:
+        """Réponse de référence affichée au joueur."""
+        return self._display[index]
+
+    def level(self, index) -> int:
+        """Niveau de difficulté de la question."""
+        return self._level[index]
+
+    def rank(self, index) -> int:
+        """Position de la question parmi celles de son niveau."""
+        return self._rank[index]
+
+    def check(self, index, answer: str) -> bool:
+        """True si la saisie correspond à l'une des réponses acceptées."""
+        return normalize(answer) in self._answers[index]
+
+    def close(self):
+        """Libère la projection mémoire et le fichier."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+
+class AdaptiveDeck:
+    """
+    Paquet de questions pondéré, propre à une partie.
+
+    Un arbre de Fenwick par niveau de difficulté porte le poids courant
+    de chaque question dans le tour de paquet :
+        - une question tirée passe à 0 (pas de répétition immédiate),
+        - une question manquée revient au tirage suivant avec un poids
+          doublé : le joueur la reverra plus tôt,
+        - une question réussie voit son poids divisé par deux pour les
+          tours suivants.
+    Quand tous les poids sont nuls, un nouveau tour commence avec les
+    poids appris.
+
+    Pour que chaque partie reste légère quelle que soit la taille de la
+    banque, seuls les poids appris qui diffèrent de BASE_WEIGHT sont
+    conservés, et l'arbre d'un niveau n'est construit qu'au premier
+    tirage de ce niveau dans le tour (O(n) pour ce niveau seulement).
+
+    Attributs :
+        bank (QuestionBank) : banque partagée.
+        _levels (list[int]) : niveaux contenant au moins une question.
+        _learned (dict[int, dict[int, int]]) : par niveau, poids appris
+                                               différents de BASE_WEIGHT (par rang).
+        _trees (dict[int, FenwickTree]) : poids du tour en cours des niveaux déjà tirés.
+        _missed (int|None) : question manquée à remettre au prochain tirage.
+    """
+
+    __slots__ = ("bank", "_levels", "_learned", "_trees", "_missed", "_rng")
+
+    def __init__(self, bank, rng=random):
+        """Prépare le paquet (rng : source d'aléa) ; ValueError si la banque est vide."""
+        if not len(bank):
+            raise ValueError(f"Banque de questions vide : {bank.path}")
+        self.bank = bank
+        self._levels = [level for level, indices in bank.levels.items() if indices]
+        self._learned = {}
+        self._trees = {}
+        self._missed = None
+        self._rng = rng
+
+    def _new_round(self):
+        """Recommence un tour de paquet : chaque niveau repart de ses poids appris."""
+        self._trees = {}
+
+    def _learned_weights(self, level):
+        """Poids appris de toutes les questions d'un niveau (par rang)."""
+        weights = array("q", [BASE_WEIGHT]) * len(self.bank.levels[level])
+        for rank, weight in self._learned.get(level, {}).items():
+            weights[rank] = weight
+        return weights
+
+    def _tree(self, level):
+        """Arbre du tour en cours d'un niveau (construit au premier tirage du tour)."""
+        tree = self._trees.get(level)
+        if tree is None:
+            tree = self._trees[level] = FenwickTree(self._learned_weights(level))
+        return tree
+
+    def _total(self, level) -> int:
+        """Poids restant d'un niveau dans le tour en cours."""
+        tree = self._trees.get(level)
+        if tree is not None:
+            return tree.total()
+        learned = self._learned.get(level, {})
+        return (len(self.bank.levels[level]) - len(learned)) * BASE_WEIGHT + sum(learned.values())
+
+    def draw(self, difficulty=None) -> int:
+        """
+        Retourne l'indice de la prochaine question.
+
+        difficulty : niveau visé (1 à 3). Le niveau non épuisé le plus
+                     proche est utilisé ; sans niveau visé, le niveau est
+                     tiré proportionnellement aux poids restants.
+        """
+        totals = {level: self._total(level) for level in self._levels}
+        if not any(totals.values()):
+            self._new_round()
+            totals = {level: self._total(level) for level in self._levels}
+
+        available = [level for level, total in totals.items() if total > 0]
+        if difficulty is None:
+            target = self._rng.randrange(sum(totals.values()))
+            for level in available:
+                if target < totals[level]:
+                    break
+                target -= totals[level]
+        else:
+            level = min(available, key=lambda lv: (abs(lv - difficulty), lv))
+
+        tree = self._tree(level)
+        rank = tree.sample(self._rng)
+        tree.set(rank, 0)
+
+        # La question manquée au tirage précédent revient dans le paquet
+        if self._missed is not None:
+            missed, self._missed = self._missed, None
+            self._restore(missed)
+
+        return self.bank.levels[level][rank]
+
+    def record(self, index, correct: bool):
+        """Met à jour le poids appris d'une question après la réponse du joueur."""
+        level, rank = self.bank.level(index), self.bank.rank(index)
+        weight = self.weight(index)
+        if correct:
+            weight = max(MIN_WEIGHT, weight // 2)
+        else:
+            weight = min(MAX_WEIGHT, weight * 2)
+            self._missed = index
+        learned = self._learned.setdefault(level, {})
+        if weight == BASE_WEIGHT:
+            learned.pop(rank, None)
+        else:
+            learned[rank] = weight
+
+    def _restore(self, index):
+        """Remet une question dans le tour en cours avec son poids appris."""
+        tree = self._trees.get(self.bank.level(index))
+        if tree is not None:   # sinon, l'arbre partira des poids appris
+            tree.set(self.bank.rank(index), self.weight(index))
+
+    def getstate(self) -> dict:
+        """
+        État du paquet sous forme sérialisable (voir keyframes.py) : poids
+        appris différents de BASE_WEIGHT, écarts du tour en cours avec les
+        poids appris (niveaux déjà tirés), question manquée. Les clés sont
+        en texte, comme après un aller-retour JSON.
+        """
+        rounds = {}
+        for level, tree in self._trees.items():
+            learned = self._learned_weights(level)
+            rounds[str(level)] = {str(rank): tree[rank] for rank in range(tree.size) if tree[rank] != learned[rank]}
+        return {
+            "learned": {str(level): {str(rank): w for rank, w in weights.items()}
+                        for level, weights in self._learned.items() if weights},
+            "round": rounds,
+            "missed": self._missed,
+        }
+
+    def setstate(self, state):
+        """
+        Restaure un état produit par getstate(). Les états des bandes antérieures, qui listent
+        tous les poids de chaque niveau, restent lisibles.
+        """
+        self._learned = {}
+        for level, weights in state["learned"].items():
+            if isinstance(weights, list):
+                weights = dict(enumerate(weights))
+            learned = {int(rank): w for rank, w in weights.items() if w != BASE_WEIGHT}
+            if learned:
+                self._learned[int(level)] = learned
+        self._trees = {}
+        for level, weights in state["round"].items():
+            level = int(level)
+            if isinstance(weights, dict):
+                changes, weights = weights, self._learned_weights(level)
+                for rank, weight in changes.items():
+                    weights[int(rank)] = weight
+            self._trees[level] = FenwickTree(weights)
+        self._missed = state["missed"]
+
+    def weight(self, index) -> int:
+        """Poids appris d'une question (pour debug et statistiques)."""
+        return self._learned.get(self.bank.level(index), {}).get(self.bank.rank(index), BASE_WEIGHT)
+
+
+_BANK = None
+
+
+def get_bank():
+    """Retourne la banque partagée du processus (chargée au premier appel)."""
+    global _BANK
+    if _BANK is None:
+        _BANK = QuestionBank()
+    return _BANK
@@ -0,0 +1,203 @@
+"""
+replay.py — Rejeu rapide et déterministe des parties enregistrées.
+
+Une bande (tape.py) est rejouée sans terminal : la partie est recréée
+avec la même graine, les réponses automatiques du quiz sont relues par
+ai_quiz.TapePolicy et chaque ligne enregistrée est transmise directement
+à Game.run_turn(). Avec NullIO, aucune sortie n'est construite : le
+rejeu tourne à pleine vitesse (aucun input(), aucun affichage).
+
+Les bandes contiennent des instantanés périodiques (keyframes.py) :
+seek() atteint l'état d'un tour quelconque en restaurant l'instantané le
+plus proche puis en rejouant seulement les tours suivants.
+
+Usages :
+    - reproduire un rapport de bogue : --show affiche la transcription,
+      --turn N saute directement à l'état du tour N,
+    - corpus de non-régression : --write enregistre la transcription de
+      chaque bande à côté d'elle (<bande>.txt), --check la compare au
+      rejeu courant (différences affichées, code de sortie 1),
+    - charge : --repeat N mesure le débit (tours par seconde),
+    - bandes sans instantanés (ou trop espacés) : --index K les réécrit
+      avec un instantané tous les K tours.
+
+Lancement :
+    python replay.py parties/*.tape --check
+    python replay.py partie.tape --turn 1200
+"""
+
+import argparse
+import difflib
+import sys
+import time
+
+from ai_quiz import TapePolicy
+from game import Game
+from gameio import MemoryIO, NullIO
+from keyframes import KEYFRAME_INTERVAL
+from tape import Tape
+
+
+# Extension des transcriptions de référence (corpus de non-régression)
+TRANSCRIPT_SUFFIX = ".txt"
+
+
+def replay(tape, io=None, narrate=False, game_cls=Game):
+    """
+    Rejoue une bande et retourne la partie dans son état final.
+
+    Paramètres :
+        tape (Tape) : partie enregistrée.
+        io : backend d'E/S (NullIO par défaut : sortie ignorée).
+        narrate (bool) : affiche les conséquences du crash et la première salle.
+        game_cls : classe de partie à instancier (Game par défaut).
+
+    L'appelant ferme la partie (game.close()) quand il n'en a plus besoin.
+    """
+    game = game_cls.headless(
+        tape.captain_name, tape.crash_choice,
+        io=io if io is not None else NullIO(), narrate=narrate,
+        quiz_policy=TapePolicy(tape.quiz), seed=tape.seed,
+    )
+    return _play(game, tape.lines)
+
+
+def seek(tape, turn, io=None, game_cls=Game):
+    """
+    Retourne la partie dans son état après les `turn` premières lignes.
+
+    L'instantané le plus proche (au tour `turn` ou avant) est restauré,
+    puis seules les lignes suivantes sont rejouées ; sans instantané, la
+    partie est rejouée depuis le début. io : NullIO par défaut.
+    """
+    turn = min(max(0, turn), len(tape))
+    io = io if io is not None else NullIO()
+    index = tape.keyframe_before(turn)
+    if index is None:
+        game = game_cls.headless(
+            tape.captain_name, tape.crash_choice, io=io,
+            quiz_policy=TapePolicy(tape.quiz), seed=tape.seed,
+        )
+        start = 0
+    else:
+        game = game_cls.from_keyframe(tape, index, io)
+        start = tape.keyframes[index][0]
+    return _play(game, tape.lines[start:turn])
+
+
+def _play(game, lines):
+    """Transmet les lignes à la partie, tant qu'elle est en cours."""
+    run_turn = game.run_turn
+    for line in lines:
+        if not game.running:
+            break
+        run_turn(line)
+    return game
+
+
+def index(tape, interval=KEYFRAME_INTERVAL):
+    """Rejoue la bande en l'enregistrant à nouveau : même partie, instantanés tous les `interval` tours."""
+    game = Game.headless(
+        tape.captain_name, tape.crash_choice, io=NullIO(),
+        quiz_policy=TapePolicy(tape.quiz), seed=tape.seed, record=interval,
+    )
+    _play(game, tape.lines)
+    game.close()
+    return game.recording
+
+
+def transcript(tape) -> str:
+    """Texte complet affiché pendant la partie enregistrée (narration comprise)."""
+    io = MemoryIO()
+    game = replay(tape, io, narrate=True)
+    game.close()
+    return io.getvalue()
+
+
+def diff(tape, expected):
+    """Différences (unified diff) entre une transcription de référence et le rejeu."""
+    return list(difflib.unified_diff(
+        expected.splitlines(), transcript(tape).splitlines(), "référence", "rejeu", lineterm=""
+    ))
+
+
+# ============================================================
+# Ligne de commande
+# ============================================================
+
+def _benchmark(tape, repeat):
+    """Rejoue `repeat` fois la bande sans sortie ; retourne (partie finale, durée)."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        game = replay(tape)
+        game.close()
+    return game, time.perf_counter() - start
+
+
+def _show_turn(tape, turn):
+    """Affiche l'état de la partie après `turn` lignes (durée du saut comprise)."""
+    start = time.perf_counter()
+    game = seek(tape, turn)
+    elapsed = time.perf_counter() - start
+    turn = min(max(0, turn), len(tape))
+    index = tape.keyframe_before(turn)
+    origin = "le début" if index is None else f"l'instantané du tour {tape.keyframes[index][0]}"
+    print(f"Tour {turn}/{len(tape)} atteint en {elapsed * 1000:.1f} ms (depuis {origin})")
+    print(game.player.get_status_string())
+    print(game.player.current_room.get_long_description(game.player))
+    if game.in_combat and game.current_enemy is not None:
+        print(f"Combat en cours : {game.current_enemy}")
+    if game.prompt is not None:
+        print(f"En attente d'une réponse : {game.prompt}")
+    if turn < len(tape):
+        print(f"Ligne suivante : {tape.lines[turn]!r}")
+    game.close()
+
+
+def main():
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Rejeu des parties enregistrées du Vigilant.")
+    parser.add_argument("tapes", nargs="+", help="fichiers de bande (.tape)")
+    parser.add_argument("--show", action="store_true", help="affiche la transcription de chaque partie")
+    parser.add_argument("--write", action="store_true", help="enregistre les transcriptions de référence")
+    parser.add_argument("--check", action="store_true", help="compare le rejeu aux transcriptions de référence")
+    parser.add_argument("--repeat", type=int, default=1, help="rejeux par bande (mesure du débit)")
+    parser.add_argument("--turn", type=int, help="affiche l'état de la partie après ce tour")
+    parser.add_argument("--index", type=int, metavar="K", help="réécrit les bandes avec un instantané tous les K tours")
+    args = parser.parse_args()
+
+    failed = 0
+    for path in args.tapes:
+        tape = Tape.load(path)
+        if args.index:
+            tape = index(tape, args.index)
+            tape.save(path)
+            print(f"{path} : {len(tape.keyframes)} instantané(s)")
+        if args.turn is not None:
+            _show_turn(tape, args.turn)
+            continue
+        game, elapsed = _benchmark(tape, args.repeat)
+        turns = len(tape) * args.repeat
+        rate = turns / elapsed if elapsed else float("inf")
+        print(f"{path} : {len(tape)} tours, {elapsed * 1000:.1f} ms ({rate:,.0f} tours/s) — "
+              f"{game.player.get_status_string()}")
+
+        if args.show:
+            print(transcript(tape))
+        if args.write:
+            with open(path + TRANSCRIPT_SUFFIX, "w", encoding="utf-8") as f:
+                f.write(transcript(tape))
+        if args.check:
+            with open(path + TRANSCRIPT_SUFFIX, encoding="utf-8") as f:
+                changes = diff(tape, f.read())
+            if changes:
+                failed += 1
+                print("\n".join(changes))
+
+    if args.check:
+        print(f"{len(args.tapes) - failed}/{len(args.tapes)} bande(s) conforme(s)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
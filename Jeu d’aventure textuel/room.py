@@ -9,12 +9,33 @@ Une Room représente un lieu exploré par le joueur :
 - des ennemis potentiels.
 
 Ce module sert de base à la structure de la carte du monde.
+
+Les Room construites par world.py sont des modèles partagés entre
+toutes les parties ; chaque partie les manipule au travers de RoomState,
+une vue qui ne copie que le contenu qu'elle modifie.
 """
 
+import copy
+
+from names import NamedList
+from player import FLAG_BITS
+
+
+# Nombre maximal de rendus mémorisés par salle modèle
+RENDER_CACHE_SIZE = 256
+
 
 class Room:
     """Représente une salle ou un lieu de l'univers du jeu."""
 
+    # Slots déclarés ici pour que ceux de RoomState suppriment aussi le
+    # __dict__ des états de session (un par salle visitée et par partie)
+    __slots__ = (
+        "name", "description", "exits",
+        "items", "characters", "enemies",
+        "variants", "variant_mask", "_renders", "game",
+    )
+
     def __init__(self, name, description):
         """
         Initialise une salle.
@@ -29,15 +50,47 @@ class Room:
         # Exits : dictionnaire direction → Room
         self.exits = {}
 
-        # Contenu du lieu
-        self.items = []
-        self.characters = []
-        self.enemies = []
+        # Contenu du lieu (indexé par nom normalisé, voir names.py)
+        self.items = NamedList()
+        self.characters = NamedList()
+        self.enemies = NamedList()
         
-        # Descriptions dynamique alternatives
-        self.alt_description_robbery = ""
-        self.alt_description_corruption = ""
-        self.game = None  # Référence vers l'objet Game global
+        # Descriptions alternatives : [(bit du drapeau, texte)], la première
+        # dont le drapeau est levé chez le joueur remplace la description
+        self.variants = []
+        self.variant_mask = 0   # union des bits des drapeaux ci-dessus
+
+        # Rendus de get_long_description(), partagés par toutes les parties
+        self._renders = {}
+        self.game = None  # Référence vers l'objet Game (salle autonome uniquement)
+
+    def freeze(self):
+        """
+        Fige le contenu de la salle pour en faire un modèle partagé.
+
+        Les collections deviennent non modifiables : toute modification
+        doit passer par une RoomState propre à la partie.
+        """
+        self.items = NamedList(self.items, frozen=True)
+        self.characters = NamedList(self.characters, frozen=True)
+        self.enemies = _enlist(NamedList(self.enemies, frozen=True))
+
+    @property
+    def template(self):
+        """Salle modèle portant les données partagées (ici la salle elle-même)."""
+        return self
+
+    def add_variant(self, flag, description):
+        """
+        Ajoute une description alternative, utilisée quand le drapeau du joueur est levé.
+
+        Les variantes sont testées dans leur ordre d'ajout.
+        Exemple : entrepots.add_variant("velyra_robbed_civilians", "Les hangars…")
+        """
+        bit = FLAG_BITS[flag]
+        self.variants.append((bit, description))
+        self.variant_mask |= bit
+        self._renders.clear()
 
     # ============================================================
     # Connexions entre salles
@@ -53,6 +106,7 @@ class Room:
         créera automatiquement la connexion salleB → salleA vers "O".
         """
         self.exits[direction.upper()] = other_room
+        self._renders.clear()
 
         reverse = {
             "N": "S",
@@ -77,20 +131,19 @@ class Room:
 
     def add_item(self, item):
         """Dépose un objet dans la salle."""
-        self.items.append(item)
+        self.items.add(item)
 
     def remove_item(self, item):
         """Retire un objet présent dans la salle."""
-        if item in self.items:
-            self.items.remove(item)
+        self.items.remove(item)
 
     def find_item(self, name):
-        """Recherche un objet par nom, insensible à la casse."""
-        name = name.lower()
-        for it in self.items:
-            if it.name.lower() == name:
-                return it
-        return None
+        """Recherche un objet par nom, insensible à la casse et aux accents."""
+        return self.items.find(name)
+
+    def find_items(self, name):
+        """Retourne tous les exemplaires d'un objet présents dans la salle."""
+        return self.items.find_all(name)
 
     # ============================================================
     # PNJ (personnages non-joueurs)
@@ -98,15 +151,11 @@ class Room:
 
     def add_character(self, character):
         """Ajoute un PNJ à la salle."""
-        self.characters.append(character)
+        self.characters.add(character)
 
     def find_character(self, name):
-        """Recherche un PNJ par son nom."""
-        name = name.lower()
-        for c in self.characters:
-            if c.name.lower() == name:
-                return c
-        return None
+        """Recherche un PNJ par son nom, insensible à la casse et aux accents."""
+        return self.characters.find(name)
 
     # ============================================================
     # Ennemis
@@ -114,18 +163,24 @@ class Room:
 
     def add_enemy(self, enemy):
         """Ajoute un ennemi à la salle."""
-        self.enemies.append(enemy)
+        self.enemies.add(enemy)
+        enemy.roster = self.enemies
+
+    def remove_enemy(self, enemy):
+        """Retire un ennemi de la salle."""
+        self.enemies.remove(enemy)
 
     def find_enemy(self, name):
         """
         Recherche un ennemi vivant dans la salle.
+        Parmi des homonymes, le premier encore en vie est retourné.
         Retourne None si l’ennemi n'existe pas ou est déjà vaincu.
         """
-        name = name.lower()
-        for e in self.enemies:
-            if e.name.lower() == name and e.is_alive():
-                return e
-        return None
+        return self.enemies.find(name, _is_alive)
+
+    def own_enemy(self, enemy):
+        """Ennemi à modifier (dégâts, mort) : ici l'ennemi lui-même, la salle étant autonome."""
+        return enemy
 
     # ============================================================
     # Description longue
@@ -152,56 +207,198 @@ class Room:
 
         return "\n".join(lines)
 
-    def get_long_description(self):
+    def get_long_description(self, player=None):
         """
         Retourne une description détaillée :
-        - texte narratif,
+        - texte narratif (ou sa variante selon les choix du joueur),
         - PNJ,
         - ennemis vivants,
         - objets,
         - sorties.
+
+        player : joueur dont les choix modifient la description
+                 (par défaut, celui de la partie associée).
+
+        Le texte ne dépend que de la salle modèle, des drapeaux qui la
+        concernent et de son contenu : il est mémorisé sur la salle modèle
+        et réutilisé par toutes les parties. Le contenu est identifié par
+        ses collections et leur version (voir names.py), qui change à
+        chaque ajout, retrait ou mort d'un ennemi : la clé se calcule sans
+        parcourir le contenu.
         """
-        desc = f"== {self.name} ==\n{self.description}\n"
-        
-        # Descriptions alternatives pour les entrepôts civils
-        p = self.game.player
-        if self.name == "Entrepôts civils":
-            if getattr(p, "velyra_robbed_civilians", False):
-                desc =  f"== {self.name} ==\n{self.alt_description_robbery}\n"
-            elif getattr(p, "velyra_corrupted_general", False):
-                desc =  f"== {self.name} ==\n{self.alt_description_corruption}\n"
-
-        # Description alternative pour la prison centrale
-        if self.name == "Prison centrale":      
-            if getattr(p, "velyra_missiles_obtained", False):
-                desc = f"== {self.name} ==\n{self.alt_description_after_missiles}\n"
-            elif getattr(p, "velyra_prison_liberated", False):
-                desc = f"== {self.name} ==\n{self.alt_description_after_raid}\n"
-                
-        # description alternative pour le district d'Or
-        if self.name == "District d’Or":
-            if getattr(self.game.player, "ap_choice_infiltrate", False):
-                desc = f"== {self.name} ==\n{self.alt_description_infiltrate}\n"
-            elif getattr(self.game.player, "ap_choice_reveal", False):
-                desc = f"== {self.name} ==\n{self.alt_description_reveal}\n"
-
-        # description alternative pour le Nœud
-        if self.name == "Le Nœud":
-            if getattr(self.game.player, "ap_break_illusions", False):
-                desc = f"== {self.name} ==\n{self.alt_description_break}\n"
-            elif getattr(self.game.player, "ap_keep_illusions", False):
-                desc = f"== {self.name} ==\n{self.alt_description_keep}\n"
-
-
-            
+        p = player if player is not None else self.game.player
+        template = self.template
+        characters, items, enemies = self.characters, self.items, self.enemies
+        key = (
+            p.flags & template.variant_mask,
+            id(characters), characters.version,
+            id(items), items.version,
+            id(enemies), enemies.version,
+        )
+        renders = template._renders
+        text = renders.get(key)
+        if text is None:
+            if len(renders) >= RENDER_CACHE_SIZE:
+                renders.clear()
+            text = renders[key] = self._render(p.flags)
+        return text
+
+    def _render(self, flags):
+        """Construit la description longue pour ces drapeaux du joueur."""
+        description = self.description
+        for bit, alt in self.variants:
+            if flags & bit:
+                description = alt
+                break
+
+        parts = [f"== {self.name} ==", description]
+
         if self.characters:
-            desc += "Personnes présentes : " + ", ".join(c.name for c in self.characters) + "\n"
+            parts.append("Personnes présentes : " + ", ".join(c.name for c in self.characters))
 
         if self.enemies:
-            desc += "Ennemis : " + ", ".join(e.name for e in self.enemies if e.is_alive()) + "\n"
+            parts.append("Ennemis : " + ", ".join(e.name for e in self.enemies if e.is_alive()))
 
         if self.items:
-            desc += "Objets : " + ", ".join(i.name for i in self.items) + "\n"
+            parts.append("Objets : " + ", ".join(i.name for i in self.items))
+
+        parts.append(self.get_exit_string())
+        return "\n".join(parts)
+
+
+def _enlist(enemies):
+    """Rattache chaque ennemi à sa collection (sa mort en change la version) et la retourne."""
+    for enemy in enemies:
+        enemy.roster = enemies
+    return enemies
+
+
+def _is_alive(enemy):
+    """Prédicat de recherche : ennemi encore en vie."""
+    return enemy.is_alive()
 
-        desc += self.get_exit_string()
-        return desc
+
+class RoomState(Room):
+    """
+    État d'une salle propre à une partie (copie à l'écriture).
+
+    Le modèle (Room figée, partagée par toutes les sessions) n'est jamais
+    modifié. Tant que la partie ne touche pas au contenu du lieu, la vue
+    lit directement celui du modèle ; la première modification copie
+    uniquement la liste concernée (objets ou ennemis) pour cette session.
+
+    Attributs :
+        room (Room) : modèle partagé.
+        game (Game) : partie à laquelle appartient cet état.
+        _items (NamedList|None) : objets de la session, None tant que non modifiés.
+        _enemies (NamedList|None) : ennemis de la session (copies portant leurs PV).
+
+    Les autres attributs (nom, description, sorties, PNJ, descriptions
+    alternatives…) sont lus sur le modèle.
+    """
+
+    # "game" est déjà un slot de Room
+    __slots__ = ("room", "_items", "_enemies")
+
+    def __init__(self, room, game):
+        """Crée la vue de session d'une salle modèle."""
+        self.room = room
+        self.game = game
+        self._items = None
+        self._enemies = None
+
+    def __getattr__(self, name):
+        """Délègue au modèle tout attribut non propre à la session."""
+        if name == "room":
+            raise AttributeError(name)
+        return getattr(self.room, name)
+
+    # ============================================================
+    # Contenu de la session
+    # ============================================================
+
+    @property
+    def items(self):
+        """Objets présents dans la salle pour cette partie."""
+        return self.room.items if self._items is None else self._items
+
+    @property
+    def enemies(self):
+        """Ennemis présents dans la salle pour cette partie."""
+        return self.room.enemies if self._enemies is None else self._enemies
+
+    def _own_items(self):
+        """Copie les objets du modèle lors de la première modification."""
+        if self._items is None:
+            self._items = self.room.items.copy()
+        return self._items
+
+    def _own_enemies(self):
+        """Copie les ennemis du modèle (et leurs PV) lors de la première modification."""
+        if self._enemies is None:
+            self._enemies = _enlist(NamedList(copy.copy(e) for e in self.room.enemies))
+        return self._enemies
+
+    def session_content(self):
+        """Contenu propre à la session (objets, ennemis) ; None pour ce qui est lu sur le modèle."""
+        return self._items, self._enemies
+
+    def restore_content(self, items, enemies):
+        """Remplace le contenu propre à la session (None : revenir au contenu du modèle)."""
+        self._items = None if items is None else NamedList(items)
+        self._enemies = None if enemies is None else _enlist(NamedList(enemies))
+
+    def add_item(self, item):
+        """Dépose un objet dans la salle (pour cette partie uniquement)."""
+        self._own_items().add(item)
+
+    def remove_item(self, item):
+        """Retire un objet de la salle (pour cette partie uniquement)."""
+        if item in self.items:
+            self._own_items().remove(item)
+
+    def add_character(self, character):
+        """Les PNJ font partie du modèle partagé : ils ne s'ajoutent pas en cours de partie."""
+        raise TypeError("Les PNJ d'une salle partagée sont définis dans world.py.")
+
+    def add_enemy(self, enemy):
+        """Ajoute un ennemi à la salle (pour cette partie uniquement)."""
+        enemies = self._own_enemies()
+        enemies.add(enemy)
+        enemy.roster = enemies
+
+    def remove_enemy(self, enemy):
+        """Retire un ennemi de la salle (pour cette partie uniquement)."""
+        if enemy in self.enemies:
+            enemy = self.own_enemy(enemy)
+            self._enemies.remove(enemy)
+
+    def own_enemy(self, enemy):
+        """
+        Copie de session d'un ennemi de la salle, à appeler avant de le modifier.
+
+        find_enemy() ne copie rien : analyser ou prévoir un combat laisse
+        la salle lire les ennemis du modèle. Les ennemis ne sont copiés
+        pour la session qu'au moment où l'un d'eux est touché ou retiré.
+        """
+        if self._enemies is None and enemy in self.room.enemies:
+            for original, own in zip(self.room.enemies, self._own_enemies()):
+                if original is enemy:
+                    return own
+        return enemy
+
+    # ============================================================
+    # Navigation
+    # ============================================================
+
+    @property
+    def template(self):
+        """Salle modèle partagée."""
+        return self.room
+
+    def get_exit(self, direction):
+        """Retourne l'état de session de la salle voisine, ou None."""
+        target = self.room.get_exit(direction)
+        if target is None:
+            return None
+        return self.game.room_state(target)
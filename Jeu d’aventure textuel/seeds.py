@@ -0,0 +1,42 @@
+"""
+seeds.py — Graines des flux aléatoires des parties.
+
+Chaque partie possède son propre générateur (Game.rng, un random.Random)
+initialisé par une graine (Game.seed) : deux parties ne partagent aucun
+état aléatoire, et rejouer une partie avec la même graine et les mêmes
+saisies redonne exactement la même partie.
+
+Pour répartir des milliers de parties sur plusieurs processus, toutes
+les graines sont dérivées d'une graine racine :
+
+    worker = derive(root, k)          # graine du processus k
+    seed   = derive(root, k, j)       # graine de la j-ième partie du processus k
+
+La dérivation est un hachage (BLAKE2b) : les flux obtenus sont
+indépendants, ne dépendent ni de l'ordre d'exécution ni du nombre de
+processus, et n'importe quelle partie se rejoue seule à partir de
+(root, k, j).
+"""
+
+import hashlib
+import secrets
+
+
+# Taille des graines (bits)
+SEED_BITS = 64
+
+
+def new_seed() -> int:
+    """Graine racine imprévisible (à noter pour pouvoir rejouer)."""
+    return secrets.randbits(SEED_BITS)
+
+
+def derive(root, *path) -> int:
+    """Graine du flux désigné par `path` sous la graine racine `root`."""
+    data = repr((root,) + path).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=SEED_BITS // 8).digest(), "big")
+
+
+def spawn(root, count, *path):
+    """Graines de `count` flux indépendants : derive(root, *path, i) pour i < count."""
+    return [derive(root, *path, i) for i in range(count)]
@@ -0,0 +1,196 @@
+"""
+server.py — Serveur TCP multi-sessions (asyncio).
+
+Ce module héberge plusieurs parties dans une seule boucle d'événements :
+chaque connexion TCP possède son propre objet Game, construit sans
+terminal grâce à Game.headless().
+
+Déroulement d'une session :
+    1) le serveur demande le nom du capitaine puis le choix du crash,
+    2) chaque ligne reçue est jouée avec Game.run_turn()
+       (Command(...).execute(game) + événements scénarisés),
+    3) la sortie du tour est renvoyée au client.
+
+Les tours s'exécutent directement dans la boucle d'événements : un
+dialogue qui attend un choix est suspendu dans game.pending (voir
+dialogue.py) et reprend à la ligne suivante, sans mobiliser de thread.
+
+Chaque session reçoit sa propre graine, dérivée de la graine racine du
+serveur et de son numéro d'ordre (voir seeds.py) : une session se rejoue
+à l'identique avec Game.headless(..., seed=derive(racine, numéro)).
+
+Avec --record DIR, chaque session est enregistrée (voir tape.py) et sa
+bande écrite dans DIR à la déconnexion, prête à être rejouée par replay.py.
+
+Lancement :
+    python server.py --host 127.0.0.1 --port 7777 [--seed 1234] [--record parties]
+"""
+
+import argparse
+import asyncio
+import os
+
+from game import CAPTAIN_PROMPT, CRASH_CHOICES, CRASH_TEXT, INTRO_TEXT, Game
+from gameio import SocketIO
+from seeds import derive, new_seed
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 7777
+
+# Lignes reçues en attente par session (au-delà, la lecture du client est suspendue)
+LINE_QUEUE_SIZE = 32
+
+# Erreurs de lecture qui terminent la session (connexion coupée, ligne trop longue, flux tronqué)
+READ_ERRORS = (ConnectionError, ValueError, asyncio.IncompleteReadError)
+
+
+class GameServer:
+    """
+    Serveur asyncio hébergeant une partie par connexion.
+
+    Attributs :
+        host (str) / port (int) : adresse d'écoute.
+        sessions (dict) : parties en cours, indexées par adresse du client.
+        seed (int) : graine racine dont dérivent les graines des sessions.
+        session_count (int) : nombre de sessions ouvertes depuis le démarrage.
+        record_dir (str|None) : dossier des bandes enregistrées (None : pas d'enregistrement).
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, seed=None, record_dir=None):
+        """Initialise le serveur (l'écoute démarre avec start())."""
+        self.host = host
+        self.port = port
+        self.sessions = {}
+        self.seed = new_seed() if seed is None else seed
+        self.session_count = 0
+        self.record_dir = record_dir
+        self._server = None
+
+    def session_seed(self, number) -> int:
+        """Graine de la session numéro `number` (0 pour la première)."""
+        return derive(self.seed, number)
+
+    def tape_path(self, number) -> str:
+        """Fichier de la bande de la session numéro `number`."""
+        return os.path.join(self.record_dir, f"{self.seed}-{number}.tape")
+
+    async def start(self):
+        """Ouvre le port d'écoute et retourne le serveur asyncio."""
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        sock = self._server.sockets[0].getsockname()
+        self.port = sock[1]
+        return self._server
+
+    async def serve_forever(self):
+        """Démarre le serveur puis traite les connexions indéfiniment."""
+        server = await self.start()
+        async with server:
+            await server.serve_forever()
+
+    async def _pump_lines(self, reader, lines):
+        """
+        Lit les lignes de la connexion et les place dans la file de la session.
+
+        La file est bornée : un client qui envoie plus vite que les tours ne
+        sont joués attend. None marque toujours la fin du flux, même en cas
+        d'erreur de lecture ou d'annulation, pour que la session se termine.
+        """
+        ended = False
+        try:
+            while True:
+                try:
+                    raw = await reader.readline()
+                except READ_ERRORS:
+                    break
+                if not raw:
+                    break
+                await lines.put(raw.decode("utf-8", errors="replace").rstrip("\r\n"))
+            await lines.put(None)
+            ended = True
+        finally:
+            if not ended:
+                if lines.full():
+                    lines.get_nowait()
+                lines.put_nowait(None)
+
+    async def _ask(self, io, lines, prompt):
+        """Pose une question au client et retourne sa réponse (None si déconnecté)."""
+        io.flush(prompt)
+        await io.writer.drain()
+        return await lines.get()
+
+    async def _handle_client(self, reader, writer):
+        """Gère une connexion complète : création de la partie puis boucle de tours."""
+        lines = asyncio.Queue(maxsize=LINE_QUEUE_SIZE)
+        io = SocketIO(writer)
+        peer = writer.get_extra_info("peername")
+        pump = asyncio.create_task(self._pump_lines(reader, lines))
+        game = None
+
+        try:
+            for line in INTRO_TEXT:
+                io.write(line)
+            name = await self._ask(io, lines, CAPTAIN_PROMPT)
+            if name is None:
+                return
+
+            for line in CRASH_TEXT:
+                io.write(line)
+            choix = ""
+            while choix not in CRASH_CHOICES:
+                choix = await self._ask(io, lines, "> ")
+                if choix is None:
+                    return
+                choix = choix.strip()
+
+            number = self.session_count
+            self.session_count += 1
+            game = Game.headless(
+                name.strip(), choix, io=io, narrate=True, seed=self.session_seed(number),
+                record=self.record_dir is not None,
+            )
+            self.sessions[peer] = game
+
+            while game.running:
+                cmd_line = await self._ask(io, lines, "> ")
+                if cmd_line is None:
+                    break
+                game.run_turn(cmd_line)
+            io.flush()
+            await writer.drain()
+        finally:
+            if game is not None:
+                if game.recording is not None:
+                    game.recording.save(self.tape_path(number))
+                game.close()
+            self.sessions.pop(peer, None)
+            pump.cancel()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+def main():
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Serveur multi-sessions du Vigilant.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--seed", type=int, help="graine racine (sessions reproductibles)")
+    parser.add_argument("--record", metavar="DIR", help="enregistre chaque session dans DIR (voir replay.py)")
+    args = parser.parse_args()
+
+    if args.record:
+        os.makedirs(args.record, exist_ok=True)
+    server = GameServer(args.host, args.port, args.seed, args.record)
+    print(f"Serveur du Vigilant en écoute sur {args.host}:{args.port} (graine {server.seed})")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
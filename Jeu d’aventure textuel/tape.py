@@ -0,0 +1,152 @@
+"""
+tape.py — Bande d'enregistrement d'une partie.
+
+Une partie est entièrement déterminée par :
+    - sa graine (Game.seed, voir seeds.py),
+    - le nom du capitaine et le choix du crash,
+    - la suite des lignes jouées par Game.run_turn() (commandes, réponses
+      aux choix des dialogues et réponses tapées au quiz),
+    - les réponses fournies par la politique de quiz automatique, s'il y
+      en a une (bot, simulation).
+
+Elle contient aussi des instantanés périodiques de l'état de la partie
+(keyframes.py) : replay.seek() atteint un tour quelconque en ne rejouant
+que les tours qui suivent l'instantané le plus proche.
+
+La bande (Tape) conserve exactement ces éléments ; replay.py la rejoue
+sans terminal, à pleine vitesse. Pour enregistrer une partie :
+
+    game = Game.headless("Ana", "1", record=True)
+    ...
+    game.recording.save("partie.tape")
+
+Format du fichier : JSON compact compressé par gzip (quelques centaines
+d'octets pour une partie complète).
+"""
+
+import gzip
+import json
+from bisect import bisect_right
+
+
+# Version du format (les versions antérieures restent lisibles)
+TAPE_VERSION = 2
+
+
+class Tape:
+    """
+    Enregistrement d'une partie.
+
+    Attributs :
+        seed (int) : graine de la partie.
+        captain_name (str) : nom du capitaine.
+        crash_choice (str) : "1" ou "2".
+        lines (list[str]) : lignes transmises à Game.run_turn(), dans l'ordre.
+        quiz (list[str|bool|None]) : réponses de la politique de quiz, une par
+                                     question (True/False : bonne/mauvaise
+                                     réponse, None : le joueur a tapé la sienne
+                                     dans `lines`), relues par ai_quiz.TapePolicy.
+        keyframes (list[[int, dict]]) : instantanés [tour, état], par tour croissant ;
+                                        l'état est celui de la partie après `tour`
+                                        lignes (voir keyframes.py).
+    """
+
+    __slots__ = ("seed", "captain_name", "crash_choice", "lines", "quiz", "keyframes")
+
+    def __init__(self, seed, captain_name="Orion Vale", crash_choice="1", lines=None, quiz=None,
+                 keyframes=None):
+        """Initialise une bande (vide par défaut)."""
+        self.seed = seed
+        self.captain_name = captain_name
+        self.crash_choice = crash_choice
+        self.lines = list(lines or [])
+        self.quiz = list(quiz or [])
+        self.keyframes = list(keyframes or [])
+
+    def __len__(self):
+        """Nombre de lignes jouées."""
+        return len(self.lines)
+
+    def __eq__(self, other):
+        """Deux bandes sont égales si elles rejouent la même partie."""
+        if not isinstance(other, Tape):
+            return NotImplemented
+        return all(getattr(self, attr) == getattr(other, attr) for attr in self.__slots__)
+
+    def keyframe_before(self, turn):
+        """Indice du dernier instantané pris au tour `turn` ou avant (None s'il n'y en a pas)."""
+        index = bisect_right([t for t, _ in self.keyframes], turn) - 1
+        return index if index >= 0 else None
+
+    def __repr__(self):
+        """Représentation lisible (utile pour debug)."""
+        return f"Tape(seed={self.seed}, capitaine={self.captain_name!r}, lignes={len(self.lines)})"
+
+    # ---------------------------------------------------------
+    # Sérialisation
+    # ---------------------------------------------------------
+    def to_dict(self) -> dict:
+        """Contenu de la bande sous forme sérialisable."""
+        return {
+            "v": TAPE_VERSION,
+            "seed": self.seed,
+            "name": self.captain_name,
+            "crash": self.crash_choice,
+            "lines": self.lines,
+            "quiz": self.quiz,
+            "keyframes": self.keyframes,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Reconstruit une bande depuis to_dict() (ValueError si version inconnue)."""
+        if data.get("v") not in range(1, TAPE_VERSION + 1):
+            raise ValueError(f"Version de bande non prise en charge : {data.get('v')!r}")
+        return cls(data["seed"], data["name"], data["crash"], data["lines"], data["quiz"],
+                   data.get("keyframes"))
+
+    def to_bytes(self) -> bytes:
+        """Bande compressée (mtime nul : même partie = mêmes octets)."""
+        text = json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+        return gzip.compress(text.encode("utf-8"), mtime=0)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Relit une bande produite par to_bytes()."""
+        return cls.from_dict(json.loads(gzip.decompress(data).decode("utf-8")))
+
+    def save(self, path):
+        """Écrit la bande dans un fichier."""
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Charge une bande depuis un fichier."""
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class RecordingPolicy:
+    """
+    Politique de quiz qui note sur la bande les réponses d'une autre politique.
+
+    Les réponses de référence et les réponses vides sont notées True et
+    False (relues à l'identique par TapePolicy) ; les autres telles quelles.
+    """
+
+    def __init__(self, policy, tape):
+        """Enveloppe `policy` (politique de la partie) et écrit sur `tape`."""
+        self.policy = policy
+        self.tape = tape
+
+    def answer(self, bank, index, rng):
+        """Réponse de la politique enveloppée, notée au passage."""
+        user = self.policy.answer(bank, index, rng)
+        if user is not None and user == bank.answer(index):
+            self.tape.quiz.append(True)
+        elif user == "":
+            self.tape.quiz.append(False)
+        else:
+            self.tape.quiz.append(user)
+        return user
@@ -0,0 +1,11 @@
+"""
+conftest.py — Configuration commune des tests.
+
+Les modules du jeu s'importent à plat (import game, import actions…) :
+le dossier du jeu est ajouté au chemin d'import.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
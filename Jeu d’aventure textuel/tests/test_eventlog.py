@@ -0,0 +1,63 @@
+"""
+test_eventlog.py — Journal borné : débordement sur disque et pages (eventlog.py).
+"""
+
+import os
+
+from eventlog import INDEX_STRIDE, PAGE_SIZE, RECENT_CAPACITY, EventLog
+
+
+def filled(count):
+    """Journal contenant les entrées "entrée 0" … "entrée count-1"."""
+    log = EventLog()
+    for i in range(count):
+        log.append(f"entrée {i}")
+    return log
+
+
+def test_pas_de_debordement_sous_la_capacite():
+    """Tant que le tampon suffit, aucun fichier n'est créé."""
+    log = filled(RECENT_CAPACITY)
+    assert log._path is None
+    assert list(log.entries()) == [f"entrée {i}" for i in range(RECENT_CAPACITY)]
+
+
+def test_debordement_et_relecture():
+    """Les entrées déversées sur disque se relisent dans l'ordre, par tranche quelconque."""
+    count = 1000
+    log = filled(count)
+    expected = [f"entrée {i}" for i in range(count)]
+    try:
+        assert len(log) == count
+        assert log._spilled > 0 and log._spilled % INDEX_STRIDE == 0
+        assert list(log.entries()) == expected
+        for start, stop in ((0, 1), (31, 33), (500, 517), (log._spilled - 2, log._spilled + 2), (990, None)):
+            assert list(log.entries(start, stop)) == expected[start:stop]
+    finally:
+        log.close()
+
+
+def test_pages():
+    """page(n) retourne la n-ième tranche de PAGE_SIZE entrées ; la dernière peut être incomplète."""
+    count = 257
+    log = filled(count)
+    try:
+        assert log.page_count() == -(-count // PAGE_SIZE)
+        assert log.page(1) == [f"entrée {i}" for i in range(PAGE_SIZE)]
+        assert log.page(13) == [f"entrée {i}" for i in range(120, 130)]
+        assert log.page(log.page_count()) == [f"entrée {i}" for i in range(250, count)]
+        assert log.page(log.page_count() + 1) == []
+    finally:
+        log.close()
+
+
+def test_close_supprime_le_fichier():
+    """close() supprime le fichier de débordement ; les entrées en mémoire restent lisibles."""
+    log = filled(300)
+    path = log._path
+    assert os.path.exists(path)
+    recent = list(log.entries(log._spilled))
+    log.close()
+    assert not os.path.exists(path)
+    assert list(log.entries()) == recent
+    assert log.page(1) == recent[:PAGE_SIZE]
@@ -0,0 +1,53 @@
+"""
+test_forecast.py — Prévision exacte (forecast.py) contre simulation (combat_sim.py).
+"""
+
+import time
+
+import pytest
+
+from config import enemies_config
+from enemy import Enemy
+from forecast import forecast
+
+np = pytest.importorskip("numpy")
+from combat_sim import Fighter, fight  # noqa: E402  (numpy requis)
+
+
+def predict(fighter, enemy, p):
+    """Prévision d'un combat entre statistiques du simulateur et ennemi."""
+    return forecast(fighter.atk, fighter.defense, fighter.hp, enemy.atk, enemy.defense, enemy.hp, p)
+
+
+@pytest.mark.parametrize("crash", ["1", "2"])
+@pytest.mark.parametrize("p", [0.0, 1.0])
+def test_combats_deterministes(crash, p):
+    """Quiz toujours juste ou toujours faux : prévision et simulation coïncident exactement."""
+    fighter = Fighter.after_crash(crash)
+    for name in enemies_config:
+        enemy = Enemy.from_config(name)
+        f = predict(fighter, enemy, p)
+        won, turns, _ = fight(fighter, enemy, 1, p, np.random.default_rng(0))
+        assert f.win_probability == float(won[0]), name
+        if won[0]:
+            assert f.expected_turns_to_win == turns[0], name
+
+
+def test_vorn_prevision_et_simulation_concordent():
+    """Vorn, quiz réussi une fois sur deux : la simulation retrouve la prévision."""
+    fighter = Fighter.after_crash("1")
+    enemy = Enemy.from_config("Capitaine Vorn")
+    f = predict(fighter, enemy, 0.5)
+    won, turns, hp_left = fight(fighter, enemy, 200_000, 0.5, np.random.default_rng(2))
+    assert f.win_probability == pytest.approx(won.mean(), abs=0.003)
+    assert f.expected_turns_to_win == pytest.approx(turns[won].mean(), abs=0.03)
+    assert f.expected_damage == pytest.approx(fighter.hp - hp_left.mean(), abs=0.3)
+
+
+def test_ennemi_immense_sans_depassement():
+    """Un ennemi à 5000 PV ne provoque ni dépassement de flottant ni calcul quadratique."""
+    start = time.perf_counter()
+    f = forecast(15, 3, 100, 10, 5, 5000, 0.5)
+    assert time.perf_counter() - start < 1.0
+    assert f.win_probability == 0.0 and f.expected_turns_to_win is None
+    assert f.unbounded_expected_turns == pytest.approx(5000 / 5.5, rel=0.01)
@@ -0,0 +1,64 @@
+"""
+test_headless.py — Parties scriptées sans terminal (Game.headless, MemoryIO).
+"""
+
+from ai_quiz import AlwaysRight, ProbabilityPolicy
+from game import Game
+
+
+# Chapitre I : refus du marchand, puis combat contre Vorn jusqu'à sa chute
+CHAPTER_ONE = ["g E", "g E", "t Marchand", "2", "g E"] + ["a Capitaine Vorn"] * 6
+
+
+def play(commands, **options):
+    """Crée une partie sans terminal et lui transmet les commandes."""
+    game = Game.headless("Ana", "1", **options)
+    for line in commands:
+        if not game.running:
+            break
+        game.run_turn(line)
+    return game
+
+
+def test_partie_scriptee_chapitre_un():
+    """Le parcours du chapitre I mène au chapitre II, avec un combat déterministe."""
+    game = play(CHAPTER_ONE, seed=7, quiz_policy=AlwaysRight())
+    try:
+        assert game.running
+        assert game.chapter.number == 2
+        assert game.player.merchant_refused and game.player.met_yara
+        assert game.player.hp == 55
+        assert game.prompt is not None and game.prompt.choices == ("1", "2")
+        assert "CHAPITRE II" in game.io.getvalue()
+
+        # Le choix de Yara est un menu fermé : toute autre réponse est reposée
+        defense = game.player.defense
+        game.run_turn("3")
+        assert game.player.defense == defense
+        game.run_turn("1")
+        assert game.player.defense > defense
+    finally:
+        game.close()
+
+
+def test_marchand_refuse_toute_autre_reponse():
+    """Chez le marchand, toute réponse autre que "1" vaut refus."""
+    game = play(["g E", "g E", "t Marchand", "non merci"], seed=1)
+    try:
+        assert game.pending is None
+        assert game.player.merchant_refused
+        assert not game.player.has_crystal
+    finally:
+        game.close()
+
+
+def test_meme_graine_meme_partie():
+    """Même graine et mêmes commandes : même sortie, même état."""
+    games = [play(CHAPTER_ONE, seed=42, quiz_policy=ProbabilityPolicy(0.5)) for _ in range(2)]
+    try:
+        first, second = games
+        assert first.io.getvalue() == second.io.getvalue()
+        assert first.player.get_status_string() == second.player.get_status_string()
+    finally:
+        for game in games:
+            game.close()
@@ -0,0 +1,75 @@
+"""
+test_replay.py — Enregistrement, rejeu et saut à un tour (tape.py, replay.py, keyframes.py).
+"""
+
+import pytest
+
+import replay
+from ai_quiz import ProbabilityPolicy
+from game import Game
+from gameio import MemoryIO
+from keyframes import KeyframeWriter
+from tape import Tape
+
+
+COMMANDS = [
+    "g E", "s", "g E", "t Marchand", "2", "g E",
+    "a Capitaine Vorn", "a Capitaine Vorn", "a Capitaine Vorn", "b Capitaine Vorn", "", "1", "2",
+    "t Yara", "h", "g E", "g E", "g E", "a Drone Sentinel", "b Drone Sentinel",
+    "p Dose de Nanomédecine", "retour", "g E", "g E", "a Gouverneur Karn", "b Gouverneur Karn",
+    "", "2", "", "2", "g E", "g E", "g E", "a Gardien Blanc", "b Gardien Blanc", "g E", "1", "s",
+]
+
+
+def state(game):
+    """État complet d'une partie (celui que noterait un instantané)."""
+    captured = KeyframeWriter(Tape(0)).capture(game)
+    del captured["quiz"]
+    return captured, game.pending is None
+
+
+@pytest.fixture(scope="module", params=["1", "2"])
+def recorded(request):
+    """Partie enregistrée (un instantané tous les 3 tours), relue depuis ses octets."""
+    game = Game.headless(
+        "Ana", request.param, io=MemoryIO(), narrate=True, seed=21, record=3,
+        quiz_policy=ProbabilityPolicy(0.5),
+    )
+    for line in COMMANDS:
+        if not game.running:
+            break
+        game.run_turn(line)
+    tape = Tape.from_bytes(game.recording.to_bytes())
+    yield game, tape
+    game.close()
+
+
+def test_bande_relue_a_l_identique(recorded):
+    """La bande survit à la sérialisation et contient des instantanés."""
+    game, tape = recorded
+    assert tape == game.recording
+    assert len(tape) > 0 and tape.keyframes
+
+
+def test_rejeu_redonne_la_partie(recorded):
+    """Le rejeu produit la même transcription et le même état final."""
+    game, tape = recorded
+    assert replay.transcript(tape) == game.io.getvalue()
+    replayed = replay.replay(tape)
+    try:
+        assert state(replayed) == state(game)
+    finally:
+        replayed.close()
+
+
+def test_seek_egale_le_rejeu_complet(recorded):
+    """À chaque tour, le saut depuis un instantané donne l'état du rejeu depuis le début."""
+    _, tape = recorded
+    bare = Tape(tape.seed, tape.captain_name, tape.crash_choice, tape.lines, tape.quiz)
+    for turn in range(len(tape) + 1):
+        expected, actual = replay.seek(bare, turn), replay.seek(tape, turn)
+        try:
+            assert state(actual) == state(expected), turn
+        finally:
+            expected.close()
+            actual.close()
@@ -0,0 +1,85 @@
+"""
+triggers.py — Déclencheurs d'événements de fin de tour.
+
+Après chaque commande, le jeu doit lancer certains événements scénarisés
+(embuscades, transitions de chapitre, monologues…). Plutôt que de tester
+toutes les conditions à chaque tour, chaque déclencheur est enregistré :
+
+- par salle : évalué uniquement quand le joueur s'y trouve,
+- par drapeau : évalué uniquement au tour où ce drapeau du joueur a changé.
+
+Le coût d'un tour ne dépend donc que de la salle courante et des drapeaux
+modifiés, pas du nombre total d'événements du jeu.
+
+Un déclencheur est une fonction handler(game, room) qui peut être un
+générateur de dialogue (voir dialogue.py). Elle retourne True pour
+terminer le tour (les déclencheurs suivants et l'aide ne sont pas affichés).
+"""
+
+
+class Trigger:
+    """
+    Un déclencheur enregistré.
+
+    Attributs :
+        order (int) : rang d'enregistrement, qui fixe l'ordre d'exécution.
+        handler (callable) : fonction handler(game, room).
+        rooms (tuple[str]) : salles qui l'activent.
+        flags (tuple[str]) : drapeaux du joueur qui l'activent.
+    """
+
+    __slots__ = ("order", "handler", "rooms", "flags")
+
+    def __init__(self, order, handler, rooms=(), flags=()):
+        """Initialise le déclencheur."""
+        self.order = order
+        self.handler = handler
+        self.rooms = rooms
+        self.flags = flags
+
+
+class TriggerRegistry:
+    """
+    Table des déclencheurs, indexée par nom de salle et par drapeau.
+
+    Les déclencheurs s'exécutent dans leur ordre d'enregistrement.
+    """
+
+    def __init__(self):
+        """Initialise une table vide."""
+        self._by_room = {}
+        self._by_flag = {}
+        self._count = 0
+
+    def _add(self, handler, rooms=(), flags=()):
+        """Enregistre un déclencheur dans les index concernés."""
+        trigger = Trigger(self._count, handler, rooms, flags)
+        self._count += 1
+        for name in rooms:
+            self._by_room.setdefault(name, []).append(trigger)
+        for flag in flags:
+            self._by_flag.setdefault(flag, []).append(trigger)
+        return handler
+
+    def on_room(self, *rooms):
+        """Décorateur : active le handler quand le joueur est dans l'une des salles."""
+        return lambda handler: self._add(handler, rooms=rooms)
+
+    def on_flag(self, *flags):
+        """Décorateur : active le handler au tour où l'un des drapeaux a changé."""
+        return lambda handler: self._add(handler, flags=flags)
+
+    def select(self, room_name, changed_flags=()):
+        """
+        Retourne les déclencheurs à évaluer, dans l'ordre d'enregistrement.
+
+        room_name : salle courante du joueur.
+        changed_flags : drapeaux modifiés depuis la dernière évaluation.
+        """
+        selected = list(self._by_room.get(room_name, ()))
+        for flag in changed_flags:
+            for trigger in self._by_flag.get(flag, ()):
+                if trigger not in selected:
+                    selected.append(trigger)
+        selected.sort(key=lambda t: t.order)
+        return selected
@@ -0,0 +1,711 @@
+"""
+world.py — Modèles partagés des chapitres du jeu.
+
+Chaque chapitre (rooms, PNJ, ennemis, objets et callbacks de dialogue)
+est construit au moment où une partie y entre, puis partagé en lecture
+seule par toutes les parties qui s'y trouvent. Dès qu'aucune partie ne
+l'utilise plus, le chapitre est libéré avec tout son graphe d'objets. L'état propre à une session (objets déplacés,
+PV des ennemis…) vit dans des RoomState créés à la demande par le Game
+(voir room.py) : une partie ne stocke que ce qui diffère du modèle.
+
+Les callbacks on_talk ne gardent aucun état : ils lisent et modifient
+uniquement le joueur et la partie qu'on leur passe en paramètre.
+"""
+
+import weakref
+
+from room import Room
+from item import Item
+from enemy import Enemy
+from character import Character
+from dialogue import ask
+
+
+class Chapter:
+    """
+    Modèle immuable d'un chapitre.
+
+    Attributs :
+        number (int) : numéro du chapitre (1, 2, 3).
+        rooms (dict[str, Room]) : salles du chapitre, indexées par nom.
+        start (Room) : salle d'arrivée du joueur.
+    """
+
+    def __init__(self, number, rooms, start):
+        """Enregistre les salles du chapitre et les fige."""
+        self.number = number
+        self.rooms = {r.name: r for r in rooms}
+        self.start = start
+        for r in rooms:
+            r.freeze()
+
+
+# Chapitres actuellement chargés : une référence faible suffit, ce sont
+# les parties (Game.chapter) qui les maintiennent en vie.
+_CHAPTERS = weakref.WeakValueDictionary()
+
+
+def get_chapter(number):
+    """
+    Retourne le modèle du chapitre demandé.
+
+    Il est construit au premier appel, puis réutilisé tant qu'au moins
+    une partie le référence.
+    """
+    chapter = _CHAPTERS.get(number)
+    if chapter is None:
+        chapter = _CHAPTERS[number] = _BUILDERS[number]()
+    return chapter
+
+
+# =========================================================
+#   WORLD BUILDING — Construction de l’univers narratif
+# =========================================================
+
+def _build_world_1():
+    """
+    Crée toutes les pièces (rooms), leurs descriptions, connexions,
+    objets, PNJ et ennemis.
+
+    C’est le “setup” narratif et spatial du Chapitre I :
+    - Eridani Prime
+    - Avant-poste minier
+    - Marché labyrinthique
+    - Cité-forteresse
+
+    Chaque room est connectée Est/Ouest en ligne droite.
+    """
+    # Rooms
+    eridani = Room(
+        "Eridani Prime",
+        "dans un district pauvre, des fumées noires s’élèvent au-dessus des toits. "
+        "Des affiches de propagande couvrent les murs. "
+        "Les habitants avancent avec un mélange de peur et de résignation."
+    )
+    avant_poste = Room(
+        "Avant-poste minier",
+        "au milieu d’échafaudages branlants, de gardes épuisés et de mineurs au regard vide. "
+        "L’air est lourd de poussière et d’électricité."
+    )
+    marche = Room(
+        "Marché labyrinthique",
+        "un dédale d’allées étroites, d’échoppes sombres et de murmures étouffés. "
+        "Les hommes de main de Vorn rôdent à chaque coin d’ombre."
+    )
+    forteresse = Room(
+        "Cité-forteresse",
+        "des tours massives, des projecteurs écarlates et des soldats patrouillant sans relâche. "
+        "C’est ici que le Capitaine Vorn impose son règne."
+    )
+
+    # Connexions spatiales en ligne Est/Ouest
+    eridani.connect(avant_poste, "E")
+    avant_poste.connect(marche, "E")
+    marche.connect(forteresse, "E")
+    
+
+    
+
+    # Objet initial (trousse de soin)
+    medkit = Item.from_config("Trousse Médicale")
+    #cristal de propulsion obtenu plus tard dans le jeu   
+    cristal = Item.from_config("Cristal de propulsion")
+    # ------------------------------
+    #  PNJ — dialogues et callbacks
+    # ------------------------------
+
+    # Ralen
+    ralen = Character(
+        "Ralen",
+        "Un citoyen au regard vif malgré les cendres sur son visage."
+    )
+    
+
+    def talk_ralen(player, game, self_char):
+        """Dialogue dynamique selon si le joueur l’a déjà rencontré."""
+        if not player.met_ralen:
+            player.met_ralen = True
+            player.log("Vous avez rencontré Ralen à Eridani Prime.")
+            return (
+                "Ralen : Vous n’avez pas l’air d’ici... "
+                "Si vous voulez comprendre ce qui se passe, suivez la route vers l’est. "
+                "Les mineurs de l’avant-poste vous diront le reste."
+            )
+        else:
+            return "Ralen : L’est vous attend toujours. Les mines, puis le marché... Et enfin Vorn."
+
+    ralen.on_talk = talk_ralen
+    eridani.add_character(ralen)
+
+    # Ingénieur Malek
+    malek = Character(
+        "Ingénieur Malek",
+        "Un technicien nerveux qui tente de réparer une foreuse brisée."
+    )
+           
+    def talk_malek(player, game, self_char):
+        """Dialogue variant selon les ressources du joueur."""
+        if player.resources >= 3:
+            return (
+                "Malek : Vous avez du matériel ? Parfait. "
+                "Je peux stabiliser les forages et calmer les gardes. "
+                "Au marché, on murmure qu’un marchand détient un Cristal de propulsion."
+            )
+        else:
+            return (
+                "Malek : Sans ressources, les gardes ne vous laisseront pas faire. "
+                "Vous devrez sans doute vous salir les mains... ou négocier au marché."
+            )
+
+    malek.on_talk = talk_malek
+    avant_poste.add_character(malek)
+
+    # Marchand — choix moral central
+    marchand = Character(
+        "Marchand",
+        "Un homme sec, aux yeux calculateurs, entouré de caisses verrouillées."
+    )
+
+    def talk_marchand(player, game, self_char):
+        """
+        Dialogue crucial : le marchand propose d'échanger
+        un membre d’équipage contre le Cristal de propulsion.
+        """
+        if player.merchant_deal_done:
+            if player.merchant_sacrifice:
+                return "Marchand : Les affaires sont les affaires. Profitez bien de votre cristal."
+            if player.merchant_refused:
+                return "Marchand : Vous avez refusé. Je ne traite plus avec vous."
+            # Version neutre conservée en commentaire
+
+        game.io.write(
+            "Marchand : J'ai un Cristal de propulsion.\n"
+            "Mais je ne l’échange pas contre de l’argent.\n\n"
+            "Je veux un membre de votre équipage.\n"
+            "Il travaillera pour moi. C’est le prix.\n\n"
+            "1️⃣ Accepter l’échange (cristal + ressources, moral ↓)\n"
+            "2️⃣ Refuser (rencontre avec Yara)\n"
+        )
+        choix = yield from ask()
+        if choix == "1":
+            player.merchant_deal_done = True
+            player.merchant_sacrifice = True
+            player.moral -= 3
+            player.resources += 2
+
+            # Donne le cristal si le joueur ne l’a pas déjà (cas théorique)
+            if not player.has_crystal:
+                player.add_item(cristal)
+                player.has_crystal = True
+
+            return (
+                "Le marchand sourit et fait emmener un membre de votre équipage.\n"
+                "Vous obtenez le Cristal… mais à quel prix ?"
+            )
+        else:
+            player.merchant_deal_done = True
+            player.merchant_refused = True
+            player.met_yara = True
+            player.moral += 1
+            return (
+                "Vous refusez net.\n"
+                "Dans une ruelle sombre, une femme encapuchonnée vous observe...\n"
+                "Yara : « Tu as refusé de vendre les tiens. On doit parler. »"
+            )
+
+    marchand.on_talk = talk_marchand
+    marche.add_character(marchand)
+
+    # Yara (rebelle)
+    yara = Character(
+        "Yara",
+        "Une femme encapuchonnée, regard déterminé, symbole rebelle au poignet."
+    )
+
+    def talk_yara(player, game, self_char):
+        """Dialogue change selon progression (rencontre + boss vaincu)."""
+        if not player.met_yara:
+            return "Une silhouette encapuchonnée passe fugacement, puis disparaît."
+        if not player.vorn_defeated:
+            return (
+                "Yara : Tu as gardé ton équipage. Bien.\n"
+                "Nous préparons un assaut sur la forteresse. "
+                "Abats Vorn, et nous t’aiderons à quitter cette planète."
+            )
+        else:
+            return (
+                "Yara : Vorn est tombé grâce à toi. "
+                "Quand ton vaisseau sera prêt, Eridani se souviendra de ton nom."
+            )
+
+    yara.on_talk = talk_yara
+    marche.add_character(yara)
+
+    # Ennemis
+    patrouilleur = Enemy("Patrouilleur de Vorn", hp=40, atk=7, defense=2)
+    avant_poste.add_enemy(patrouilleur)
+
+    # Boss final
+    vorn = Enemy(
+        "Capitaine Vorn",
+        hp=80,
+        atk=12,
+        defense=4,
+        is_boss=True,
+        loot=[cristal],
+    )
+    forteresse.add_enemy(vorn)
+
+    # Stockage des rooms
+    return Chapter(1, (eridani, avant_poste, marche, forteresse), start=eridani)
+
+
+def _build_world_2():
+    """
+    Construit les zones principales du CHAPITRE II : Velyra IX.
+    Version épurée : pas de velrya_stage, uniquement des flags explicites.
+    """
+    # --- ROOMS ---
+    base = Room(
+        "Base rebelle de Velyra",
+        "Un bunker dissimulé sous les ruines d’un ancien quartier industriel. "
+        "Des écrans grésillent, montrant les patrouilles de drones du Gouverneur Karn."
+    )
+    quartier = Room(
+        "Quartier civil",
+        "Des immeubles serrés, des néons blafards, des habitants qui marchent tête baissée "
+        "sous l’œil constant des caméras."
+    )
+    entrepots = Room(
+        "Entrepôts civils",
+        "De grands hangars où sont stockées les réserves d’énergie et de nourriture. "
+        "Des gardes mécaniques veillent sans relâche."
+    )
+    prison = Room(
+        "Prison centrale",
+        "Une forteresse de métal noir, hérissée de tourelles automatiques. "
+        "C’est ici que sont enfermés Narek et les chefs rebelles."
+    )
+    citadelle = Room(
+        "Citadelle de Karn",
+        "Un gratte-ciel blindé entouré de drones, cœur du pouvoir du Gouverneur Karn. "
+        "Les IA marchandes y supervisent chaque transaction, chaque mouvement."
+    )
+
+    # Connexions linéaires
+    base.connect(quartier, "E")
+    quartier.connect(entrepots, "E")
+    entrepots.connect(prison, "E")
+    prison.connect(citadelle, "E")
+    
+    
+
+    
+    # items obtentus dans le chapitre 2
+    nanomed = Item.from_config("Dose de Nanomédecine")
+    
+    # Descriptions alternatives
+    entrepots.add_variant(
+        "velyra_robbed_civilians",
+        "Les hangars portent encore les marques de votre raid : portes éventrées, "
+        "caisses brisées, drones calcinés. Les civils vous évitent du regard, le "
+        "silence oppressant rappelant le prix de vos ressources."
+    )
+    entrepots.add_variant(
+        "velyra_corrupted_general",
+        "Les entrepôts sont étrangement silencieux. Plusieurs caisses portent le sceau "
+        "du général Akros. Les drones de sécurité vous observent mais ne réagissent pas : "
+        "le protocole prioritaire que vous avez acheté les empêche d'intervenir."
+    )
+    prison.add_variant(
+        "velyra_missiles_obtained",
+        "Les murs sont calcinés par les frappes orbitales. Des pans entiers se sont effondrés, "
+        "laissant la structure instable. Les systèmes électroniques grésillent encore."
+    )
+    prison.add_variant(
+        "velyra_prison_liberated",
+        "La prison porte encore les cicatrices de votre assaut : murs éventrés, tourelles brisées, "
+        "cellules ouvertes à la hâte. L’air pue la fumée et la poussière."
+    )
+ 
+
+    
+    
+
+    # --- PNJ : YARA ---
+    yara = Character(
+        "Yara",
+        "Cheffe rebelle d’Eridani, désormais en mission sur Velyra IX. "
+        "Son visage porte déjà les cicatrices de la guerre."
+    )
+
+    def talk_yara_velyra(player, game, self_char):
+        """
+        Version propre du système narratif.
+        4 états narratifs :
+            - intro non faite
+            - prison non libérée
+            - prison libérée mais Karn vivant
+            - Karn mort
+        """
+
+        # ----------------------------
+        # ÉTAPE 0 : INTRO NON FAITE
+        # ----------------------------
+        if not player.velyra_intro_done:
+            player.velyra_intro_done = True
+
+            game.io.write(
+                "Yara : « Velyra IX est pire qu’Eridani. "
+                "Karn gouverne avec des IA marchandes et des drones. "
+                "Chaque jour, des prisonniers sont exécutés. Parmi eux, mon frère : Narek. »\n"
+            )
+            game.io.write("Elle te fixe :\n"
+                "On a deux options :\n"
+                "  1️⃣ Étudier la planète (DEF ++, Moral --)\n"
+                "  2️⃣ Attaquer immédiatement (ATK ++, pertes sévères)\n")
+
+            choix = yield from ask(("1", "2"))
+
+            if choix == "1":
+                player.defense += 2
+                player.moral -= 1
+                player.reputation += 2
+                player.velyra_study_first = True
+                return (
+                    "Vous observez les patrouilles, les schémas de drones, les routes d’approvisionnement.\n"
+                    "Chaque nuit, pourtant, Yara reçoit des rapports d’exécutions.\n"
+                    "➡️ DEF +2, Moral -1, Réputation +2."
+                )
+            else:
+                dmg = player.take_damage(15)
+                player.defense = max(0, player.defense - 1)
+                player.resources = max(0, player.resources - 1)
+                player.atk += 2
+                player.moral += 1
+                player.reputation += 2
+                player.velyra_attack_first = True
+                return (
+                    "Le Vigilant plonge dans l’atmosphère et subit un bombardement brutal.\n"
+                    f"➡️ PV -{dmg}, DEF -1, Ressources -1, ATK +2, Moral +1, Réputation +2."
+                )
+
+        # ----------------------------
+        # ÉTAPE 1 : PRISON NON LIBÉRÉE
+        # ----------------------------
+        if not player.velyra_prison_liberated:
+            game.io.write(
+                "Yara : « On a localisé la prison centrale. Narek est là-bas.\n"
+                "Mais il nous reste presque rien. »\n"
+            )
+            game.io.write(
+                "Deux options :\n"
+                "  1️⃣ Piller les entrepôts civils (Ressources ++, Moral ↓↓↓, Réputation ↓↓↓)\n"
+                "  2️⃣ Corrompre un général de Karn en échange d'item (risqué, missiles possibles)\n"
+            )
+
+            choix = yield from ask(("1", "2"))
+
+            # --- Option 1 : PILLER LES CIVILS ---
+            if choix == "1":
+                player.velyra_robbed_civilians = True
+                player.resources += 4
+                player.atk += 1
+                player.moral -= 3
+                player.reputation -= 4
+                player.velyra_prison_liberated = True
+                player.narek_alive = True
+
+                return (
+                    "Vous lancez un raid brutal sur les entrepôts civils.\n"
+                    "Les hangars débordent d’armes légères, de batteries d’énergie et de caisses de munitions.\n\n"
+                    "Les familles courent se mettre à l’abri sous les tirs, des enfants hurlent, "
+                    "et les gardes mécaniques tombent un à un.\n"
+                    "Dans la panique, vos rebelles arrachent tout ce qu’ils peuvent charger : "
+                    "explosifs, blindages portatifs, chargeurs plasma.\n\n"
+                    "Avec cet arsenal improvisé, vous frappez directement la prison centrale.\n"
+                    "Les murs éclatent sous les charges volées, les tourelles se taisent, "
+                    "et les cellules explosent les unes après les autres.\n\n"
+                    "Narek surgit dans les décombres, encore enchaîné, mais vivant.\n"
+                    "Vous l’avez libéré… au prix de la confiance de tout un peuple.\n\n"
+                    "➡️ Ressources +4  |  ATK +1  |  Moral -3  |  Réputation -4."
+                )
+
+            # --- Option 2 : CORRUPTION ---
+            player.velyra_corrupted_general = True
+
+            rare = player.find_item("Module d'énergie stabilisé") or player.find_item("Cristal de propulsion")
+            rare_name = rare.name if rare else None
+            if rare:
+                player.remove_item(rare)
+                chance_bonus = 0.15
+            else:
+                chance_bonus = 0.0
+                game.io.write(
+                    "Vous n'avez pas d'objet rare à offrir au général.\n"
+                    "La corruption sera plus difficile...\n"
+                )
+
+            base_chance = 0.4 + chance_bonus + max(0, player.reputation) * 0.03
+            base_chance = min(base_chance, 0.85)
+
+            if game.chance(base_chance):
+                # corruption réussie
+                player.velyra_missiles_obtained = True
+                player.resources += 2
+                player.atk += 1
+                player.defense += 1
+                player.moral += 1
+                player.reputation += 2
+                player.velyra_prison_liberated = True
+                player.narek_alive = True
+
+                texte = (
+                    "Le général accepte votre offre.\n"
+                    "Grâce aux missiles orbitaux, vous détruisez la prison et libérez Narek.\n"
+                    "➡️ ATK +1, DEF +1, Moral +1, Réputation +2."
+                )
+                if rare_name:
+                    texte = (
+                    f"Vous offrez {rare_name} au général en échange de son aide.\n"
+                    + texte
+                    )
+                return texte
+
+            else:
+                # corruption ratée
+                dmg = player.take_damage(10)
+                player.defense = max(0, player.defense - 1)
+                player.resources = max(0, player.resources - 1)
+                player.moral -= 1
+                player.reputation -= 1
+                player.velyra_missiles_obtained = True
+                player.velyra_prison_liberated = True
+                player.narek_alive = True
+
+                return (
+                    "La corruption échoue : embuscade.\n"
+                    f"➡️ PV -{dmg}, DEF -1, Ressources -1, Moral -1.\n"
+                    "Vous capturez malgré tout le terminal des missiles et libérez Narek."
+                )
+
+        # ----------------------------
+        # ÉTAPE 2 : PRISON LIBÉRÉE, KARN VIVANT
+        # ----------------------------
+        if not player.velyra_karn_defeated:
+            if player.velyra_missiles_obtained:
+                return (
+                    "Yara : « Avec les missiles, on va pulvériser la Citadelle de Karn. »\n"
+                    "➡️ Rendez-vous à la citadelle."
+                )
+            else:
+                return (
+                    "Yara : « On infiltrera la citadelle par les conduits de maintenance. »\n"
+                    "➡️ Rendez-vous à la citadelle."
+                )
+
+        # ----------------------------
+        # ÉTAPE 3 : KARN MORT
+        # ----------------------------
+        return (
+            "Yara : « Velyra est libre. Grâce à toi. »\n"
+            "Narek : « Et ce n’est que le début. »"
+        )
+
+    yara.on_talk = talk_yara_velyra
+    base.add_character(yara)
+
+    # --- PNJ : Nommera, survivante civile ---
+    nommera = Character(
+        "Nommera",
+        "Une jeune femme aux mains couvertes de poussière, le regard creux mais lucide."
+    )
+
+    def talk_nommera(player, game, self_char):
+
+        # Cas 1 : PILLAGE des civils (route très négative)
+        if player.velyra_robbed_civilians:
+
+            return (
+                "Nommera : C’était vous… Je vous ai vu défoncer les portes des hangars. \n"
+                "Son regard tremble :\n"
+                "Vous avez pris nos vivres… nos armes… et laissé des familles dans la poussière. "
+                "Vous avez sauvé quelqu’un là-bas, je suppose. Mais ici, on pleure encore.\n"
+                "Elle détourne les yeux :\n"
+                "On ne vous dénoncera pas. On n’a plus personne à qui parler, de toute façon."
+            )
+
+        # Cas 2 : CORRUPTION — deal secret avec Akros
+        if player.velyra_corrupted_general:
+
+            return (
+                "Nommera : Les drones… ils ne nous surveillent plus. \n"
+                "Elle te fixe longuement, hésitant entre gratitude et malaise.\n"
+                "Vous avez gagné quelque chose… mais vous avez dû payer quelqu’un pour ça. "
+                "Le général Akros ne fait rien gratuitement. \n"
+                "Elle croise les bras :\n"
+                "Je ne sais pas ce que vous lui avez donné… mais ça retombe toujours sur quelqu’un. Toujours."
+            )
+
+        # Cas théorique : aucun choix encore (ne devrait jamais arriver)
+        return (
+            "Nommera : Les entrepôts sont dangereux… faites attention."
+        )
+  
+    nommera.on_talk = talk_nommera
+    entrepots.add_character(nommera)
+    
+    # --- PNJ : NAREK, frère de Yara ---
+    narek = Character(
+        "Narek",
+        "Un jeune rebelle amaigri mais déterminé, encore marqué par son emprisonnement."
+    )
+    def talk_narek(player, game, self_char):
+        """ Dialogue variant selon la route choisie pour le libérer."""
+        
+        # Route 1 : PILLAGE
+        if player.velyra_robbed_civilians:
+            return (
+                "Narek : Je t’en dois une… mais je sais ce que tu as fait.\n"
+                "Il détourne le regard.\n"
+                "Des familles ont souffert pour me sortir d’ici. Je vis grâce à elles."
+            )
+
+        # Route 2 : MISSILES
+        if player.velyra_missiles_obtained:
+            return (
+                "Narek : Tu as frappé juste. Les missiles… je ne les oublierai jamais.\n"
+                "On a perdu quelques camarades dans l’explosion, mais tu m'as sauvé."
+            )
+
+        # Route neutre (ne devrait pas arriver)
+        return "Narek : « Merci de m'avoir sorti de là. »"
+    narek.on_talk = talk_narek
+    prison.add_character(narek)
+
+    # Ennemis
+
+
+    prison.add_enemy(Enemy("Drone Sentinel", hp=70, atk=10, defense=6,is_boss=False, loot=[nanomed])) 
+    citadelle.add_enemy(Enemy("Gouverneur Karn", hp=160, atk=16, defense=10, is_boss=True))
+
+    return Chapter(2, (base, quartier, entrepots, prison, citadelle), start=base)
+
+
+def _build_world_3():
+    """
+    Construit le CHAPITRE III — Aurelion Prime.
+    Version validée : infiltration OU révélation → passage par Le Nœud
+    avec choix illusions/briser → combat final ou fin sombre.
+    """
+
+    # =============== ROOMS ===============
+    district = Room(
+        "District d’Or",
+        "Un quartier luxueux où tout semble parfait : rues propres, jardins calibrés, "
+        "habitants souriants… mais dont les yeux semblent vides."
+    )
+    
+    holo = Room(
+        "Quartier des Hologrammes",
+        "Des illusions mouvantes envahissent les rues : visages qui se dédoublent, "
+        "publicités vivantes, faux souvenirs, et ombres qui n'appartiennent à personne."
+    )
+
+    node = Room(
+        "Le Nœud",
+        "Un complexe gigantesque regroupant les serveurs neuronaux d’Aurelion Prime. "
+        "Il régule émotions, souvenirs et réactions de toute la population."
+    )
+
+    palace = Room(
+        "Palais de Lumière",
+        "Un ensemble de jardins flottants, ponts de cristal et escaliers étincelants. "
+        "Les serviteurs semblent humains… mais agissent comme des programmes."
+    )
+
+    throne = Room(
+        "Salle du Trône",
+        "Une vaste pièce circulaire baignée d’or, où Seren Taal attend, immobile, "
+        "dans un halo d’illusions."
+    )
+
+    # =============== CONNECTIONS ===============
+    district.connect(holo, "E")
+    holo.connect(node, "E")
+    node.connect(palace, "E")
+    palace.connect(throne, "E")
+
+
+    # =============== ALT DESCRIPTIONS ===============
+    district.add_variant(
+        "ap_choice_infiltrate",
+        "Vous passez pour des habitants d’élite. Les regards sont admiratifs… mais vides."
+    )
+    district.add_variant(
+        "ap_choice_reveal",
+        "Des drones vous surveillent. Les habitants gardent leurs distances, méfiants."
+    )
+
+    node.add_variant(
+        "ap_break_illusions",
+        "Les illusions se fissurent. Les habitants errent, effondrés, découvrant "
+        "les horreurs qu’ils ignoraient. Cris, larmes, terreur."
+    )
+    node.add_variant(
+        "ap_keep_illusions",
+        "Les illusions brillent comme jamais : bonheur forcé, sourires figés, "
+        "éclats de rire synthétiques."
+    )
+
+    # =============== PNJ ===============
+    citizen = Character(
+        "Citoyen doré",
+        "Un habitant riche dont les émotions sont filtrées par les serveurs du Nœud."
+    )
+
+    def talk_citizen(player, game, self_char):
+        if player.ap_choice_infiltrate:
+            return "Citoyen doré : « Vous êtes splendides. Vous avez le rang pour être ici. »"
+        if player.ap_choice_reveal:
+            return "Citoyen doré : « Vous êtes un intrus dangereux. Ne touchez à rien. »"
+        return "Citoyen doré : « Aurelion est parfait. Les autres mondes souffrent ? Ils sont faibles. »"
+
+    citizen.on_talk = talk_citizen
+    district.add_character(citizen)
+
+    glitch = Character(
+        "Habitant glitché",
+        "Son corps scintille comme un hologramme mal calibré. Sa voix tremble, en écho."
+    )
+
+    def talk_glitch(player, game, self_char):
+        if not player.aurelion_surprise_done:
+            return "…v…v…vvous… n’êtes pas… attendus…"
+        return "Les murs… regardent… attention à… Seren… Taa— *signal perdu*."
+
+    glitch.on_talk = talk_glitch
+    holo.add_character(glitch)
+
+
+    # =============== ENNEMIS ===============
+    palace.add_enemy(Enemy("Gardien Blanc", hp=90, atk=22, defense=8))
+    taal = Enemy(
+        "Seren Taal",
+        hp=240,
+        atk=30,
+        defense=12,
+        is_boss=True,
+        loot=[]
+    )
+    throne.add_enemy(taal)
+
+    # =============== STOCKAGE ===============
+    return Chapter(3, (district, holo, node, palace, throne), start=district)
+
+
+_BUILDERS = {
+    1: _build_world_1,
+    2: _build_world_2,
+    3: _build_world_3,
+}